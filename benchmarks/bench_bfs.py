@@ -0,0 +1,57 @@
+"""
+Compare the vectorized frontier BFS behind shortest_distance with the previous
+list-queue BFS on a random graph.
+
+    python benchmarks/bench_bfs.py --vertices 200000 --edges 1000000
+"""
+
+import argparse
+import random
+
+from pygraphnet import Graph, CompactGraph, shortest_distance
+from timing import timed
+
+def list_queue_bfs(g, source):
+    # the unweighted branch of shortest_distance before the frontier engine
+    distances = {v: float('inf') for v in g.vertices}
+    predecessors = {v: None for v in g.vertices}
+    distances[source] = 0
+    visited = {source}
+    queue = [source]
+    while queue:
+        current_vertex = queue.pop(0)
+        for neighbor in g.adj_list[current_vertex]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+                distances[neighbor] = distances[current_vertex] + 1
+                predecessors[neighbor] = current_vertex
+    return distances, predecessors
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=200_000)
+    parser.add_argument('--edges', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="don't run the quadratic list-queue BFS")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    edges = [(rng.randrange(args.vertices), rng.randrange(args.vertices)) for _ in range(args.edges)]
+    g = Graph(edges)
+    compact = CompactGraph(g)
+
+    frontier, t_graph = timed(shortest_distance, g, 0, pred_map=True)
+    _, t_compact = timed(shortest_distance, compact, 0, pred_map=True)
+    print(f"frontier BFS (Graph input):        {t_graph:8.3f}s")
+    print(f"frontier BFS (CompactGraph input): {t_compact:8.3f}s")
+
+    if not args.skip_legacy:
+        legacy, t_legacy = timed(list_queue_bfs, g, 0)
+        assert legacy == frontier
+        print(f"list-queue BFS:                    {t_legacy:8.3f}s")
+        print(f"speedup: {t_legacy / t_graph:.1f}x (Graph), {t_legacy / t_compact:.1f}x (CompactGraph)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Time complement traversal and construction: a BFS over the lazy complement view of a large
+sparse graph, and the materialized complement of a smaller one.
+
+    python benchmarks/bench_complement.py --vertices 100000 --edges 500000 --build-vertices 3000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pygraphnet import Graph, complement, shortest_distance
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=500_000)
+    parser.add_argument('--build-vertices', type=int, default=2_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    g = Graph.from_edges(rng.integers(0, args.vertices, size=(args.edges, 2)))
+    view = complement(g, lazy=True)
+    start = time.perf_counter()
+    distances = shortest_distance(view, 0)
+    print(f"complement BFS, {args.vertices} vertices: {time.perf_counter() - start:.3f}s "
+          f"(eccentricity {max(distances.values())})")
+
+    n = args.build_vertices
+    small = Graph.from_edges(rng.integers(0, n, size=(5 * n, 2)))
+    start = time.perf_counter()
+    result = complement(small)
+    print(f"materialized complement, {n} vertices: {time.perf_counter() - start:.3f}s "
+          f"({len(result.edges)} edges)")
+
+if __name__ == '__main__':
+    main()
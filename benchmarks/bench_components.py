@@ -0,0 +1,64 @@
+"""
+Time connected_components and strongly_connected_components on a sparse random graph,
+against labeling components with one BFS per component, and time diameter on a
+disconnected graph.
+
+    python benchmarks/bench_components.py --vertices 200000 --edges 300000
+"""
+
+import argparse
+
+import numpy as np
+
+from pygraphnet import (Graph, CompactGraph, connected_components, strongly_connected_components,
+                        diameter, component_graph)
+from timing import timed
+
+def bfs_components(g):
+    # one BFS per unlabeled vertex over the adjacency sets
+    label = {}
+    count = 0
+    for root in g.vertices:
+        if root in label:
+            continue
+        label[root] = count
+        queue = [root]
+        for v in queue:
+            for u in g.adj_list[v]:
+                if u not in label:
+                    label[u] = count
+                    queue.append(u)
+        count += 1
+    return count, label
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=200_000)
+    parser.add_argument('--edges', type=int, default=300_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = rng.integers(0, args.vertices, size=(args.edges, 2))
+    g = Graph.from_edges(edges)
+    compact = CompactGraph(g)
+
+    (count, _), t_bfs = timed(bfs_components, g)
+    print(f"BFS labeling:                  {t_bfs:8.3f}s  ({count} components)")
+    (count, _), t_union = timed(connected_components, compact)
+    print(f"connected_components:          {t_union:8.3f}s  ({count} components)")
+    directed = CompactGraph(Graph.from_edges(edges, directed=True))
+    (count, _), t_tarjan = timed(strongly_connected_components, directed)
+    print(f"strongly_connected_components: {t_tarjan:8.3f}s  ({count} components)")
+
+    # two copies of a small graph: the all-pairs scan stops at the first unreachable pair
+    small = rng.integers(0, 2000, size=(8000, 2))
+    disconnected = CompactGraph(Graph.from_edges(np.concatenate((small, small + 2000))))
+    _, t_diameter = timed(diameter, disconnected)
+    giant = component_graph(disconnected, int(small[0, 0]))
+    (value, _), t_component = timed(diameter, giant)
+    print(f"diameter of a disconnected graph:   {t_diameter:8.3f}s")
+    print(f"diameter of its first component:    {t_component:8.3f}s  (= {value})")
+
+if __name__ == '__main__':
+    main()
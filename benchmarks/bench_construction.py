@@ -0,0 +1,47 @@
+"""
+Compare bulk graph construction (Graph.from_edges) with adding edges one add_edge call at
+a time, for NumPy arrays and Python lists of integer and string labels.
+
+    python benchmarks/bench_construction.py --vertices 500000 --edges 5000000
+"""
+
+import argparse
+
+import numpy as np
+
+from pygraphnet import Graph
+from timing import timed
+
+def add_edge_loop(edges, directed):
+    # the construction path before the bulk loader
+    g = Graph(directed=directed)
+    for v, u in edges:
+        g.add_vertex(v)
+        g.add_vertex(u)
+        g.add_edge(v, u)
+    return g
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--directed', action='store_true')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    array = rng.integers(0, args.vertices, size=(args.edges, 2))
+    int_pairs = [tuple(pair) for pair in array.tolist()]
+    str_pairs = [(str(v), str(u)) for v, u in int_pairs]
+
+    for name, edges, legacy_edges in (('numpy array', array, int_pairs),
+                                      ('int list', int_pairs, int_pairs),
+                                      ('str list', str_pairs, str_pairs)):
+        bulk, t_bulk = timed(Graph.from_edges, edges, directed=args.directed)
+        legacy, t_legacy = timed(add_edge_loop, legacy_edges, args.directed)
+        assert bulk.adj_list == legacy.adj_list and bulk.edges == legacy.edges
+        print(f"{name:12s} bulk {t_bulk:8.3f}s   add_edge loop {t_legacy:8.3f}s   "
+              f"speedup {t_legacy / t_bulk:5.1f}x")
+
+if __name__ == '__main__':
+    main()
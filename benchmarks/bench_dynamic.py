@@ -0,0 +1,50 @@
+"""
+Compare keeping single-source distances up to date with DynamicDistances against calling
+shortest_distance again after every batch of random edge insertions and deletions.
+
+    python benchmarks/bench_dynamic.py --vertices 100000 --edges 500000 --batches 5 --batch-size 300
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from pygraphnet import Graph, DynamicDistances, shortest_distance
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=500_000)
+    parser.add_argument('--batches', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--directed', action='store_true')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    edges = np.random.default_rng(args.seed).integers(0, args.vertices, size=(args.edges, 2))
+    g = Graph.from_edges(edges, directed=args.directed)
+    dynamic = DynamicDistances(g, 0)
+
+    t_dynamic = t_recompute = 0.0
+    for _ in range(args.batches):
+        existing = rng.sample(sorted(g.edges), args.batch_size // 2)
+        start = time.perf_counter()
+        for v, u in existing:
+            g.del_edge(v, u)
+        for _ in range(args.batch_size - len(existing)):
+            g.add_edge(rng.randrange(args.vertices), rng.randrange(args.vertices))
+        t_dynamic += time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = shortest_distance(g, 0)
+        t_recompute += time.perf_counter() - start
+        assert dynamic.distances == expected
+
+    print(f"{args.batches} batches of {args.batch_size} mutations: incremental {t_dynamic:.3f}s "
+          f"(mutations included), recompute {t_recompute:.3f}s")
+
+if __name__ == '__main__':
+    main()
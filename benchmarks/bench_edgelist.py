@@ -0,0 +1,56 @@
+"""
+Compare read_edge_list with reading a whole edge-list file into a list of pairs first,
+timing both and measuring their peak memory with tracemalloc in separate runs.
+
+    python benchmarks/bench_edgelist.py --vertices 100000 --edges 1000000 --gzip
+"""
+
+import argparse
+import gzip
+import os
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+from pygraphnet import Graph, read_edge_list
+from timing import timed
+
+def read_into_list(path):
+    # what loaders did before read_edge_list
+    with gzip.open(path, 'rt') if path.endswith('.gz') else open(path) as f:
+        edges = [tuple(map(int, line.split())) for line in f]
+    return Graph(edges)
+
+def peak_memory(func, *args, **kwargs):
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--gzip', action='store_true')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = rng.integers(0, args.vertices, size=(args.edges, 2))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'edges.txt.gz' if args.gzip else 'edges.txt')
+        np.savetxt(path, edges, fmt='%d')
+
+        for name, func, kwargs in (('list of pairs + Graph', read_into_list, {}),
+                                   ('read_edge_list', read_edge_list, {'chunk_size': args.chunk_size})):
+            g, seconds = timed(func, path, **kwargs)
+            peak = peak_memory(func, path, **kwargs)
+            print(f"{name:22} {seconds:8.3f}s   peak {peak / 2**20:8.1f} MiB   "
+                  f"({len(g.vertices)} vertices, {len(g.edges)} edges)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Time searches on a product graph with nested tuple labels against the same searches on its
+integer relabeling, including the one-off cost of relabeling and of decoding the results.
+
+    python benchmarks/bench_interning.py --side 150 --queries 5
+"""
+
+import argparse
+import time
+
+from pygraphnet import Graph, shortest_distance, cross_product
+from timing import timed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--side', type=int, default=150)
+    parser.add_argument('--queries', type=int, default=5)
+    args = parser.parse_args()
+
+    path = Graph([(i, i + 1) for i in range(args.side - 1)])
+    g = cross_product(cross_product(path, path), Graph([(0, 1), (1, 2)]))
+    sources = list(g.vertices)[:args.queries]
+    print(f"{len(g.vertices)} vertices labeled like {sources[0]!r}, {len(g.edges)} edges")
+
+    (h, index), t_relabel = timed(g.relabel_to_integers)
+    print(f"relabel_to_integers:          {t_relabel:8.3f}s")
+    t_tuple = t_int = 0
+    for source in sources:
+        expected, seconds = timed(shortest_distance, g, source)
+        t_tuple += seconds
+        start = time.perf_counter()
+        result = index.decode_dict(shortest_distance(h, index[source]))
+        t_int += time.perf_counter() - start
+        assert result == expected
+    print(f"{args.queries} searches on tuple labels:  {t_tuple:8.3f}s")
+    print(f"{args.queries} searches on integer ids:   {t_int:8.3f}s  (decoded back to labels)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Time random point-to-point queries on a road-like weighted grid: shortest_distance and
+shortest_path against a LandmarkOracle, including the one-off cost of building, saving and
+reopening the oracle.
+
+    python benchmarks/bench_landmarks.py --side 300 --landmarks 16 --queries 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from pygraphnet import CompactGraph, LandmarkOracle, shortest_distance, shortest_path
+from generators import road_like
+from timing import timed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--side', type=int, default=300)
+    parser.add_argument('--landmarks', type=int, default=16)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    road = road_like(args.side, seed=args.seed)
+    g = CompactGraph(road)
+    vertices = list(g.vertices)
+    rng = np.random.default_rng(args.seed)
+    pairs = [(vertices[s], vertices[t]) for s, t in rng.integers(0, len(vertices), size=(args.queries, 2))]
+    print(f"{len(vertices)} vertices, {len(g.edges)} edges, {args.queries} random queries")
+
+    oracle, t_build = timed(LandmarkOracle, g, args.landmarks, seed=args.seed)
+    path = os.path.join(tempfile.mkdtemp(), 'oracle.pgn')
+    _, t_save = timed(oracle.save, path)
+    oracle, t_load = timed(LandmarkOracle.load, path)
+    print(f"build {args.landmarks} landmarks: {t_build:7.3f}s  save: {t_save:6.3f}s  load: {t_load:6.3f}s  "
+          f"({oracle.nbytes / 2 ** 20:.1f} MiB table)")
+
+    cases = (('shortest_distance', lambda s, t: shortest_distance(g, s, t)),
+             ('oracle.distance', oracle.distance),
+             ('shortest_path', lambda s, t: shortest_path(g, s, t)),
+             ('shortest_path(bidirectional)', lambda s, t: shortest_path(g, s, t, bidirectional=True)),
+             ('oracle.path', oracle.path),
+             ('oracle.bounds', oracle.bounds))
+    results = {}
+    for name, func in cases:
+        start = time.perf_counter()
+        results[name] = [func(s, t) for s, t in pairs]
+        per_query = (time.perf_counter() - start) / len(pairs)
+        print(f"{name:30} {per_query * 1e3:9.3f} ms/query")
+
+    assert results['oracle.distance'] == results['shortest_distance']
+    lengths = [sum(road.adj_weights[v][u] for v, u in edges) for _, edges in results['oracle.path']]
+    assert lengths == [d if d != float('inf') else 0 for d in results['shortest_distance']]
+    gaps = [upper / d - 1 for (_, upper), d in zip(results['oracle.bounds'], results['shortest_distance'])
+            if 0 < d < float('inf')]
+    print(f"upper bound over the distance: {np.median(gaps):.1%} median, {np.max(gaps):.1%} worst")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Time Cartesian products: building a grid with cross_product, and the diameter and a BFS on
+a lazy torus view that is never stored.
+
+    python benchmarks/bench_product.py --side 300 --torus-side 1000
+"""
+
+import argparse
+
+from pygraphnet import Graph, cross_product, diameter, shortest_distance
+from timing import timed
+
+def path_graph(n):
+    return Graph.from_edges([(i, i + 1) for i in range(n - 1)])
+
+def cycle_graph(n):
+    return Graph.from_edges([(i, (i + 1) % n) for i in range(n)])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--side', type=int, default=300)
+    parser.add_argument('--torus-side', type=int, default=500)
+    args = parser.parse_args()
+
+    grid, elapsed = timed(cross_product, path_graph(args.side), path_graph(args.side))
+    print(f"cross_product {args.side}x{args.side} grid: {elapsed:.3f}s ({len(grid.edges)} edges)")
+
+    n = args.torus_side
+    torus = cross_product(cycle_graph(n), cycle_graph(n), lazy=True)
+    (max_distance, _), elapsed = timed(diameter, torus)
+    print(f"diameter of lazy {n}x{n} torus: {elapsed:.3f}s (diameter {max_distance})")
+    (max_distance, _), elapsed = timed(diameter, torus, method='ifub')
+    print(f"iFUB diameter of lazy {n}x{n} torus: {elapsed:.3f}s (diameter {max_distance})")
+    distances, elapsed = timed(shortest_distance, torus, (0, 0))
+    print(f"single-source BFS on lazy {n}x{n} torus: {elapsed:.3f}s ({len(distances)} vertices)")
+
+if __name__ == '__main__':
+    main()
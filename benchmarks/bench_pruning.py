@@ -0,0 +1,35 @@
+"""
+Time pruning the low-degree vertices of a random graph with Graph.del_vertex.
+
+    python benchmarks/bench_pruning.py --vertices 100000 --edges 500000 --prune 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pygraphnet import Graph
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=50_000)
+    parser.add_argument('--edges', type=int, default=250_000)
+    parser.add_argument('--prune', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--directed', action='store_true')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    g = Graph.from_edges(rng.integers(0, args.vertices, size=(args.edges, 2)), directed=args.directed)
+    victims = sorted(g.vertices, key=lambda v: len(g.adj_list[v]))[:args.prune]
+
+    start = time.perf_counter()
+    for v in victims:
+        g.del_vertex(v)
+    elapsed = time.perf_counter() - start
+    print(f"deleted {len(victims)} vertices in {elapsed:.3f}s "
+          f"({len(g.vertices)} vertices, {len(g.edges)} edges left)")
+
+if __name__ == '__main__':
+    main()
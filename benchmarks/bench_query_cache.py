@@ -0,0 +1,43 @@
+"""
+Time repeated dashboard-style queries against an unchanged graph with and without a
+QueryCache attached.
+
+    python benchmarks/bench_query_cache.py --vertices 100000 --edges 500000 --repeats 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pygraphnet import Graph, QueryCache, shortest_distance, shortest_path
+
+def run_queries(g, sources, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for source in sources:
+            shortest_distance(g, source)
+            shortest_path(g, source, sources[0])
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=500_000)
+    parser.add_argument('--sources', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    g = Graph.from_edges(np.random.default_rng(args.seed).integers(0, args.vertices, size=(args.edges, 2)))
+    sources = sorted(g.vertices)[:args.sources]
+
+    uncached = run_queries(g, sources, args.repeats)
+    cache = QueryCache(maxsize=4 * args.sources)
+    cache.attach(g)
+    cached = run_queries(g, sources, args.repeats)
+    print(f"{args.repeats} rounds of {2 * args.sources} queries: uncached {uncached:.3f}s, "
+          f"cached {cached:.3f}s, {cache.stats()}")
+
+if __name__ == '__main__':
+    main()
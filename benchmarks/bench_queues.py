@@ -0,0 +1,43 @@
+"""
+Compare the priority queues of weighted shortest_distance: the lazy binary heap, Dial's
+bucket queue and delta-stepping, on a road-like grid and a random graph with integer
+weights in 1..100.
+
+    python benchmarks/bench_queues.py --side 300 --vertices 100000 --edges 500000
+"""
+
+import argparse
+
+import numpy as np
+
+import generators
+from pygraphnet import Graph, CompactGraph, shortest_distance
+from timing import timed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--side', type=int, default=300)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--edges', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = rng.integers(0, args.vertices, size=(args.edges, 2))
+    random_graph = Graph.from_edges(edges)
+    random_graph.set_weights(dict(zip(map(tuple, edges.tolist()), rng.integers(1, 101, size=args.edges).tolist())))
+
+    for name, g in (('road-like grid', generators.road_like(args.side, seed=args.seed)),
+                    ('random graph', random_graph)):
+        print(f"{name}: {len(g.vertices)} vertices, {len(g.edges)} edges")
+        for graph in (g, CompactGraph(g)):
+            expected, t_heap = timed(shortest_distance, graph, 0, queue='heap')
+            line = f"  {type(graph).__name__:13} heap {t_heap:7.3f}s"
+            for queue in ('dial', 'delta', 'auto'):
+                result, seconds = timed(shortest_distance, graph, 0, queue=queue)
+                assert result == expected
+                line += f"   {queue} {seconds:7.3f}s ({t_heap / seconds:4.1f}x)"
+            print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Estimate the average path length, mean eccentricity and closeness of the largest component of
+a power-law graph from a sample of sources, against the exact values from searching every vertex, with and without
+degree stratification.
+
+    python benchmarks/bench_sampling.py --vertices 6000 --samples 200 --strata 8
+"""
+
+import argparse
+
+import numpy as np
+
+from pygraphnet import component_graph, average_path_length, eccentricity_distribution, closeness
+from generators import power_law
+from timing import timed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=6_000)
+    parser.add_argument('--degree', type=float, default=4)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--strata', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # vertex 0 has the highest expected degree, so it lies in the giant component
+    g = component_graph(power_law(args.vertices, args.degree, seed=args.seed), 0)
+    print(f"{len(g.vertices)} vertices, {len(g.edges)} edges")
+
+    exact, t_exact = timed(lambda: (average_path_length(g, samples=None),
+                                    eccentricity_distribution(g, samples=None)[0],
+                                    closeness(g, samples=None)))
+    print(f"exact (all {len(g.vertices)} sources): {t_exact:8.3f}s  average path length {exact[0].value:.4f}, "
+          f"mean eccentricity {exact[1].value:.4f}")
+    truth = np.array([e.value for e in exact[2].values()])
+
+    for strata in (1, args.strata):
+        kwargs = dict(samples=args.samples, strata=strata, seed=args.seed)
+        (average, mean, centrality), seconds = timed(lambda: (average_path_length(g, **kwargs),
+                                                              eccentricity_distribution(g, **kwargs)[0],
+                                                              closeness(g, **kwargs)))
+        estimates = np.array([e.value for e in centrality.values()])
+        covered = np.mean([e.low <= t <= e.high for e, t in zip(centrality.values(), truth)])
+        print(f"{args.samples} sources, {strata} strata: {seconds:8.3f}s  "
+              f"average path length {average.value:.4f} [{average.low:.4f}, {average.high:.4f}], "
+              f"mean eccentricity {mean.value:.4f} [{mean.low:.4f}, {mean.high:.4f}], "
+              f"closeness relative error {np.median(np.abs(estimates / truth - 1)):.2%} (median), "
+              f"coverage {covered:.1%}")
+
+if __name__ == '__main__':
+    main()
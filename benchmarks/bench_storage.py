@@ -0,0 +1,49 @@
+"""
+Compare opening a graph saved with save_graph against re-parsing a text edge list and
+rebuilding it, then time the first BFS on each.
+
+    python benchmarks/bench_storage.py --vertices 200000 --edges 2000000
+"""
+
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from pygraphnet import Graph, CompactGraph, save_graph, load_graph, shortest_distance
+from timing import timed
+
+def parse_edge_list(path):
+    with open(path) as f:
+        edges = [tuple(map(int, line.split())) for line in f]
+    return CompactGraph(Graph.from_edges(edges))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=200_000)
+    parser.add_argument('--edges', type=int, default=2_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = rng.integers(0, args.vertices, size=(args.edges, 2))
+    g = CompactGraph(Graph.from_edges(edges))
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, 'edges.txt')
+        binary_path = os.path.join(directory, 'graph.pgn')
+        np.savetxt(text_path, edges, fmt='%d')
+        _, t_save = timed(save_graph, g, binary_path)
+        print(f"binary file: {os.path.getsize(binary_path) / 2**20:.1f} MiB, "
+              f"text file: {os.path.getsize(text_path) / 2**20:.1f} MiB, saved in {t_save:.3f}s")
+
+        for name, load in (('text edge list', lambda: parse_edge_list(text_path)),
+                           ('load_graph, in memory', lambda: load_graph(binary_path, mmap=False)),
+                           ('load_graph, memory-mapped', lambda: load_graph(binary_path))):
+            loaded, t_load = timed(load)
+            _, t_bfs = timed(shortest_distance, loaded, int(edges[0, 0]))
+            print(f"{name:26} open {t_load:8.3f}s   first BFS {t_bfs:8.3f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Merge hourly shards into one graph: one add_edge per edge against union_all, fed from a
+list of Graph shards, from CompactGraph shards and from a generator that builds each shard
+only when it is folded in (its time includes building the shards).
+
+    python benchmarks/bench_union.py --shards 24 --vertices 200000 --edges 100000
+"""
+
+import argparse
+
+import numpy as np
+
+from pygraphnet import Graph, CompactGraph, union_all
+from timing import timed
+
+def add_edge_loop(shards):
+    result = Graph()
+    for g in shards:
+        for v in g.vertices:
+            result.add_vertex(v)
+        for v, u in g.edges:
+            result.add_edge(v, u)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--shards', type=int, default=24)
+    parser.add_argument('--vertices', type=int, default=200_000)
+    parser.add_argument('--edges', type=int, default=100_000, help="edges per shard")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    def shard(k):
+        rng = np.random.default_rng(args.seed + k)
+        return Graph.from_edges(rng.integers(0, args.vertices, size=(args.edges, 2)))
+
+    shards = [shard(k) for k in range(args.shards)]
+    compact = [CompactGraph(g) for g in shards]
+    print(f"{args.shards} shards of {args.edges} edges over {args.vertices} vertices")
+    for name, func, source in (('add_edge loop', add_edge_loop, lambda: shards),
+                               ('union_all(Graph shards)', union_all, lambda: shards),
+                               ('union_all(CompactGraph)', union_all, lambda: compact),
+                               ('union_all(generator)', union_all,
+                                lambda: (shard(k) for k in range(args.shards)))):
+        result, seconds = timed(func, source())
+        print(f"{name:26} {seconds:8.3f}s  ({len(result.edges)} edges)")
+        # keep the previous result from slowing the next case's garbage collections
+        del result
+
+    # the floor: one bulk load of every edge into a single Graph
+    edges = np.concatenate([np.random.default_rng(args.seed + k).integers(0, args.vertices, size=(args.edges, 2))
+                            for k in range(args.shards)])
+    _, seconds = timed(Graph.from_edges, edges)
+    print(f"{'Graph.from_edges(all)':26} {seconds:8.3f}s")
+
+if __name__ == '__main__':
+    main()
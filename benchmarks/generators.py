@@ -0,0 +1,66 @@
+"""
+Seeded synthetic graph generators for the benchmark suite. Every generator is deterministic
+for a given seed and builds its edges with NumPy, so the graphs are cheap to regenerate at
+any scale without network access or data files.
+"""
+
+import numpy as np
+
+from pygraphnet import Graph
+
+def erdos_renyi_edges(num_vertices, avg_degree, seed=0):
+    """G(n, m) edge array with m = n * avg_degree / 2 uniformly random pairs, self-loops dropped"""
+    rng = np.random.default_rng(seed)
+    num_edges = int(num_vertices * avg_degree / 2)
+    edges = rng.integers(0, num_vertices, size=(num_edges, 2))
+    return edges[edges[:, 0] != edges[:, 1]]
+
+def erdos_renyi(num_vertices, avg_degree, seed=0, directed=False):
+    return Graph.from_edges(erdos_renyi_edges(num_vertices, avg_degree, seed), directed=directed)
+
+def grid_edges(side, periodic=False):
+    """Edges of a side x side grid with vertex r * side + c, or a torus if periodic"""
+    ids = np.arange(side * side, dtype=np.int64).reshape(side, side)
+    if periodic:
+        right, down = np.roll(ids, -1, axis=1), np.roll(ids, -1, axis=0)
+        return np.concatenate((np.stack((ids.ravel(), right.ravel()), axis=1),
+                               np.stack((ids.ravel(), down.ravel()), axis=1)))
+    return np.concatenate((np.stack((ids[:, :-1].ravel(), ids[:, 1:].ravel()), axis=1),
+                           np.stack((ids[:-1].ravel(), ids[1:].ravel()), axis=1)))
+
+def grid(side, periodic=False):
+    return Graph.from_edges(grid_edges(side, periodic))
+
+def power_law(num_vertices, avg_degree, exponent=2.5, seed=0):
+    """
+    Chung-Lu graph whose expected degrees follow a power law with the given exponent: both
+    ends of every edge are drawn with probability proportional to the expected degree.
+    """
+
+    rng = np.random.default_rng(seed)
+    expected = (np.arange(num_vertices) + 1.0) ** (-1.0 / (exponent - 1.0))
+    probabilities = expected / expected.sum()
+    num_edges = int(num_vertices * avg_degree / 2)
+    edges = rng.choice(num_vertices, size=(num_edges, 2), p=probabilities)
+    return Graph.from_edges(edges[edges[:, 0] != edges[:, 1]])
+
+def road_like(side, drop=0.1, shortcuts=0.01, seed=0):
+    """
+    Weighted road-network stand-in: a grid with a fraction of its streets removed, a few
+    diagonal shortcuts, and integer lengths between 10 and 100 attached as edge weights.
+    """
+
+    rng = np.random.default_rng(seed)
+    edges = grid_edges(side)
+    edges = edges[rng.random(len(edges)) >= drop]
+
+    num_shortcuts = int(side * side * shortcuts)
+    rows = rng.integers(0, side - 1, size=num_shortcuts)
+    cols = rng.integers(0, side - 1, size=num_shortcuts)
+    diagonals = np.stack((rows * side + cols, (rows + 1) * side + cols + 1), axis=1)
+    edges = np.concatenate((edges, diagonals))
+
+    g = Graph.from_edges(edges)
+    lengths = rng.integers(10, 101, size=len(edges)).tolist()
+    g.set_weights(dict(zip(map(tuple, edges.tolist()), lengths)))
+    return g
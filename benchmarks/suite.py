@@ -0,0 +1,239 @@
+"""
+Time the topology and operations hot paths on seeded synthetic graphs, record the peak
+memory of each case, and optionally compare against a saved report.
+
+    python benchmarks/suite.py --scale small --output baseline.json
+    python benchmarks/suite.py --scale small --baseline baseline.json --threshold 1.25
+    python benchmarks/suite.py --list
+    python -m benchmarks.suite --list
+
+Every graph is generated from --seed, so two runs on the same machine time the same work.
+Timings are the minimum and median of --repeats runs; peak memory is measured by tracemalloc
+in one extra run before them, so its overhead never shows up in the timings. With --baseline,
+a case whose median time or peak memory grew by more than --threshold is reported as a
+regression and the script exits with status 1. Slowdowns smaller than --noise seconds are
+ignored, since millisecond cases jitter by more than any sensible threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# the benchmark helpers, and the checkout itself so that pygraphnet need not be installed
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [_HERE, os.path.dirname(_HERE)]
+import generators
+
+import pygraphnet
+from pygraphnet import (Graph, CompactGraph, shortest_distance, shortest_path, distance_matrix,
+                        diameter, complement, cross_product)
+
+SCALES = {
+    'small': {'vertices': 2_000, 'side': 40, 'dense': 300, 'factor': 30},
+    'medium': {'vertices': 20_000, 'side': 120, 'dense': 1_000, 'factor': 100},
+    'large': {'vertices': 200_000, 'side': 400, 'dense': 2_000, 'factor': 300},
+}
+
+CASES = {}
+
+def case(name):
+    """Registers setup(scale, seed) -> state; the state's 'run' entry is the timed callable"""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+def _size(g):
+    return {'vertices': len(g.vertices), 'edges': len(g.edges)}
+
+@case('construction/erdos_renyi')
+def _construction(scale, seed):
+    edges = generators.erdos_renyi_edges(scale['vertices'], 8, seed)
+    return {'run': lambda: Graph.from_edges(edges),
+            'size': {'vertices': scale['vertices'], 'edges': len(edges)}}
+
+@case('construction/compact')
+def _construction_compact(scale, seed):
+    g = generators.erdos_renyi(scale['vertices'], 8, seed)
+    return {'run': lambda: CompactGraph(g), 'size': _size(g)}
+
+@case('bfs/erdos_renyi')
+def _bfs_erdos_renyi(scale, seed):
+    g = generators.erdos_renyi(scale['vertices'], 8, seed)
+    return {'run': lambda: shortest_distance(g, 0), 'size': _size(g)}
+
+@case('bfs/grid')
+def _bfs_grid(scale, seed):
+    g = generators.grid(scale['side'])
+    return {'run': lambda: shortest_distance(g, 0), 'size': _size(g)}
+
+@case('bfs/power_law')
+def _bfs_power_law(scale, seed):
+    g = generators.power_law(scale['vertices'], 8, seed=seed)
+    return {'run': lambda: shortest_distance(g, 0), 'size': _size(g)}
+
+@case('dijkstra/road_like')
+def _dijkstra_road(scale, seed):
+    g = generators.road_like(scale['side'], seed=seed)
+    return {'run': lambda: shortest_distance(g, 0), 'size': _size(g)}
+
+@case('path/road_like')
+def _path_road(scale, seed):
+    g = generators.road_like(scale['side'], seed=seed)
+    target = scale['side'] * scale['side'] - 1
+    return {'run': lambda: shortest_path(g, 0, target), 'size': _size(g)}
+
+@case('path/road_like_bidirectional')
+def _path_road_bidirectional(scale, seed):
+    g = generators.road_like(scale['side'], seed=seed)
+    target = scale['side'] * scale['side'] - 1
+    return {'run': lambda: shortest_path(g, 0, target, bidirectional=True), 'size': _size(g)}
+
+@case('distance_matrix/erdos_renyi')
+def _distance_matrix(scale, seed):
+    g = generators.erdos_renyi(scale['vertices'], 8, seed)
+    sources = list(range(16))
+    return {'run': lambda: distance_matrix(g, sources), 'size': _size(g)}
+
+@case('diameter/grid_ifub')
+def _diameter_grid(scale, seed):
+    g = generators.grid(scale['side'])
+    return {'run': lambda: diameter(g, method='ifub'), 'size': _size(g)}
+
+@case('diameter/power_law_ifub')
+def _diameter_power_law(scale, seed):
+    g = generators.power_law(scale['vertices'], 8, seed=seed)
+    return {'run': lambda: diameter(g, method='ifub'), 'size': _size(g)}
+
+@case('diameter/erdos_renyi_all_pairs')
+def _diameter_all_pairs(scale, seed):
+    # all-pairs search is quadratic, so it runs on the dense-operation size
+    g = generators.erdos_renyi(scale['dense'], 8, seed)
+    return {'run': lambda: diameter(g), 'size': _size(g)}
+
+@case('complement/materialized')
+def _complement(scale, seed):
+    g = generators.erdos_renyi(scale['dense'], 8, seed)
+    return {'run': lambda: complement(g), 'size': _size(g)}
+
+@case('complement/lazy_bfs')
+def _complement_bfs(scale, seed):
+    g = generators.erdos_renyi(scale['vertices'], 8, seed)
+    view = complement(g, lazy=True)
+    return {'run': lambda: shortest_distance(view, 0), 'size': _size(g)}
+
+@case('cross_product/grid')
+def _cross_product(scale, seed):
+    path = Graph.from_edges([(i, i + 1) for i in range(scale['factor'] - 1)])
+    return {'run': lambda: cross_product(path, path),
+            'size': {'vertices': scale['factor'] ** 2, 'edges': 2 * scale['factor'] * (scale['factor'] - 1)}}
+
+@case('cross_product/lazy_diameter')
+def _product_diameter(scale, seed):
+    g = generators.erdos_renyi(scale['dense'], 8, seed)
+    view = cross_product(g, g, lazy=True)
+    return {'run': lambda: diameter(view), 'size': _size(g)}
+
+def measure(run, repeats):
+    # the traced run also warms up lazily built indexes before the timed runs
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {'times': times, 'min': min(times), 'median': statistics.median(times), 'peak_memory': peak}
+
+def metadata(args):
+    return {
+        'scale': args.scale,
+        'seed': args.seed,
+        'repeats': args.repeats,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pygraphnet': getattr(pygraphnet, '__version__', None),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+def compare(results, baseline, threshold, noise):
+    """Print the ratio of each case to the baseline and return the names of the regressions"""
+    regressions = []
+    print(f"\n{'case':40} {'time':>9} {'memory':>9}")
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            print(f"{name:40} {'new':>9}")
+            continue
+        time_ratio = result['median'] / before['median'] if before['median'] else float('inf')
+        memory_ratio = result['peak_memory'] / before['peak_memory'] if before['peak_memory'] else 1.0
+        slower = time_ratio > threshold and result['median'] - before['median'] > noise
+        regressed = slower or memory_ratio > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:40} {time_ratio:8.2f}x {memory_ratio:8.2f}x{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--filter', default='', help="only run the cases whose name contains this text")
+    parser.add_argument('--output', help="write the JSON report to this file")
+    parser.add_argument('--baseline', help="a previous JSON report to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="time or memory ratio above which a case counts as a regression")
+    parser.add_argument('--noise', type=float, default=0.005,
+                        help="slowdowns of fewer seconds than this are never regressions")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(CASES))
+        return 0
+
+    scale = SCALES[args.scale]
+    results = {}
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        state = setup(scale, args.seed)
+        result = measure(state['run'], args.repeats)
+        result['size'] = state['size']
+        results[name] = result
+        print(f"{name:40} {result['median']:9.4f}s  {result['peak_memory'] / 2**20:9.2f} MiB")
+
+    report = {'meta': metadata(args), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['meta'].get('scale') != args.scale or baseline['meta'].get('seed') != args.seed:
+            print(f"warning: the baseline was run with scale {baseline['meta'].get('scale')!r} "
+                  f"and seed {baseline['meta'].get('seed')!r}", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold, args.noise)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold}x", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Timing helper shared by the benchmark scripts"""
+
+import time
+
+def timed(func, *args, **kwargs):
+    """Call func and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
@@ -1,3 +1,4 @@
 from .classes import *
 from .topology import *
-from .operations import *
\ No newline at end of file
+from .operations import *
+from .profiling import *
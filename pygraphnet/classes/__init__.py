@@ -1,10 +1,27 @@
-__all__ = ["Graph"]
+from itertools import chain
+
+import numpy as np
+
+from pygraphnet.profiling import _active, count
+from .compact import CompactGraph
+from .interning import VertexIndex
+from .edgelist import read_edge_list, write_edge_list
+from .complement import ComplementGraph
+from .product import ProductGraph
+from .storage import save_graph, load_graph
+from .weights import EdgeWeights, normalize_weights
+
+__all__ = ["Graph", "CompactGraph", "ComplementGraph", "ProductGraph", "EdgeWeights", "normalize_weights", "VertexIndex",
+           "save_graph", "load_graph", "read_edge_list", "write_edge_list"]
 
 class Graph:
     """Graph class
 
     This class supports directed or undirected graphs and can initialize graphs from
     different data formats, including another graph object, an edge list, and an adjacency list.
+
+    ``version`` counts the mutations made so far, so results computed at one version stay
+    valid for as long as it is unchanged.
     """
 
     def __init__(self, data=None, directed=False):
@@ -12,6 +29,12 @@ class Graph:
         self.vertices = set()
         self.edges = set()
         self.adj_list = {}
+        self.adj_weights = None
+        self._in_adj_list = None
+        self._vertex_index = None
+        self._listeners = []
+        self.version = 0
+        self.query_cache = None
 
         # Initialize graph with various data formats
         if isinstance(data, Graph):
@@ -29,50 +52,84 @@ class Graph:
         self.vertices = set(graph.vertices)
         self.edges = set(graph.edges)
         self.adj_list = {v: set(neighbors) for v, neighbors in graph.adj_list.items()}
+        if graph.adj_weights is not None:
+            self.adj_weights = EdgeWeights((v, dict(w)) for v, w in graph.adj_weights.items())
 
     def _init_empty_graph(self, num_vertices):
         self.vertices = set(range(num_vertices))
         self.adj_list = {v: set() for v in self.vertices}
 
     def _init_from_adj_list(self, adj_list):
-        for v, neighbors in adj_list.items():
+        for v in adj_list:
             self.add_vertex(v)
-            for u in neighbors:
-                self.add_vertex(u)
-                self.add_edge(v, u)
+        self.add_edges_from((v, u) for v, neighbors in adj_list.items() for u in neighbors)
 
     def _init_from_edge_list(self, edge_list):
-        for v, u in edge_list:
-            self.add_vertex(v)
-            self.add_vertex(u)
-            self.add_edge(v, u)
+        self.add_edges_from(edge_list)
+
+    @classmethod
+    def from_edges(cls, edges, directed=False):
+        """
+        Builds a graph from an edge list in one bulk pass.
+
+        Parameters:
+            edges: A NumPy integer array of shape (E, 2) or an iterable of (v, u) pairs.
+            directed (bool): Whether the graph is directed.
+
+        Returns:
+            Graph: The new graph.
+        """
+
+        graph = cls(directed=directed)
+        graph.add_edges_from(edges)
+        return graph
 
     # Vertex and edge management
     def add_vertex(self, v):
         self.vertices.add(v)
         if v not in self.adj_list:
             self.adj_list[v] = set()
+            if self.adj_weights is not None:
+                self.adj_weights[v] = {}
+            if self._in_adj_list is not None:
+                self._in_adj_list[v] = set()
+            if self._vertex_index is not None:
+                self._vertex_index.add(v)
+            self._mutated('add_vertex', v)
 
     def del_vertex(self, v):
-        """Remove a vertex and all its associated edges"""
+        """Remove a vertex and all its associated edges, touching only the edges incident to it"""
         if v not in self.vertices:
             return
-        
+
         self.vertices.remove(v)
+        if self.directed:
+            in_adj_list = self._in_adjacency()
+            predecessors = in_adj_list.pop(v, set())
+            successors = self.adj_list.pop(v, set())
+            self.edges.difference_update([(v, u) for u in successors])
+            self.edges.difference_update([(w, v) for w in predecessors])
+            for u in successors - {v}:
+                in_adj_list[u].discard(v)
+        else:
+            predecessors = successors = self.adj_list.pop(v, set())
+            self.edges.difference_update([(v, u) for u in successors])
+            self.edges.difference_update([(u, v) for u in successors])
 
-        edges_to_remove = set()
-        for edge in self.edges:
-            if v in edge:
-                edges_to_remove.add(edge)
+        predecessors = predecessors - {v}
+        for w in predecessors:
+            self.adj_list[w].discard(v)
 
-        for edge in edges_to_remove:
-            self.edges.remove(edge)
+        if self.adj_weights is not None:
+            self.adj_weights.pop(v, None)
+            for w in predecessors:
+                self.adj_weights[w].pop(v, None)
+        if self._vertex_index is not None:
+            self._vertex_index.discard(v)
 
-        self.adj_list.pop(v, None)
-        for neighbors in self.adj_list.values():
-            neighbors.discard(v)
+        self._mutated('del_vertex', v, successors)
 
-    def add_edge(self, v, u, bidirectional=False):
+    def add_edge(self, v, u, bidirectional=False, weight=None):
         """
         Adds an edge to the graph. If the graph is directed, or bidirectional is False, adds a single directed edge.
         If the graph is undirected or bidirectional is True, adds edges in both directions.
@@ -82,8 +139,13 @@ class Graph:
             u: The ending vertex of the edge.
             bidirectional (bool): If True and the resulting graph is directed, adds the edge in both directions.
                                   This parameter is ignored if the graph is undirected.
+            weight (optional): The edge weight. Giving a weight attaches weights to the graph, with 1 for
+                               existing edges; otherwise new edges of a weighted graph weigh 1.
         """
 
+        if weight is not None and self.adj_weights is None:
+            self.set_weights({})
+
         if v not in self.vertices:
             self.add_vertex(v)
         if u not in self.vertices:
@@ -95,19 +157,283 @@ class Graph:
             if bidirectional:
                 self.edges.add((u, v))
                 self.adj_list[u].add(v)
+            if self._in_adj_list is not None:
+                self._in_adj_list[u].add(v)
+                if bidirectional:
+                    self._in_adj_list[v].add(u)
         else:
             self.edges.add((v, u))
             self.adj_list[v].add(u)
             self.adj_list[u].add(v)
-    
+
+        if self.adj_weights is not None:
+            weight = 1 if weight is None else weight
+            self.adj_weights[v][u] = weight
+            if not self.directed or bidirectional:
+                self.adj_weights[u][v] = weight
+
+        self._mutated('add_edge', v, u)
+        if self.directed and bidirectional:
+            self._mutated('add_edge', u, v)
+
+    def add_edges_from(self, edges):
+        """
+        Adds many edges at once, with the same result as calling add_edge for each of them.
+
+        Duplicates are dropped in bulk and every adjacency set is updated once per source
+        vertex. Labels are interned to integer ids (with np.unique for integer arrays of shape
+        (E, 2)) so that deduplication and grouping by source run as NumPy sorts.
+
+        Parameters:
+            edges: A NumPy integer array of shape (E, 2) or an iterable of (v, u) pairs.
+        """
+
+        if not isinstance(edges, (np.ndarray, list, tuple)):
+            edges = list(edges)
+        array = _integer_edge_array(edges)
+        if array is not None:
+            labels, inverse = np.unique(array, return_inverse=True)
+        else:
+            # intern arbitrary hashable labels to 0..n-1 in order of first appearance
+            index = {}
+            inverse = [index.setdefault(w, len(index)) for v, u in edges for w in (v, u)]
+            labels = np.empty(len(index), dtype=object)
+            labels[:] = list(index)
+
+        self._add_id_edges(labels, inverse)
+
+    def _add_id_edges(self, labels, pairs):
+        """
+        Bulk-adds the edges (labels[i], labels[j]) for every row (i, j) of pairs. labels must be
+        a NumPy array of distinct vertex labels, all of which become vertices of the graph.
+        """
+
+        # each edge becomes one sortable int64 key
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        n = max(len(labels), 1)
+        keys = _sorted_unique(pairs[:, 0] * n + pairs[:, 1])
+        added_src, added_dst = labels[keys // n].tolist(), labels[keys % n].tolist()
+        num_edges = len(self.edges)
+        self.edges.update(zip(added_src, added_dst))
+        new_vertices = self._add_vertices(labels.tolist())
+        # nothing changed, unless re-added edges of a weighted graph go back to weight 1
+        if (not new_vertices and len(self.edges) == num_edges
+                and (self.adj_weights is None or not len(keys))):
+            return
+
+        if not self.directed:
+            keys = _sorted_unique(np.concatenate((keys, (keys % n) * n + keys // n)))
+        src, dst = keys // n, keys % n
+
+        # keys are sorted, so each source vertex owns one contiguous run of neighbors
+        starts = np.flatnonzero(np.diff(src, prepend=-1))
+        heads = labels[src[starts]].tolist()
+        neighbors = labels[dst].tolist()
+        bounds = starts.tolist() + [len(neighbors)]
+        adj_list = self.adj_list
+        for v, start, end in zip(heads, bounds, bounds[1:]):
+            adj_list[v].update(neighbors[start:end])
+        if self._in_adj_list is not None:
+            in_adj_list = self._in_adj_list
+            for v, u in zip(labels[src].tolist(), neighbors):
+                in_adj_list[u].add(v)
+
+        if self.adj_weights is not None:
+            self._set_unit_weights(zip(labels[src].tolist(), neighbors))
+
+        if _active:
+            count('graph.batched_edges', len(added_src))
+        self._mutated('add_edges', new_vertices, list(zip(added_src, added_dst)) if self._listeners else [])
+
+    def _add_vertices(self, vertices):
+        new_vertices = [v for v in vertices if v not in self.adj_list]
+        self.vertices.update(vertices)
+        self.adj_list.update((v, set()) for v in new_vertices)
+        if self.adj_weights is not None:
+            self.adj_weights.update((v, {}) for v in new_vertices)
+        if self._in_adj_list is not None:
+            self._in_adj_list.update((v, set()) for v in new_vertices)
+        if self._vertex_index is not None:
+            for v in new_vertices:
+                self._vertex_index.add(v)
+        return new_vertices
+
+    def _set_unit_weights(self, pairs):
+        adj_weights = self.adj_weights
+        for v, u in pairs:
+            adj_weights[v][u] = 1
+
     def del_edge(self, v, u):
         """Remove an edge from the graph"""
         if (v, u) not in self.edges:
             return
 
         self.edges.remove((v, u))
+        if not self.directed:
+            # the edge may also have been added the other way around
+            self.edges.discard((u, v))
 
         if v in self.adj_list:
             self.adj_list[v].discard(u)
         if not self.directed and u in self.adj_list:
-            self.adj_list[u].discard(v)
\ No newline at end of file
+            self.adj_list[u].discard(v)
+        if self._in_adj_list is not None and u in self._in_adj_list:
+            self._in_adj_list[u].discard(v)
+
+        if self.adj_weights is not None:
+            self.adj_weights[v].pop(u, None)
+            if not self.directed:
+                self.adj_weights[u].pop(v, None)
+
+        self._mutated('del_edge', v, u)
+
+    def set_weights(self, weights):
+        """
+        Attaches edge weights to the adjacency storage. The weights are validated and normalized
+        once with normalize_weights, after which the weighted searches read them directly
+        whenever no weights argument is passed. Passing None detaches them.
+
+        Parameters:
+            weights (dict): Edge weights keyed by (v, u); edges without a weight weigh 1.
+        """
+
+        self.adj_weights = None if weights is None else normalize_weights(self, weights)
+        self._mutated('set_weights')
+
+    # Mutation listeners
+    def subscribe(self, callback):
+        """
+        Registers a callback run after every mutation of the graph as callback(event, *args):
+        ('add_vertex', v), ('del_vertex', v, successors) with the out-neighbors v had,
+        ('add_edge', v, u) for each directed edge added or re-weighted (undirected edges are
+        reported once), ('add_edges', new_vertices, edges) once per bulk load, ('del_edge', v, u)
+        and ('set_weights',).
+
+        Parameters:
+            callback (callable): The function to call.
+        """
+
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """Removes a callback registered with subscribe"""
+        self._listeners.remove(callback)
+
+    def _mutated(self, event, *args):
+        self.version += 1
+        if _active:
+            count('graph.' + event)
+        for callback in self._listeners:
+            callback(event, *args)
+
+    # Incoming adjacency
+    def in_neighbors(self, v):
+        """
+        Returns the vertices with an edge into v. For directed graphs this reads an incoming
+        adjacency index that is built on the first call and kept up to date by every later
+        mutation; for undirected graphs it is adj_list[v]. The returned set must not be modified.
+
+        Parameters:
+            v: The vertex.
+
+        Returns:
+            set: The in-neighbors of v.
+        """
+
+        if not self.directed:
+            return self.adj_list[v]
+        return self._in_adjacency()[v]
+
+    def in_degree(self, v):
+        """Returns the number of edges into v"""
+        return len(self.in_neighbors(v))
+
+    def _in_adjacency(self):
+        if self._in_adj_list is None:
+            in_adj_list = {v: set() for v in self.adj_list}
+            for v, neighbors in self.adj_list.items():
+                for u in neighbors:
+                    in_adj_list[u].add(v)
+            self._in_adj_list = in_adj_list
+        return self._in_adj_list
+
+    # Integer ids
+    def vertex_index(self):
+        """
+        Returns the VertexIndex numbering the vertices 0..V-1. It is built on the first call
+        and kept up to date by every later mutation: new vertices get the next ids, and a
+        deleted vertex's id goes to the vertex with the highest id. The returned index must
+        not be modified.
+
+        Returns:
+            VertexIndex: The label <-> id map of the graph's vertices.
+        """
+
+        if self._vertex_index is None:
+            self._vertex_index = VertexIndex(self.vertices)
+        return self._vertex_index
+
+    def relabel_to_integers(self, ordering='default'):
+        """
+        Returns a copy of the graph with every vertex relabeled to its integer id, together with
+        the map back to the original labels. Edges, directedness and weights are kept.
+
+        The copy is built in one bulk pass, and searches on it hash and compare small ints
+        instead of tuples or strings; results can be translated back with the returned index:
+
+            h, index = g.relabel_to_integers()
+            distances = index.decode_dict(shortest_distance(h, index[source]))
+
+        Parameters:
+            ordering (str): 'default' numbers the vertices as vertex_index() does, 'sorted' in
+                            sorted label order and 'degree' by decreasing out-degree.
+
+        Returns:
+            tuple: (graph, index) with the relabeled Graph and a VertexIndex snapshot mapping
+                   each original label to its integer label.
+        """
+
+        if ordering == 'default':
+            index = self.vertex_index().copy()
+        elif ordering == 'sorted':
+            index = VertexIndex(sorted(self.vertices))
+        elif ordering == 'degree':
+            adj_list = self.adj_list
+            index = VertexIndex(sorted(self.vertices, key=lambda v: len(adj_list[v]), reverse=True))
+        else:
+            raise ValueError(f"ordering must be 'default', 'sorted' or 'degree', got {ordering!r}")
+
+        ids = index.ids
+        pairs = np.fromiter(map(ids.__getitem__, chain.from_iterable(self.edges)), dtype=np.int64,
+                            count=2 * len(self.edges))
+        result = Graph(directed=self.directed)
+        result._add_id_edges(np.arange(len(index), dtype=np.int64), pairs)
+        if self.adj_weights is not None:
+            result.adj_weights = EdgeWeights((ids[v], {ids[u]: w for u, w in weights.items()})
+                                             for v, weights in self.adj_weights.items())
+        return result, index
+
+def _integer_edge_array(edges):
+    """Return edges as an (E, 2) integer array, or None if they are not integer pairs"""
+    if len(edges) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    if not isinstance(edges, np.ndarray):
+        # only worth converting when the labels look like integers
+        first = edges[0]
+        if not all(isinstance(w, (int, np.integer)) for w in first):
+            return None
+    try:
+        array = np.asarray(edges)
+    except ValueError:
+        # ragged, e.g. mixing scalar and tuple vertex labels
+        return None
+    if array.dtype.kind not in 'iu' or array.ndim != 2 or array.shape[1] != 2:
+        return None
+    return array
+
+def _sorted_unique(keys):
+    """np.unique for a 1-D integer array, always by sorting rather than hashing"""
+    keys = np.sort(keys)
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
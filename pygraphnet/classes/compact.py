@@ -0,0 +1,346 @@
+from collections.abc import Mapping
+from itertools import chain
+
+import numpy as np
+
+from pygraphnet.profiling import phase
+from .weights import normalize_weights
+
+__all__ = ["CompactGraph"]
+
+class CompactGraph:
+    """Compact graph class
+
+    This class stores an immutable graph in CSR (compressed sparse row) form: a vertex
+    label <-> integer id map plus two NumPy arrays, ``offsets`` and ``indices``. The
+    out-neighbors of the vertex with id ``i`` are ``indices[offsets[i]:offsets[i + 1]]``.
+    Undirected graphs store every edge in both directions. Edge weights, when attached, are
+    kept in a ``weights`` array parallel to ``indices``.
+
+    A compact graph can be built from a Graph, another CompactGraph, a vertex count or an
+    edge list, and exposes the read-only ``vertices``, ``edges`` and ``adj_list`` views the
+    topology and operations functions rely on.
+    """
+
+    # compact graphs never change
+    version = 0
+
+    def __init__(self, data=None, directed=False):
+        self.directed = directed
+        self.query_cache = None
+        self.labels = []
+        self.index = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.weights = None
+        self._reverse = None
+        self._mapped_from = None
+
+        if isinstance(data, CompactGraph):
+            self._init_from_compact(data)
+        elif hasattr(data, 'adj_list'):
+            with phase('csr_conversion'):
+                self._init_from_graph(data)
+        elif isinstance(data, int):
+            self._init_empty_graph(data)
+        elif hasattr(data, '__iter__'):
+            self._init_from_edge_list(data)
+
+        self._freeze()
+
+    def __reduce_ex__(self, protocol):
+        if self._mapped_from is not None:
+            # a memory-mapped graph is reopened from its file instead of copied
+            from .storage import load_graph
+            return load_graph, self._mapped_from
+        return super().__reduce_ex__(protocol)
+
+    def _freeze(self):
+        self.offsets.flags.writeable = False
+        self.indices.flags.writeable = False
+        if self.weights is not None:
+            self.weights.flags.writeable = False
+
+    # Graph initialization methods
+    def _init_from_compact(self, graph):
+        # arrays are read-only, so they can be shared
+        self.directed = graph.directed
+        self.labels = graph.labels
+        self.index = graph.index
+        self.offsets = graph.offsets
+        self.indices = graph.indices
+        self.weights = graph.weights
+
+    def _init_from_graph(self, graph):
+        # keep the source graph's vertex and neighbor order so traversals visit
+        # vertices in the same order on both representations
+        self.directed = graph.directed
+        self.labels = list(graph.vertices)
+        self.index = {v: i for i, v in enumerate(self.labels)}
+
+        adj_list = graph.adj_list
+        degrees = np.fromiter(map(len, map(adj_list.__getitem__, self.labels)),
+                              dtype=np.int64, count=len(self.labels))
+        self.offsets = _offsets_from_degrees(degrees)
+        neighbors = chain.from_iterable(map(adj_list.__getitem__, self.labels))
+        self.indices = np.fromiter(map(self.index.__getitem__, neighbors),
+                                   dtype=_id_dtype(len(self.labels)), count=int(self.offsets[-1]))
+        if getattr(graph, 'adj_weights', None) is not None:
+            self.weights = _weights_array(graph.adj_weights, self.labels, adj_list)
+
+    def _init_empty_graph(self, num_vertices):
+        self.labels = list(range(num_vertices))
+        self.index = {v: v for v in self.labels}
+        self.offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=_id_dtype(num_vertices))
+
+    def _init_from_edge_list(self, edge_list):
+        index = self.index
+        labels = self.labels
+        src, dst = [], []
+        for v, u in edge_list:
+            for w in (v, u):
+                if w not in index:
+                    index[w] = len(labels)
+                    labels.append(w)
+            src.append(index[v])
+            dst.append(index[u])
+
+        self.offsets, self.indices = _csr_from_ids(np.asarray(src, dtype=np.int64),
+                                                   np.asarray(dst, dtype=np.int64),
+                                                   len(labels), self.directed)
+
+    # Read-only views
+    @property
+    def vertices(self):
+        return self.index.keys()
+
+    @property
+    def edges(self):
+        return _CompactEdges(self)
+
+    @property
+    def adj_list(self):
+        return _CompactAdjacency(self)
+
+    @property
+    def num_vertices(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.edges)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the CSR arrays"""
+        weight_bytes = 0 if self.weights is None else self.weights.nbytes
+        return self.offsets.nbytes + self.indices.nbytes + weight_bytes
+
+    # Queries
+    def neighbor_ids(self, i):
+        """Return the out-neighbor ids of the vertex with id i as an array view"""
+        return self.indices[self.offsets[i]:self.offsets[i + 1]]
+
+    def source_ids(self):
+        """Return the source id of every entry of indices, as an int64 array parallel to it"""
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self.offsets))
+
+    def neighbor_weights(self, i):
+        """Return the weights of the out-edges of the vertex with id i, parallel to neighbor_ids"""
+        return self.weights[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbors(self, v):
+        """Return the out-neighbor labels of vertex v"""
+        labels = self.labels
+        return tuple(labels[j] for j in self.neighbor_ids(self.index[v]).tolist())
+
+    def degree(self, v):
+        i = self.index[v]
+        return int(self.offsets[i + 1] - self.offsets[i])
+
+    def in_neighbors(self, v):
+        """Return the labels of the vertices with an edge into v, read from reverse()"""
+        return self.reverse().neighbors(v)
+
+    def in_degree(self, v):
+        return self.reverse().degree(v)
+
+    def has_edge(self, v, u):
+        if v not in self.index or u not in self.index:
+            return False
+        return bool((self.neighbor_ids(self.index[v]) == self.index[u]).any())
+
+    def with_weights(self, weights, strict=True):
+        """
+        Return a compact graph sharing this graph's structure with edge weights attached.
+
+        Parameters:
+            weights (dict): Edge weights keyed by (v, u), validated with normalize_weights, or
+                            None to drop the weights.
+            strict (bool): If False, weights for edges missing from the graph are ignored.
+        """
+
+        result = CompactGraph(self)
+        result.weights = None
+        if weights is not None:
+            result.weights = _weights_array(normalize_weights(self, weights, strict), self.labels, self.adj_list)
+            result.weights.flags.writeable = False
+        return result
+
+    def reverse(self):
+        """
+        Return the compact graph with every edge reversed. Unweighted undirected graphs are
+        their own reverse; weighted ones keep their structure with the weight of each edge
+        read from the opposite end.
+        """
+
+        if not self.directed and self.weights is None:
+            return self
+        if self._reverse is not None:
+            return self._reverse
+
+        src = self.source_ids()
+        # stable sort of the edges by target groups them into the reversed rows
+        order = np.argsort(self.indices, kind='stable')
+        result = CompactGraph(directed=self.directed)
+        result.labels = self.labels
+        result.index = self.index
+        result.offsets = _offsets_from_degrees(np.bincount(self.indices, minlength=self.num_vertices))
+        result.indices = src[order].astype(self.indices.dtype)
+        if self.weights is not None:
+            result.weights = self.weights[order]
+        result._freeze()
+        result._reverse = self
+        self._reverse = result
+        return result
+
+    def subgraph(self, vertices):
+        """
+        Return the compact graph induced by a set of vertices, keeping every edge between them
+        and its weight. The vertices keep their relative order.
+
+        Parameters:
+            vertices (iterable): The vertex labels to keep.
+        """
+
+        mask = np.zeros(self.num_vertices, dtype=bool)
+        mask[[self.index[v] for v in vertices]] = True
+        return self._induced(mask)
+
+    def _induced(self, mask):
+        """The compact graph induced by the vertex ids where mask is True"""
+        ids = np.flatnonzero(mask)
+        new_ids = np.full(self.num_vertices, -1, dtype=np.int64)
+        new_ids[ids] = np.arange(len(ids))
+
+        # rows stay sorted by source, so kept entries are already in CSR order
+        src = self.source_ids()
+        keep = mask[src] & mask[self.indices]
+        result = CompactGraph(directed=self.directed)
+        labels = self.labels
+        result.labels = [labels[i] for i in ids.tolist()]
+        result.index = {v: i for i, v in enumerate(result.labels)}
+        result.offsets = _offsets_from_degrees(np.bincount(new_ids[src[keep]], minlength=len(ids)))
+        result.indices = new_ids[self.indices[keep]].astype(_id_dtype(len(ids)))
+        if self.weights is not None:
+            result.weights = self.weights[keep]
+        result._freeze()
+        return result
+
+    def to_graph(self):
+        """Expand this compact graph into a mutable Graph"""
+        from pygraphnet.classes import Graph
+
+        result = Graph(directed=self.directed)
+        for v in self.labels:
+            result.add_vertex(v)
+        for v, u in self.edges:
+            result.add_edge(v, u)
+        if self.weights is not None:
+            labels = self.labels
+            result.set_weights({(labels[i], labels[j]): w for i, j, w in self._weighted_id_edges()})
+        return result
+
+    def _weighted_id_edges(self):
+        src = self.source_ids()
+        return zip(src.tolist(), self.indices.tolist(), self.weights.tolist())
+
+    def __repr__(self):
+        return (f"CompactGraph(num_vertices={self.num_vertices}, num_edges={self.num_edges}, "
+                f"directed={self.directed})")
+
+class _CompactAdjacency(Mapping):
+    """Read-only ``adj_list`` view mapping each vertex label to a tuple of neighbor labels"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, v):
+        return self._graph.neighbors(v)
+
+    def __iter__(self):
+        return iter(self._graph.labels)
+
+    def __len__(self):
+        return len(self._graph.labels)
+
+    def __contains__(self, v):
+        return v in self._graph.index
+
+class _CompactEdges:
+    """Read-only ``edges`` view; undirected edges are reported once"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def _id_pairs(self):
+        g = self._graph
+        src = g.source_ids()
+        dst = g.indices
+        if not g.directed:
+            keep = src <= dst
+            src, dst = src[keep], dst[keep]
+        return src, dst
+
+    def __iter__(self):
+        labels = self._graph.labels
+        src, dst = self._id_pairs()
+        for i, j in zip(src.tolist(), dst.tolist()):
+            yield labels[i], labels[j]
+
+    def __len__(self):
+        g = self._graph
+        if g.directed:
+            return len(g.indices)
+        return len(self._id_pairs()[0])
+
+    def __contains__(self, edge):
+        v, u = edge
+        return self._graph.has_edge(v, u)
+
+def _weights_array(edge_weights, labels, adj_list):
+    """Lay out EdgeWeights parallel to CSR indices built from adj_list in labels order"""
+    values = [edge_weights[v][u] for v in labels for u in adj_list[v]]
+    return np.asarray(values) if values else np.zeros(0, dtype=np.int64)
+
+def _id_dtype(num_vertices):
+    return np.int32 if num_vertices < np.iinfo(np.int32).max else np.int64
+
+def _offsets_from_degrees(degrees):
+    offsets = np.zeros(len(degrees) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    return offsets
+
+def _csr_from_ids(src, dst, num_vertices, directed):
+    """Build deduplicated CSR arrays from integer edge endpoints"""
+    if not directed:
+        src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+
+    # sort by (src, dst) and drop duplicate edges in one pass
+    keys = np.unique(src * max(num_vertices, 1) + dst)
+    src = keys // max(num_vertices, 1)
+    dst = keys % max(num_vertices, 1)
+
+    offsets = _offsets_from_degrees(np.bincount(src, minlength=num_vertices))
+    return offsets, dst.astype(_id_dtype(num_vertices))
@@ -0,0 +1,138 @@
+from collections.abc import Mapping, Set
+
+__all__ = ["ComplementGraph"]
+
+class ComplementGraph:
+    """Complement graph view
+
+    This class is a lazy, read-only view of the complement of another graph: u is a neighbor
+    of v exactly when u != v and (v, u) is not an edge of the underlying graph. Nothing is
+    materialized; the ``vertices``, ``edges`` and ``adj_list`` views answer queries against
+    the underlying graph, so they follow its later mutations.
+
+    The topology functions traverse complement views without building their O(V^2) edge
+    sets, and pygraphnet.operations.complement builds a materialized Graph when one is needed.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.directed = graph.directed
+        self.adj_weights = None
+        self.query_cache = None
+
+    @property
+    def version(self):
+        return self.graph.version
+
+    @property
+    def vertices(self):
+        return self.graph.vertices
+
+    @property
+    def adj_list(self):
+        return _ComplementAdjacency(self)
+
+    @property
+    def edges(self):
+        return _ComplementEdges(self)
+
+    def excluded(self, v):
+        """Return the out-neighbors of v in the underlying graph, as a set"""
+        return _as_set(self.graph.adj_list[v])
+
+    def neighbors(self, v):
+        return _ComplementNeighbors(self.graph.vertices, self.excluded(v), v)
+
+    def degree(self, v):
+        return len(self.neighbors(v))
+
+    def in_neighbors(self, v):
+        if not self.directed:
+            return self.neighbors(v)
+        return _ComplementNeighbors(self.graph.vertices, _as_set(self.graph.in_neighbors(v)), v)
+
+    def in_degree(self, v):
+        return len(self.in_neighbors(v))
+
+    def has_edge(self, v, u):
+        return v in self.graph.adj_list and u in self.neighbors(v)
+
+    def __repr__(self):
+        return f"ComplementGraph({self.graph!r})"
+
+class _ComplementNeighbors(Set):
+    """The vertices other than v and outside excluded, enumerated on demand"""
+
+    def __init__(self, vertices, excluded, v):
+        self._vertices = vertices
+        self._excluded = excluded
+        self._v = v
+
+    def __contains__(self, u):
+        return u != self._v and u in self._vertices and u not in self._excluded
+
+    def __iter__(self):
+        excluded, v = self._excluded, self._v
+        return (u for u in self._vertices if u != v and u not in excluded)
+
+    def __len__(self):
+        excluded = len(self._excluded) - (self._v in self._excluded)
+        return len(self._vertices) - 1 - excluded
+
+class _ComplementAdjacency(Mapping):
+    """Read-only ``adj_list`` view mapping each vertex to its lazy complement neighbor set"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, v):
+        if v not in self._graph.graph.adj_list:
+            raise KeyError(v)
+        return self._graph.neighbors(v)
+
+    def __iter__(self):
+        return iter(self._graph.graph.adj_list)
+
+    def __len__(self):
+        return len(self._graph.graph.adj_list)
+
+    def __contains__(self, v):
+        return v in self._graph.graph.adj_list
+
+class _ComplementEdges:
+    """Read-only ``edges`` view; undirected edges are reported once"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __iter__(self):
+        g = self._graph
+        if g.directed:
+            for v in g.vertices:
+                for u in g.neighbors(v):
+                    yield v, u
+            return
+
+        seen = set()
+        for v in g.vertices:
+            seen.add(v)
+            for u in g.neighbors(v):
+                if u not in seen:
+                    yield v, u
+
+    def __len__(self):
+        g = self._graph
+        num_vertices = len(g.vertices)
+        adj_list = g.graph.adj_list
+        num_edges = sum(len(neighbors) - (v in neighbors) for v, neighbors in adj_list.items())
+        if g.directed:
+            return num_vertices * (num_vertices - 1) - num_edges
+        return num_vertices * (num_vertices - 1) // 2 - num_edges // 2
+
+    def __contains__(self, edge):
+        v, u = edge
+        return self._graph.has_edge(v, u)
+
+def _as_set(neighbors):
+    # CompactGraph adjacency rows are tuples; membership tests need a set
+    return neighbors if isinstance(neighbors, Set) else set(neighbors)
@@ -0,0 +1,189 @@
+import gzip
+import warnings
+from itertools import islice
+
+import numpy as np
+
+from .compact import CompactGraph
+from .weights import EdgeWeights
+
+__all__ = ["read_edge_list", "write_edge_list"]
+
+def read_edge_list(source, directed=False, delimiter=None, comments='#', nodetype=int,
+                   weight_column=None, chunk_size=100_000, progress=None):
+    """
+    Streams a delimited edge-list file into a Graph, one chunk of lines at a time.
+
+    Each chunk is parsed on its own (integer labels with NumPy's text parser) and handed to
+    Graph.add_edges_from, so apart from the graph itself, memory use is bounded by the chunk
+    size however long the file is. Gzip-compressed files are detected from their header.
+
+    Parameters:
+        source (str, os.PathLike or file): The file to read, or an open text file.
+        directed (bool): Whether the graph is directed.
+        delimiter (str): The column separator; any whitespace by default.
+        comments (str): Lines starting with this prefix, and blank lines, are skipped.
+        nodetype (callable): int to parse labels as integers, or a function such as str that
+                             turns each label field into a vertex.
+        weight_column (int): The column holding edge weights, attached with the same rules
+                             as set_weights. Edges listed more than once keep the last weight.
+                             Weights are ints when every weight of a chunk is an integer, and
+                             floats otherwise.
+        chunk_size (int): The number of lines parsed at a time.
+        progress (callable): Called as progress(edges_read) after each chunk.
+
+    Returns:
+        Graph: The graph read.
+
+    Raises:
+        ValueError: If a line cannot be parsed or a weight is negative or NaN.
+    """
+
+    from pygraphnet.classes import Graph
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size!r}")
+    g = Graph(directed=directed)
+    if weight_column is not None:
+        # every edge gets a unit weight as it is added, overwritten below
+        g.adj_weights = EdgeWeights()
+
+    edges_read = 0
+    with _open(source, 'r') as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            if nodetype is int:
+                edges, weights = _parse_numeric(lines, delimiter, comments, weight_column)
+            else:
+                edges, weights = _parse_fields(lines, delimiter, comments, nodetype, weight_column)
+            if len(edges):
+                g.add_edges_from(edges)
+                if weights is not None:
+                    _set_chunk_weights(g, edges, weights)
+            edges_read += len(edges)
+            if progress is not None:
+                progress(edges_read)
+    return g
+
+def write_edge_list(g, target, delimiter=' ', weights=True, chunk_size=100_000):
+    """
+    Writes the edges of a graph as delimited lines, one chunk at a time. Paths ending in .gz
+    are gzip-compressed. Labels are written with str(), so read_edge_list reads them back
+    as long as they contain no delimiter.
+
+    Parameters:
+        g (Graph or CompactGraph): The graph to write.
+        target (str, os.PathLike or file): The file to write, or an open text file.
+        delimiter (str): The column separator.
+        weights (bool): Whether to write the attached edge weights as a third column.
+        chunk_size (int): The number of lines formatted at a time.
+    """
+
+    rows = _weighted_edges(g) if weights else ((v, u) for v, u in g.edges)
+    with _open(target, 'w') as f:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            f.write(''.join(delimiter.join(map(str, row)) + '\n' for row in chunk))
+
+class _Unclosed:
+    """Context manager handing out a file the caller opened, without closing it"""
+
+    def __init__(self, f):
+        self.f = f
+
+    def __enter__(self):
+        return self.f
+
+    def __exit__(self, *exc_info):
+        return False
+
+def _open(path, mode):
+    if hasattr(path, 'read' if mode == 'r' else 'write'):
+        return _Unclosed(path)
+    if mode == 'r':
+        with open(path, 'rb') as f:
+            compressed = f.read(2) == b'\x1f\x8b'
+    else:
+        compressed = str(path).endswith('.gz')
+    if compressed:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def _parse_numeric(lines, delimiter, comments, weight_column):
+    """(E, 2) int64 array of edges and the parallel weights, or None"""
+    columns = (0, 1) if weight_column is None else (0, 1, weight_column)
+    dtype = [('v', np.int64), ('u', np.int64)]
+    if weight_column is not None:
+        # read as text, so that integer weights can stay integers
+        dtype.append(('w', 'U64'))
+    with warnings.catch_warnings():
+        # a chunk holding only comments is not worth a warning
+        warnings.simplefilter('ignore', UserWarning)
+        rows = np.loadtxt(lines, dtype=dtype, delimiter=delimiter, comments=comments,
+                          usecols=columns, ndmin=1)
+    edges = np.stack((rows['v'], rows['u']), axis=1)
+    return edges, (_weight_array(rows['w']) if weight_column is not None else None)
+
+def _parse_fields(lines, delimiter, comments, nodetype, weight_column):
+    edges = []
+    weights = [] if weight_column is not None else None
+    for number, line in enumerate(lines):
+        line = line.strip()
+        if not line or (comments and line.startswith(comments)):
+            continue
+        fields = line.split(delimiter)
+        try:
+            edges.append((nodetype(fields[0]), nodetype(fields[1])))
+            if weights is not None:
+                weight = fields[weight_column].strip()
+                float(weight)
+                weights.append(weight)
+        except (IndexError, ValueError) as e:
+            raise ValueError(f"cannot parse edge line {line!r}: {e}") from None
+    return edges, (_weight_array(weights) if weights is not None else None)
+
+def _weight_array(tokens):
+    """Weight fields as int64 when every one is an integer, else as float64"""
+    tokens = np.asarray(tokens, dtype=str)
+    try:
+        return tokens.astype(np.int64)
+    except (ValueError, OverflowError):
+        try:
+            return tokens.astype(np.float64)
+        except ValueError as e:
+            raise ValueError(f"cannot parse edge weight: {e}") from None
+
+def _set_chunk_weights(g, edges, weights):
+    if (weights < 0).any() or np.isnan(weights).any():
+        bad = weights[(weights < 0) | np.isnan(weights)][0]
+        raise ValueError(f"edge weights must be non-negative, got {bad!r}")
+    if isinstance(edges, np.ndarray):
+        edges = edges.tolist()
+    adj_weights = g.adj_weights
+    for (v, u), weight in zip(edges, weights.tolist()):
+        adj_weights[v][u] = weight
+        if not g.directed:
+            adj_weights[u][v] = weight
+
+def _weighted_edges(g):
+    """(v, u) or (v, u, weight) rows of every edge of g"""
+    if isinstance(g, CompactGraph):
+        if g.weights is None:
+            yield from g.edges
+            return
+        labels = g.labels
+        for i, j, weight in g._weighted_id_edges():
+            if g.directed or i <= j:
+                yield labels[i], labels[j], weight
+        return
+
+    adj_weights = getattr(g, 'adj_weights', None)
+    for v, u in g.edges:
+        if adj_weights is None:
+            yield v, u
+        else:
+            yield v, u, adj_weights[v][u]
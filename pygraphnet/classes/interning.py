@@ -0,0 +1,104 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+__all__ = ["VertexIndex"]
+
+class VertexIndex(Mapping):
+    """Contiguous integer ids for vertex labels
+
+    A two-way map between arbitrary hashable labels and the ids 0..n-1: ``index[v]`` is the
+    id of label v and ``index.labels[i]`` the label with id i. Iterating yields the labels in
+    id order. Searches run faster on small integer labels than on tuples or strings, so a
+    graph can be relabeled once, searched in id space, and only the results translated back
+    with decode and decode_dict.
+    """
+
+    def __init__(self, labels=()):
+        """
+        Parameters:
+            labels (iterable): Labels numbered in order of first appearance.
+        """
+
+        labels = list(labels)
+        self.labels = labels
+        self.ids = dict(zip(labels, range(len(labels))))
+        if len(self.ids) < len(labels):
+            # repeated labels keep their first id
+            self.labels, self.ids = [], {}
+            for v in labels:
+                self.add(v)
+
+    def add(self, v):
+        """Return the id of label v, numbering it next if it is new"""
+        i = self.ids.get(v)
+        if i is None:
+            i = self.ids[v] = len(self.labels)
+            self.labels.append(v)
+        return i
+
+    def discard(self, v):
+        """
+        Removes label v if present. The label with the highest id takes over the id of v, so
+        the ids stay contiguous; every other id is unchanged.
+        """
+
+        i = self.ids.pop(v, None)
+        if i is None:
+            return
+        last = self.labels.pop()
+        if i < len(self.labels):
+            self.labels[i] = last
+            self.ids[last] = i
+
+    def copy(self):
+        result = VertexIndex()
+        result.labels = list(self.labels)
+        result.ids = dict(self.ids)
+        return result
+
+    def encode(self, labels):
+        """Return the ids of an iterable of labels as an int64 array"""
+        ids = self.ids
+        return np.fromiter(map(ids.__getitem__, labels), dtype=np.int64)
+
+    def decode(self, ids):
+        """Return the labels of an iterable or array of ids as a list"""
+        if isinstance(ids, np.ndarray):
+            ids = ids.tolist()
+        labels = self.labels
+        return [labels[i] for i in ids]
+
+    def decode_dict(self, mapping, values=False):
+        """
+        Translates the keys of a dict keyed by id back to labels, e.g. the distances returned
+        by a search on a relabeled graph.
+
+        Parameters:
+            mapping (dict): The dict keyed by id.
+            values (bool): If True, also translate the values, e.g. of a predecessor map;
+                           None values are kept.
+
+        Returns:
+            dict: The dict keyed by label.
+        """
+
+        labels = self.labels
+        if values:
+            return {labels[i]: (None if j is None else labels[j]) for i, j in mapping.items()}
+        return {labels[i]: value for i, value in mapping.items()}
+
+    def __getitem__(self, v):
+        return self.ids[v]
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, v):
+        return v in self.ids
+
+    def __repr__(self):
+        return f"VertexIndex(num_vertices={len(self.labels)})"
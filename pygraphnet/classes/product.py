@@ -0,0 +1,153 @@
+from collections.abc import Mapping, Set
+from itertools import product
+
+__all__ = ["ProductGraph"]
+
+class ProductGraph:
+    """Cartesian product graph view
+
+    This class is a lazy, read-only view of the Cartesian product of two graphs. Its vertices
+    are the pairs (v1, v2), and (v1, v2) -> (u1, u2) is an edge when either v2 == u2 and
+    v1 -> u1 is an edge of graph1, or v1 == u1 and v2 -> u2 is an edge of graph2. The product
+    is directed if either factor is. Neighbor queries are derived from the factors on the fly,
+    so grid- and torus-like products are never stored.
+
+    The topology functions compute product distances from distances in the factors, and
+    pygraphnet.operations.cross_product builds a materialized Graph when one is needed.
+    """
+
+    def __init__(self, graph1, graph2):
+        self.graph1 = graph1
+        self.graph2 = graph2
+        self.directed = graph1.directed or graph2.directed
+        self.adj_weights = None
+        self.query_cache = None
+
+    @property
+    def version(self):
+        return self.graph1.version, self.graph2.version
+
+    @property
+    def vertices(self):
+        return _ProductVertices(self.graph1.vertices, self.graph2.vertices)
+
+    @property
+    def adj_list(self):
+        return _ProductAdjacency(self)
+
+    @property
+    def edges(self):
+        return _ProductEdges(self)
+
+    def neighbors(self, v):
+        v1, v2 = v
+        return _ProductNeighbors(v1, v2, self.graph1.adj_list[v1], self.graph2.adj_list[v2])
+
+    def degree(self, v):
+        return len(self.neighbors(v))
+
+    def in_neighbors(self, v):
+        v1, v2 = v
+        return _ProductNeighbors(v1, v2, self.graph1.in_neighbors(v1), self.graph2.in_neighbors(v2))
+
+    def in_degree(self, v):
+        return len(self.in_neighbors(v))
+
+    def has_edge(self, v, u):
+        return v in self.vertices and u in self.neighbors(v)
+
+    def __repr__(self):
+        return f"ProductGraph({self.graph1!r}, {self.graph2!r})"
+
+class _ProductVertices(Set):
+    """The (v1, v2) pairs of two vertex sets, enumerated on demand"""
+
+    def __init__(self, vertices1, vertices2):
+        self._vertices1 = vertices1
+        self._vertices2 = vertices2
+
+    def __contains__(self, v):
+        return (isinstance(v, tuple) and len(v) == 2
+                and v[0] in self._vertices1 and v[1] in self._vertices2)
+
+    def __iter__(self):
+        return product(self._vertices1, self._vertices2)
+
+    def __len__(self):
+        return len(self._vertices1) * len(self._vertices2)
+
+class _ProductNeighbors(Set):
+    """The moves along graph1 (second coordinate fixed) followed by the moves along graph2"""
+
+    def __init__(self, v1, v2, neighbors1, neighbors2):
+        self._v1 = v1
+        self._v2 = v2
+        self._neighbors1 = neighbors1
+        self._neighbors2 = neighbors2
+
+    def _double_loop(self):
+        # a self-loop in both factors would otherwise be counted twice
+        return self._v1 in self._neighbors1 and self._v2 in self._neighbors2
+
+    def __contains__(self, u):
+        if not isinstance(u, tuple) or len(u) != 2:
+            return False
+        u1, u2 = u
+        return ((u2 == self._v2 and u1 in self._neighbors1)
+                or (u1 == self._v1 and u2 in self._neighbors2))
+
+    def __iter__(self):
+        v1, v2 = self._v1, self._v2
+        for u1 in self._neighbors1:
+            yield u1, v2
+        skip_loop = self._double_loop()
+        for u2 in self._neighbors2:
+            if not (skip_loop and u2 == v2):
+                yield v1, u2
+
+    def __len__(self):
+        return len(self._neighbors1) + len(self._neighbors2) - self._double_loop()
+
+class _ProductAdjacency(Mapping):
+    """Read-only ``adj_list`` view mapping each vertex pair to its lazy neighbor set"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, v):
+        if v not in self._graph.vertices:
+            raise KeyError(v)
+        return self._graph.neighbors(v)
+
+    def __iter__(self):
+        return iter(self._graph.vertices)
+
+    def __len__(self):
+        return len(self._graph.vertices)
+
+    def __contains__(self, v):
+        return v in self._graph.vertices
+
+class _ProductEdges:
+    """Read-only ``edges`` view reporting every adjacency entry, as cross_product always has"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __iter__(self):
+        g = self._graph
+        for v in g.vertices:
+            for u in g.neighbors(v):
+                yield v, u
+
+    def __len__(self):
+        adj_list1, adj_list2 = self._graph.graph1.adj_list, self._graph.graph2.adj_list
+        entries1 = sum(len(neighbors) for neighbors in adj_list1.values())
+        entries2 = sum(len(neighbors) for neighbors in adj_list2.values())
+        loops1 = sum(v in neighbors for v, neighbors in adj_list1.items())
+        loops2 = sum(v in neighbors for v, neighbors in adj_list2.items())
+        return entries1 * len(adj_list2) + len(adj_list1) * entries2 - loops1 * loops2
+
+    def __contains__(self, edge):
+        v, u = edge
+        return self._graph.has_edge(v, u)
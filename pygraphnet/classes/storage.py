@@ -0,0 +1,200 @@
+import json
+import pickle
+import struct
+from collections.abc import Mapping
+from numbers import Integral
+
+import numpy as np
+
+from .compact import CompactGraph
+
+__all__ = ["save_graph", "load_graph"]
+
+MAGIC = b'PGNCSR\x00\x00'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct('<8sII')
+
+def save_graph(g, path):
+    """
+    Writes a graph to a binary file that load_graph can memory-map.
+
+    The file starts with a magic number, the format version and a JSON header describing
+    each section, followed by the CSR ``offsets`` and ``indices`` arrays, the edge weights if
+    any, and the vertex label table, every section aligned to 64 bytes and stored
+    little-endian. Labels 0..n-1 in order take no space; integer and string labels are stored
+    as arrays, and any other labels are pickled.
+
+    Parameters:
+        g (Graph or CompactGraph): The graph to save, with the weights attached to it.
+        path (str or os.PathLike): The file to write.
+
+    Raises:
+        TypeError: If the edge weights are not all integers or all floats.
+    """
+
+    _write(g if isinstance(g, CompactGraph) else CompactGraph(g), path)
+
+def _write(csr, path, extra_sections=None, extra_header=None):
+    """
+    Writes a compact graph followed by any extra named arrays, which load_graph skips, with
+    extra_header merged into the JSON header.
+    """
+
+    sections = {'offsets': csr.offsets, 'indices': csr.indices}
+    if csr.weights is not None:
+        if csr.weights.dtype.kind not in 'iuf':
+            raise TypeError(f"edge weights must be integers or floats to be saved, got {csr.weights.dtype}")
+        sections['weights'] = csr.weights
+
+    label_kind, label_sections = _encode_labels(csr.labels)
+    sections.update(label_sections)
+    sections.update(extra_sections or {})
+
+    arrays = {name: np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+              for name, array in sections.items()}
+    # section offsets count from the first aligned position after the header
+    layout = {}
+    position = 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': position}
+        position = _aligned(position + array.nbytes)
+    header = {'directed': csr.directed, 'num_vertices': csr.num_vertices, 'labels': label_kind,
+              'sections': layout, **(extra_header or {})}
+    encoded = json.dumps(header).encode()
+    start = _aligned(_PREAMBLE.size + len(encoded))
+
+    with open(path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name, array in arrays.items():
+            f.write(b'\x00' * (start + layout[name]['offset'] - f.tell()))
+            array.tofile(f)
+
+def load_graph(path, mmap=True, allow_pickle=False):
+    """
+    Opens a graph written by save_graph.
+
+    With mmap, the CSR and weight arrays are read-only numpy.memmap views of the file, so
+    opening a graph of any size only reads its label table, edges are paged in as they are
+    visited, and processes that open the same file share its pages. A memory-mapped graph
+    sent to a worker process is reopened there from the same file rather than copied.
+
+    Parameters:
+        path (str or os.PathLike): The file to read.
+        mmap (bool): If False, the arrays are read into memory instead.
+        allow_pickle (bool): Whether to load a label table that had to be pickled. Only
+                             enable this for trusted files.
+
+    Returns:
+        CompactGraph: The saved graph. Call to_graph() on it for a mutable Graph.
+
+    Raises:
+        ValueError: If the file is not a saved graph, has an unsupported format version, or
+                    needs allow_pickle.
+    """
+
+    g, _, _ = _read(path, mmap, allow_pickle)
+    return g
+
+def _read(path, mmap, allow_pickle):
+    """Return the graph in a file written by _write, its header and all of its sections"""
+    with open(path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size or preamble[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path!r} is not a saved PyGraphNet graph")
+        _, version, header_size = _PREAMBLE.unpack(preamble)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path!r} uses graph format version {version}, "
+                             f"this version of PyGraphNet reads version {FORMAT_VERSION}")
+        header = json.loads(f.read(header_size))
+
+    start = _aligned(_PREAMBLE.size + header_size)
+    sections = {name: _read_section(path, start + entry['offset'], entry, mmap)
+                for name, entry in header['sections'].items()}
+
+    g = CompactGraph(directed=header['directed'])
+    g.offsets = sections['offsets']
+    g.indices = sections['indices']
+    g.weights = sections.get('weights')
+    g.labels, g.index = _decode_labels(header['labels'], header['num_vertices'], sections, allow_pickle)
+    g._freeze()
+    if mmap:
+        g._mapped_from = (path, mmap, allow_pickle)
+    return g, header, sections
+
+def _aligned(position):
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+def _read_section(path, offset, entry, mmap):
+    dtype = np.dtype(entry['dtype'])
+    shape = tuple(entry['shape'])
+    count = int(np.prod(shape))
+    if count == 0:
+        # an empty section cannot be mapped
+        return np.zeros(shape, dtype=dtype)
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+
+def _encode_labels(labels):
+    """Return the label encoding and the sections it stores"""
+    n = len(labels)
+    if all(type(v) is int for v in labels):
+        try:
+            values = np.fromiter(labels, dtype=np.int64, count=n)
+        except OverflowError:
+            # integers beyond int64 fall through to pickling
+            pass
+        else:
+            if np.array_equal(values, np.arange(n)):
+                return 'range', {}
+            return 'int64', {'label_values': values}
+    elif all(type(v) is str for v in labels):
+        encoded = [v.encode() for v in labels]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return 'str', {'label_offsets': offsets,
+                       'label_bytes': np.frombuffer(b''.join(encoded), dtype=np.uint8)}
+    return 'pickle', {'label_bytes': np.frombuffer(pickle.dumps(list(labels)), dtype=np.uint8)}
+
+def _decode_labels(kind, num_vertices, sections, allow_pickle):
+    """Return the labels list and label -> id index for a label encoding"""
+    if kind == 'range':
+        return range(num_vertices), _RangeIndex(num_vertices)
+    if kind == 'int64':
+        labels = sections['label_values'].tolist()
+    elif kind == 'str':
+        data = sections['label_bytes'].tobytes()
+        bounds = sections['label_offsets'].tolist()
+        labels = [data[start:end].decode() for start, end in zip(bounds, bounds[1:])]
+    elif kind == 'pickle':
+        if not allow_pickle:
+            raise ValueError("the vertex labels of this graph were pickled; "
+                             "load it with allow_pickle=True if the file is trusted")
+        labels = pickle.loads(sections['label_bytes'].tobytes())
+    else:
+        raise ValueError(f"unknown label encoding {kind!r}")
+    return labels, {v: i for i, v in enumerate(labels)}
+
+class _RangeIndex(Mapping):
+    """Label -> id index of a graph whose labels are 0..n-1, without a dict of n entries"""
+
+    def __init__(self, num_vertices):
+        self._num_vertices = num_vertices
+
+    def __getitem__(self, v):
+        if isinstance(v, Integral) and 0 <= v < self._num_vertices:
+            return int(v)
+        raise KeyError(v)
+
+    def __contains__(self, v):
+        return isinstance(v, Integral) and 0 <= v < self._num_vertices
+
+    def __iter__(self):
+        return iter(range(self._num_vertices))
+
+    def __len__(self):
+        return self._num_vertices
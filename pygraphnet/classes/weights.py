@@ -0,0 +1,63 @@
+from numbers import Real
+
+__all__ = ["EdgeWeights", "normalize_weights"]
+
+class EdgeWeights(dict):
+    """Edge weights validated against a graph, stored by adjacency as {v: {u: weight}}
+
+    Every edge (v, u) of the graph has an entry, so weighted searches can iterate
+    ``weights[v].items()`` instead of probing a {(v, u): weight} dict per relaxation.
+    """
+
+    def values_flat(self):
+        """Iterate over every stored weight"""
+        for neighbors in self.values():
+            yield from neighbors.values()
+
+def normalize_weights(g, weights, strict=True):
+    """
+    Validates a {(v, u): weight} dict against a graph once and returns its EdgeWeights form.
+
+    Edges without a weight default to 1. For undirected graphs either orientation of an edge
+    may carry its weight, with (v, u) taking precedence over (u, v) when traversing from v,
+    which is how the weighted searches have always read the dict.
+
+    Parameters:
+        g (Graph or CompactGraph): The graph the weights belong to.
+        weights (dict): Edge weights keyed by (v, u). EdgeWeights are returned unchanged.
+        strict (bool): If True, weights for edges missing from g are rejected.
+
+    Returns:
+        EdgeWeights: The weight of every edge of g.
+
+    Raises:
+        ValueError: If a weight is negative or NaN, or strict is True and a weight refers to
+                    an edge that is not in g.
+        TypeError: If a weight is not a real number.
+    """
+
+    if isinstance(weights, EdgeWeights):
+        return weights
+
+    adj_list = g.adj_list
+    for edge, weight in weights.items():
+        if not isinstance(weight, Real):
+            raise TypeError(f"weight of edge {edge!r} is not a number: {weight!r}")
+        if weight < 0 or weight != weight:
+            raise ValueError(f"weight of edge {edge!r} must be non-negative, got {weight!r}")
+        if strict:
+            v, u = edge
+            if v not in adj_list or u not in adj_list[v]:
+                raise ValueError(f"weight given for an edge not in the graph: {edge!r}")
+
+    result = EdgeWeights()
+    for v in adj_list:
+        neighbor_weights = result[v] = {}
+        for u in adj_list[v]:
+            if (v, u) in weights:
+                neighbor_weights[u] = weights[(v, u)]
+            elif not g.directed and (u, v) in weights:
+                neighbor_weights[u] = weights[(u, v)]
+            else:
+                neighbor_weights[u] = 1
+    return result
@@ -1,75 +1,319 @@
+from itertools import chain, product
+
+import numpy as np
+
 from pygraphnet import Graph
+from pygraphnet.classes import CompactGraph, ComplementGraph, ProductGraph, EdgeWeights
+from pygraphnet.profiling import phase, profiled
+from pygraphnet.topology import _csr
 
 """
 graph operations
-    union (TODO)
+    union
+    union_all
+    disjoint_union
+    disjoint_union_all
     cross_product
     complement
 """
 
-__all__ = ['cross_product', 'complement']
+__all__ = ['union', 'union_all', 'disjoint_union', 'disjoint_union_all', 'cross_product', 'complement']
+
+def union(*graphs):
+    """
+    Creates the union of graphs: every vertex and every edge of any of them, with vertices of
+    the same label merged. See union_all.
+
+    Parameters:
+        *graphs (Graph or CompactGraph): The input graphs, can be either directed or undirected.
+
+    Returns:
+        Graph: A new graph, directed if any of the input graphs is directed.
+    """
+
+    return union_all(graphs)
 
-def cross_product(g1, g2):
+@profiled
+def union_all(graphs, chunk_size=1_000_000):
+    """
+    Creates the union of an iterable of graphs, consuming it one graph at a time so that
+    graphs can be produced lazily, e.g. loaded from one shard file after another.
+
+    The edges of each input are read as integer id pairs, straight from its edge set or CSR
+    arrays, and buffered; whenever chunk_size edges are pending their labels are interned
+    together and they are loaded into the result in one bulk pass, which updates every
+    adjacency set once per chunk instead of once per edge. Only the result, the current input
+    and the buffered id arrays are held in memory.
+
+    If any input is directed the result is directed, and undirected edges are added in both
+    directions, as in cross_product. Edge weights are kept: the result is weighted if any
+    input is, an edge found in several inputs takes the weight it has in the last of them,
+    and edges of unweighted inputs weigh 1.
+
+    Parameters:
+        graphs (iterable): The input graphs, Graph or CompactGraph.
+        chunk_size (int): The number of edges buffered before each bulk load.
+
+    Returns:
+        Graph: A new graph.
+    """
+
+    return _fold(graphs, chunk_size, relabel=False)
+
+def disjoint_union(*graphs):
+    """
+    Creates the disjoint union of graphs, with vertices relabeled to consecutive integers.
+    See disjoint_union_all.
+
+    Parameters:
+        *graphs (Graph or CompactGraph): The input graphs, can be either directed or undirected.
+
+    Returns:
+        Graph: A new graph, directed if any of the input graphs is directed.
+    """
+
+    return disjoint_union_all(graphs)
+
+@profiled
+def disjoint_union_all(graphs, chunk_size=1_000_000):
+    """
+    Creates the disjoint union of an iterable of graphs, consumed one graph at a time and
+    loaded in chunks as in union_all. No vertices are shared: the vertices of each graph are
+    relabeled to the next free integers, in the iteration order of its vertices, so the k-th
+    graph with n_k vertices occupies labels offset_k .. offset_k + n_k - 1 with
+    offset_k = n_0 + ... + n_(k-1).
+
+    Parameters:
+        graphs (iterable): The input graphs, Graph or CompactGraph.
+        chunk_size (int): The number of edges buffered before each bulk load.
+
+    Returns:
+        Graph: A new graph with integer vertex labels.
+    """
+
+    return _fold(graphs, chunk_size, relabel=True)
+
+@profiled
+def cross_product(g1, g2, lazy=False):
     """
     Creates the Cartesian product of two graphs. If either of the input graphs is directed,
     the resulting graph will also be directed. For undirected edges from an undirected graph,
     edges will be added bidirectionally in the resulting graph if it is directed.
 
+    The product is computed on integer ids: with the vertices of g1 and g2 numbered i1 and i2,
+    (v1, v2) is vertex i1 * |V2| + i2, so every product edge comes out of one broadcast over
+    the CSR arrays of the factors and is loaded in a single bulk pass. With lazy=True a
+    ProductGraph view is returned instead, whose neighbors are derived from g1 and g2 on demand.
+
     Parameters:
-        g1 (Graph): The first input graph, can be either directed or undirected.
-        g2 (Graph): The second input graph, can be either directed or undirected.
+        g1 (Graph or CompactGraph): The first input graph, can be either directed or undirected.
+        g2 (Graph or CompactGraph): The second input graph, can be either directed or undirected.
+        lazy (bool): If True, return a read-only ProductGraph view of g1 x g2.
 
     Returns:
-        Graph: A new graph representing the Cartesian product of g1 and g2. The graph will be
-               directed if either of the input graphs is directed.
+        Graph or ProductGraph: A new graph representing the Cartesian product of g1 and g2, with
+               every pair of vertices as a vertex. The graph will be directed if either of the
+               input graphs is directed.
     """
 
-    # Determine if the resulting graph should be directed
-    directed_result = g1.directed or g2.directed
-    result = Graph(directed=directed_result)
+    if lazy:
+        return ProductGraph(g1, g2)
 
-    for v1 in g1.vertices:
-        for v2 in g2.vertices:
-            # For each edge in g1, add corresponding edges in the product
-            for u1 in g1.adj_list[v1]:
-                result.add_edge((v1, v2), (u1, v2), bidirectional=((not g1.directed) and directed_result))
-            # For each edge in g2, add corresponding edges in the product
-            for u2 in g2.adj_list[v2]:
-                result.add_edge((v1, v2), (v1, u2), bidirectional=((not g2.directed) and directed_result))
+    csr1, csr2 = _csr(g1), _csr(g2)
+    n1, n2 = csr1.num_vertices, csr2.num_vertices
+    ids1 = np.arange(n1, dtype=np.int64)[:, None] * n2
+    ids2 = np.arange(n2, dtype=np.int64)
 
+    # moves along g1 keep the second coordinate, moves along g2 keep the first
+    src1, dst1 = _csr_edges(csr1)
+    src2, dst2 = _csr_edges(csr2)
+    sources = np.concatenate(((src1[:, None] * n2 + ids2).ravel(), (ids1 + src2).ravel()))
+    targets = np.concatenate(((dst1[:, None] * n2 + ids2).ravel(), (ids1 + dst2).ravel()))
+
+    result = Graph(directed=g1.directed or g2.directed)
+    labels = _label_array(list(product(csr1.labels, csr2.labels)))
+    with phase('load'):
+        result._add_id_edges(labels, np.stack((sources, targets), axis=1))
     return result
 
-def complement(g):
+@profiled
+def complement(g, lazy=False):
     """
     Creates the complement of a graph, whether directed or undirected.
 
     For an undirected graph, two vertices are connected in the complement if they are not connected in the original graph.
     For a directed graph, an edge from u to v exists in the complement if and only if such an edge does not exist in the original graph.
 
+    The complement is built in blocks of rows: a boolean matrix with every pair set is
+    cleared at the original edges with one NumPy scatter and its nonzero entries are loaded
+    in bulk. With lazy=True a ComplementGraph view is returned instead,
+    which the topology functions traverse without materializing any complement edge.
+
     Parameters:
-        g (Graph): The input graph, can be either directed or undirected.
+        g (Graph or CompactGraph): The input graph, can be either directed or undirected.
+        lazy (bool): If True, return a read-only ComplementGraph view of g.
 
     Returns:
-        Graph: The complement of the input graph, preserving the directedness of the input.
+        Graph or ComplementGraph: The complement of the input graph, preserving the directedness of the input.
     """
 
-    # preserve directedness
+    if lazy:
+        return ComplementGraph(g)
+
+    csr = _csr(g)
+    num_vertices = csr.num_vertices
+    labels = _label_array(csr.labels)
+
+    # preserve directedness; every block also adds all vertices
     result = Graph(directed=g.directed)
 
-    for v in g.vertices:
-        result.add_vertex(v)
-
-    for v in g.vertices:
-        for u in g.vertices:
-            if v != u: # skip self-loops
-                if g.directed:
-                    # just check one direction for directed
-                    if u not in g.adj_list[v]:
-                        result.add_edge(v, u)
-                else:
-                    # check edge absence in both directions for undirected graphs
-                    if (v not in g.adj_list[u] and u not in g.adj_list[v] and
-                        v not in result.adj_list[u] and u not in result.adj_list[v]):
-                        result.add_edge(v, u)
-    
-    return result
\ No newline at end of file
+    sources, _ = _csr_edges(csr)
+    columns = np.arange(num_vertices, dtype=np.int64)
+    step = max(1, 2 ** 24 // max(num_vertices, 1))
+    for start in range(0, num_vertices, step):
+        stop = min(start + step, num_vertices)
+        rows = columns[start:stop]
+        with phase('mask'):
+            mask = np.ones((stop - start, num_vertices), dtype=bool)
+            mask[rows - start, rows] = False  # skip self-loops
+            lo, hi = csr.offsets[start], csr.offsets[stop]
+            mask[sources[lo:hi] - start, csr.indices[lo:hi]] = False
+            if not g.directed:
+                # report each undirected pair once, from its lower id
+                mask &= columns > rows[:, None]
+            i, j = np.nonzero(mask)
+
+        with phase('load'):
+            result._add_id_edges(labels, np.stack((i + start, j), axis=1))
+
+    return result
+
+def _fold(graphs, chunk_size, relabel):
+    """Loads graphs into a new Graph in chunks of buffered id pairs, see union_all"""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size!r}")
+    result = Graph()
+    pending = _PendingEdges(result)
+    offset = 0
+    for g in graphs:
+        if g.directed and not result.directed:
+            # edges loaded so far become edges in both directions
+            pending.flush()
+            _make_directed(result)
+
+        csr = g if isinstance(g, CompactGraph) else None
+        if not isinstance(g, Graph):
+            csr = _csr(g)
+        weighted = (csr.weights if csr is not None else g.adj_weights) is not None
+        if weighted:
+            # weights are written right after their edges, so later inputs still win
+            pending.flush()
+            csr = csr if csr is not None else _csr(g)
+
+        if csr is not None:
+            labels = _vertex_array(csr.labels)
+            pairs = np.stack(_csr_edges(csr), axis=1)
+            if not g.directed:
+                # undirected CSR arrays hold every edge twice
+                pairs = pairs[pairs[:, 0] <= pairs[:, 1]]
+        else:
+            labels, pairs = _graph_id_edges(g)
+        if result.directed and not g.directed:
+            pairs = np.concatenate((pairs, pairs[:, ::-1]))
+
+        if relabel:
+            labels = np.arange(offset, offset + len(labels), dtype=np.int64)
+        offset += len(labels)
+        pending.add(labels, pairs)
+        if weighted:
+            pending.flush()
+            _set_csr_weights(result, csr, labels)
+        elif pending.num_edges >= chunk_size:
+            pending.flush()
+
+    pending.flush()
+    return result
+
+class _PendingEdges:
+    """Id pairs of several graphs, each with its own label array, waiting to be bulk-loaded"""
+
+    def __init__(self, result):
+        self.result = result
+        self.labels = []
+        self.pairs = []
+        self.num_edges = 0
+
+    def add(self, labels, pairs):
+        self.labels.append(labels)
+        self.pairs.append(pairs)
+        self.num_edges += len(pairs)
+
+    def flush(self):
+        if not self.labels:
+            return
+        # intern the labels of every graph together, so shared labels get one id
+        if all(labels.dtype != object for labels in self.labels):
+            labels, ids = np.unique(np.concatenate(self.labels), return_inverse=True)
+        else:
+            index = {}
+            ids = np.fromiter((index.setdefault(v, len(index)) for labels in self.labels for v in labels.tolist()),
+                              dtype=np.int64)
+            labels = _label_array(list(index))
+
+        offsets = np.cumsum([0] + [len(labels) for labels in self.labels[:-1]])
+        pairs = np.concatenate([pairs + offset for pairs, offset in zip(self.pairs, offsets.tolist())])
+        with phase('load'):
+            self.result._add_id_edges(labels, ids.reshape(-1)[pairs])
+        self.labels, self.pairs, self.num_edges = [], [], 0
+
+def _graph_id_edges(g):
+    """(vertex array, id pairs) of a Graph, read from its vertex and edge sets"""
+    vertices = _vertex_array(list(g.vertices))
+    if vertices.dtype != object:
+        # every endpoint is an integer vertex, interned by binary search instead of a dict
+        edges = np.fromiter(chain.from_iterable(g.edges), dtype=np.int64, count=2 * len(g.edges))
+        order = np.argsort(vertices, kind='stable')
+        return vertices, order[np.searchsorted(vertices[order], edges)].reshape(-1, 2)
+    index = {v: i for i, v in enumerate(vertices.tolist())}
+    ids = np.fromiter((index[w] for edge in g.edges for w in edge), dtype=np.int64, count=2 * len(g.edges))
+    return vertices, ids.reshape(-1, 2)
+
+def _vertex_array(labels):
+    """labels as an int64 array when they are all integers, which np.unique interns fastest"""
+    if not len(labels):
+        return np.zeros(0, dtype=np.int64)
+    try:
+        array = np.asarray(labels)
+    except ValueError:
+        # ragged, e.g. mixing scalar and tuple vertex labels
+        return _label_array(labels)
+    if array.ndim == 1 and array.dtype.kind == 'i':
+        return array.astype(np.int64, copy=False)
+    return _label_array(labels)
+
+def _set_csr_weights(result, csr, labels):
+    """Writes the weights of csr, relabeled through labels, into result"""
+    if result.adj_weights is None:
+        # every edge loaded so far weighs 1
+        result.adj_weights = EdgeWeights((v, dict.fromkeys(neighbors, 1))
+                                         for v, neighbors in result.adj_list.items())
+    # every CSR entry is one direction of an edge, so undirected edges get both
+    adj_weights = result.adj_weights
+    sources, targets = _csr_edges(csr)
+    for v, u, weight in zip(labels[sources].tolist(), labels[targets].tolist(), csr.weights.tolist()):
+        adj_weights[v][u] = weight
+
+def _make_directed(g):
+    """Turns an undirected Graph built by an operation into the equivalent directed one"""
+    g.directed = True
+    g.edges.update([(u, v) for v, u in g.edges])
+    g._in_adj_list = None
+
+def _csr_edges(csr):
+    """(source ids, target ids) of every CSR entry"""
+    return csr.source_ids(), csr.indices.astype(np.int64)
+
+def _label_array(labels):
+    array = np.empty(len(labels), dtype=object)
+    array[:] = labels
+    return array
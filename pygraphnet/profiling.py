@@ -0,0 +1,163 @@
+"""
+Opt-in instrumentation of the topology functions, the operations and Graph mutations.
+
+Nothing is recorded unless a Profile is active:
+
+    with profile() as stats:
+        diameter(g, method='ifub')
+    print(stats.report())
+
+Instrumented code checks a single module-level list before doing any work, so the cost
+while profiling is off is one truth test per call, phase or search.
+"""
+
+import functools
+import time
+
+__all__ = ["Profile", "profile"]
+
+# the profiles currently collecting, innermost last; only ever mutated in place, so the
+# modules that import it directly always see the current list
+_active = []
+
+class Profile:
+    """Counters, peaks and timings collected while the profile is active
+
+    - ``counters`` maps names such as ``'bfs.edges_scanned'`` to totals.
+    - ``peaks`` maps names such as ``'dijkstra.heap'`` to the largest size seen.
+    - ``timings`` maps call paths such as ``'diameter/diameter_bounds/sweeps'`` to
+      ``{'calls': n, 'seconds': total}``, so the time of each phase is attributed to the
+      calls it ran under. Times are inclusive of nested calls.
+
+    Profiles can be nested and reused; every active profile records the same events.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Parameters:
+            callback (callable, optional): Called as callback(path, seconds) whenever an
+                                           instrumented call or phase ends, e.g. to log it.
+        """
+
+        self.callback = callback
+        self.counters = {}
+        self.peaks = {}
+        self.timings = {}
+        self._path = []
+
+    def __enter__(self):
+        _active.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.remove(self)
+        return False
+
+    def clear(self):
+        """Drops everything recorded so far"""
+        self.counters.clear()
+        self.peaks.clear()
+        self.timings.clear()
+
+    def as_dict(self):
+        """Return the counters, peaks and timings as plain JSON-serializable dicts"""
+        return {'counters': dict(self.counters), 'peaks': dict(self.peaks),
+                'timings': {path: dict(entry) for path, entry in self.timings.items()}}
+
+    def report(self):
+        """Return a human-readable table of the timings, counters and peaks"""
+        lines = []
+        if self.timings:
+            lines.append(f"{'call path':48} {'calls':>8} {'seconds':>10}")
+            for path, entry in sorted(self.timings.items()):
+                lines.append(f"{path:48} {entry['calls']:8d} {entry['seconds']:10.4f}")
+        for title, values in (('counter', self.counters), ('peak', self.peaks)):
+            if values:
+                lines.append(f"{title:48} {'value':>19}")
+                for name, value in sorted(values.items()):
+                    lines.append(f"{name:48} {value:19d}")
+        return '\n'.join(lines)
+
+    def _record(self, path, seconds):
+        entry = self.timings.get(path)
+        if entry is None:
+            entry = self.timings[path] = {'calls': 0, 'seconds': 0.0}
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        if self.callback is not None:
+            self.callback(path, seconds)
+
+def profile(callback=None):
+    """
+    Return a Profile to use as a context manager; everything instrumented that runs inside
+    the with block is recorded in it.
+
+    Parameters:
+        callback (callable, optional): Called as callback(path, seconds) whenever an
+                                       instrumented call or phase ends.
+    """
+
+    return Profile(callback)
+
+# Instrumentation helpers
+def count(name, amount=1):
+    """Adds amount to a counter of every active profile"""
+    for p in _active:
+        p.counters[name] = p.counters.get(name, 0) + amount
+
+def peak(name, value):
+    """Raises a peak of every active profile to value"""
+    for p in _active:
+        if value > p.peaks.get(name, -1):
+            p.peaks[name] = value
+
+class _Phase:
+    """Times a named phase under the current call path of every active profile"""
+
+    __slots__ = ('name', 'start', 'profiles')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        # profiles entered during the phase did not see it start
+        self.profiles = list(_active)
+        for p in self.profiles:
+            p._path.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for p in self.profiles:
+            p._record('/'.join(p._path), seconds)
+            p._path.pop()
+        return False
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NO_PHASE = _NoPhase()
+
+def phase(name):
+    """Return a context manager timing a phase, or a shared no-op one while not profiling"""
+    return _Phase(name) if _active else _NO_PHASE
+
+def profiled(func):
+    """Times every call of a function as a phase named after it"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return func(*args, **kwargs)
+        with _Phase(name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -1,98 +1,922 @@
-import heapq
+import hashlib
+import time
+
+import numpy as np
+
+from pygraphnet.classes import Graph, CompactGraph, ComplementGraph, ProductGraph, EdgeWeights, normalize_weights
+from pygraphnet.profiling import profiled
+from ._bfs import frontier_bfs, batched_bfs, complement_bfs
+from ._buckets import bucket_dijkstra, bucket_width
+from ._cache import QueryCache, cached
+from ._components import weak_components, strong_components
+from ._diameter import ifub
+from ._dynamic import DynamicDistances
+from ._isomorphism import refine_colors, distance_fingerprints, match
+from ._landmarks import LandmarkOracle
+from ._parallel import map_sources
+from ._sampling import (Estimate, StratifiedTotals, degree_strata, sampling_order, confidence_z,
+                        interval)
+from ._search import bfs, dijkstra, bidirectional_bfs, bidirectional_dijkstra, build_path
+from ._space import SearchSpace, resolve_weights, integral_weights
 
 """
 distance and paths
     shortest_distance
+    iter_distances
+    distance_matrix
+    multi_source_distance
     shortest_path
     diameter
+    diameter_bounds
+    DynamicDistances
+    LandmarkOracle
+    QueryCache
+
+sampled statistics
+    average_path_length
+    eccentricity_distribution
+    closeness
+
+components
+    connected_components
+    strongly_connected_components
+    component_graph
 
 graph comparison
-    isomorphism (TODO)
+    isomorphism
+    is_isomorphic
+    graph_hash
 """
 
-__all__ = ['shortest_distance', 'shortest_path', 'diameter']
+__all__ = ['shortest_distance', 'iter_distances', 'distance_matrix', 'multi_source_distance',
+           'shortest_path', 'diameter', 'diameter_bounds', 'DynamicDistances', 'LandmarkOracle',
+           'QueryCache', 'connected_components', 'strongly_connected_components', 'component_graph',
+           'isomorphism', 'is_isomorphic', 'graph_hash', 'average_path_length', 'eccentricity_distribution',
+           'closeness']
 
 # Distance and paths
-def shortest_distance(g, source=None, target=None, weights=None, pred_map=False):
+@profiled
+@cached
+def shortest_distance(g, source=None, target=None, weights=None, pred_map=False, workers=1, chunksize=None,
+                      queue='auto'):
+    """
+    Computes shortest distances with BFS for unweighted graphs and Dijkstra's algorithm for
+    weighted graphs.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        source (optional): The source vertex. If None, distances are computed from every vertex
+                           and returned as {source: result}.
+        target (optional): A target vertex or an iterable of target vertices to report.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        pred_map (bool): If True, also return the predecessor map of a single-source search.
+        workers (int): Worker processes for the all-pairs mode. 1 runs serially and None uses
+                       os.cpu_count().
+        chunksize (int, optional): Sources per worker task in the all-pairs mode.
+        queue (str): The priority queue of weighted searches: 'heap', 'dial' (a bucket per
+                     distance, for integer weights) or 'delta' (delta-stepping). 'auto' uses
+                     'delta' on graphs of 1024 vertices or more with numeric weights, and the
+                     heap otherwise, for point-to-point queries and for single-source searches
+                     given a weights dict.
+
+    Returns:
+        The distance map, the distance(s) to target, or an all-pairs map of those, plus the
+        predecessor map if pred_map is True.
+    """
+
     if source is None:
-        return {v: shortest_distance(g, source=v, target=target, weights=weights) for v in g.vertices}
-    
+        g, weights = _shared_weights(g, weights, queue)
+        if workers == 1:
+            return {v: shortest_distance(g, source=v, target=target, weights=weights, queue=queue)
+                    for v in g.vertices}
+        return dict(map_sources(shortest_distance, g, g.vertices, workers=workers, chunksize=chunksize,
+                                target=target, weights=weights, queue=queue))
+
+    space = SearchSpace(g, weights)
+    if target is not None and _single_target(target, g.vertices) and not pred_map:
+        # point-to-point query: stop as soon as the target is settled
+        if target not in g.vertices:
+            raise KeyError(target)
+        if not space.weighted:
+            return _hop_distance(g, source, target)
+        s, t = space.encode(source), space.encode(target)
+        return dijkstra(space.weighted_neighbors, [s], t)[0].get(t, float('inf'))
+
+    if space.weighted:
+        distances, predecessors = _dijkstra_distances(g, space, [source], weights, queue)
+    else:
+        distances, predecessors = _bfs_distances(g, [source])
+    return _select_targets(distances, predecessors, target, pred_map)
+
+# views searched in place instead of through a CSR copy
+_VIEWS = (ComplementGraph, ProductGraph)
+
+def _compact_view(g):
+    return g if isinstance(g, _VIEWS) else _csr(g)
+
+def _shared_weights(g, weights, queue='auto'):
+    """
+    (g, weights) to run a batch of searches with. A weights dict is validated once instead
+    of being probed on every relaxation, and on graphs large enough for the bucket queues it
+    is attached to a CSR copy that every search of the batch shares. Unweighted batches share
+    the CSR view.
+    """
+
+    if weights and not isinstance(weights, EdgeWeights):
+        weights = normalize_weights(g, weights, strict=False)
+    if not weights:
+        return _compact_view(g), weights
+    if queue != 'heap' and not isinstance(g, _VIEWS) and len(g.vertices) >= _BUCKET_MIN_VERTICES:
+        return _csr(g).with_weights(weights, strict=False), None
+    return g, weights
+
+def _csr(g):
+    """g as a CompactGraph, built once per version when g has a query cache"""
+    if isinstance(g, CompactGraph):
+        return g
+    cache = getattr(g, 'query_cache', None)
+    if cache is not None:
+        return cache.view(g, CompactGraph)
+    return CompactGraph(g)
+
+def _unweighted(g):
+    """g with any attached weights dropped, for searches that count hops"""
+    if isinstance(g, CompactGraph) and g.weights is not None:
+        return g.with_weights(None)
+    if isinstance(g, Graph) and g.adj_weights is not None:
+        return CompactGraph(g).with_weights(None)
+    return g
+
+def _hop_distance(g, source, target):
+    """Unweighted point-to-point distance; product views add up the distances in their factors"""
+    if isinstance(g, ProductGraph):
+        (s1, s2), (t1, t2) = source, target
+        return _hop_distance(g.graph1, s1, t1) + _hop_distance(g.graph2, s2, t2)
+    space = SearchSpace(g)
+    s, t = space.encode(source), space.encode(target)
+    return _bfs_search(g, space, s, t)[0].get(t, float('inf'))
+
+def _bfs_search(g, space, source, target):
+    """Unweighted search that stops as soon as target is discovered"""
+    if isinstance(g, ComplementGraph):
+        return complement_bfs(g.excluded, g.vertices, [source], target)
+    return bfs(space.neighbors, source, target)
+
+def _bfs_distances(g, sources):
+    """Unweighted distances and predecessors from the given sources via the frontier BFS"""
+    if isinstance(g, ComplementGraph):
+        reached, reached_predecessors = complement_bfs(g.excluded, g.vertices, sources)
+        distances = {v: reached.get(v, float('inf')) for v in g.vertices}
+        predecessors = {v: reached_predecessors.get(v) for v in g.vertices}
+        return distances, predecessors
+    if isinstance(g, ProductGraph):
+        return _product_distances(g, sources)
+
+    csr = _compact_view(g)
+    dist, pred = frontier_bfs(csr.offsets, csr.indices, [csr.index[source] for source in sources])
+
+    labels = csr.labels
+    inf = float('inf')
+    distances = {v: (d if d >= 0 else inf) for v, d in zip(labels, dist.tolist())}
+    predecessors = {v: (labels[p] if p >= 0 else None) for v, p in zip(labels, pred.tolist())}
+    return distances, predecessors
+
+def _product_distances(g, sources):
+    """
+    Unweighted distances in a product view from one search per factor and source. Moves
+    along the two factors commute, so d((v1, v2), (u1, u2)) = d1(v1, u1) + d2(v2, u2), and a
+    shortest path can first move along g1 and then along g2.
+    """
+
+    vertices1, vertices2 = list(g.graph1.vertices), list(g.graph2.vertices)
+    unreachable = np.iinfo(np.int64).max // 4
+    best = np.full((len(vertices1), len(vertices2)), unreachable, dtype=np.int64)
+    owner = np.zeros(best.shape, dtype=np.int64)
+    searches = []
+    for k, (s1, s2) in enumerate(sources):
+        dist1, pred1 = _bfs_distances(g.graph1, [s1])
+        dist2, pred2 = _bfs_distances(g.graph2, [s2])
+        row1 = np.array([dist1[v] if dist1[v] != float('inf') else unreachable for v in vertices1], dtype=np.int64)
+        row2 = np.array([dist2[v] if dist2[v] != float('inf') else unreachable for v in vertices2], dtype=np.int64)
+        dist = np.minimum(np.add.outer(row1, row2), unreachable)
+        closer = dist < best
+        best[closer] = dist[closer]
+        owner[closer] = k
+        searches.append((pred1, pred2, s2))
+
+    distances = {}
+    predecessors = {}
+    pairs = zip(g.vertices, best.ravel().tolist(), owner.ravel().tolist())
+    for (v1, v2), dist, k in pairs:
+        if dist == unreachable:
+            distances[v1, v2] = float('inf')
+            predecessors[v1, v2] = None
+            continue
+        distances[v1, v2] = dist
+        pred1, pred2, s2 = searches[k]
+        if pred2[v2] is not None:
+            predecessors[v1, v2] = (v1, pred2[v2])
+        elif pred1[v1] is not None:
+            predecessors[v1, v2] = (pred1[v1], s2)
+        else:
+            predecessors[v1, v2] = None
+    return distances, predecessors
+
+def _dijkstra_distances(g, space, sources, weights=None, queue='auto'):
+    """Weighted distances and predecessors from the given sources, as full label maps"""
+    found = _bucket_search(g, weights, sources, queue)
+    if found is not None:
+        csr, dist, pred = found
+        labels = csr.labels
+        inf = float('inf')
+        distances = {v: d if d >= 0 else inf for v, d in zip(labels, dist.tolist())}
+        # sources are at 0 as in the heap search, not at 0.0 under float weights
+        distances.update(dict.fromkeys(sources, 0))
+        predecessors = {v: labels[p] if p >= 0 else None for v, p in zip(labels, pred.tolist())}
+        return distances, predecessors
+
+    reached, reached_predecessors = dijkstra(space.weighted_neighbors, [space.encode(s) for s in sources])
+    decode = space.decode
     distances = {v: float('inf') for v in g.vertices}
     predecessors = {v: None for v in g.vertices}
-    distances[source] = 0
-    visited = set()
+    for v, dist in reached.items():
+        distances[decode(v)] = dist
+    for v, predecessor in reached_predecessors.items():
+        predecessors[decode(v)] = None if predecessor is None else decode(predecessor)
+    return distances, predecessors
+
+# smallest graph searched with bucket queues by default; below it the heap's lower
+# per-vertex overhead wins
+_BUCKET_MIN_VERTICES = 1024
+
+def _bucket_search(g, weights, sources, queue):
+    """(csr, dist, pred) of a bucket queue search, or None where the heap is used"""
+    if queue not in ('auto', 'heap', 'dial', 'delta'):
+        raise ValueError(f"unknown queue: {queue!r}")
+    if queue == 'heap' or isinstance(g, _VIEWS):
+        return None
+    if queue == 'auto' and (weights or len(g.vertices) < _BUCKET_MIN_VERTICES):
+        return None
 
+    csr = _csr(g)
     if weights:
-        # Djikstra's algorithm for weighted graphs
-        queue = [(0, source)]
-        while queue:
-            dist, current_vertex = heapq.heappop(queue)
-            if current_vertex in visited:
-                continue
-            visited.add(current_vertex)
-
-            for neighbor in g.adj_list[current_vertex]:
-                if g.directed:
-                    edge = (current_vertex, neighbor)
-                else:
-                    edge = (current_vertex, neighbor) if (current_vertex, neighbor) in weights else (neighbor, current_vertex)
-                weight = weights[edge] if edge in weights else 1
-                new_dist = dist + weight
-
-                if new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    predecessors[neighbor] = current_vertex
-                    heapq.heappush(queue, (new_dist, neighbor))
-    else:
-        # BFS for unweighted graphs
-        queue = [source]
-        visited.add(source)
-        while queue:
-            current_vertex = queue.pop(0)
-            for neighbor in g.adj_list[current_vertex]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    distances[neighbor] = distances[current_vertex] + 1
-                    predecessors[neighbor] = current_vertex
-    
+        csr = csr.with_weights(weights, strict=False)
+    if csr.weights is None or csr.weights.dtype.kind not in 'iubf':
+        if queue == 'auto':
+            return None
+        raise ValueError(f"the {queue!r} queue requires integer or float weights")
+    if queue == 'dial' and csr.weights.dtype.kind == 'f':
+        raise ValueError("the 'dial' queue requires integer weights")
+
+    delta = bucket_width(csr.weights, csr.offsets, queue)
+    dist, pred = bucket_dijkstra(csr.offsets, csr.indices, csr.weights,
+                                 [csr.index[source] for source in sources], delta)
+    return csr, dist, pred
+
+def _single_target(target, vertices):
+    # tuple labels, such as the vertices of a cross product, name one vertex
+    return not hasattr(target, '__iter__') or (isinstance(target, tuple) and target in vertices)
+
+def _select_targets(distances, predecessors, target, pred_map):
     if target is not None:
-        if hasattr(target, '__iter__'):
-            result = [distances[t] for t in target]
-        else:
+        if _single_target(target, distances):
             result = distances[target]
+        else:
+            result = [distances[t] for t in target]
     else:
         result = distances
 
     return (result, predecessors) if pred_map else result
 
-def shortest_path(g, source, target, weights=None):
-    _, pred_map = shortest_distance(g, source, target, weights, pred_map=True)
+# default cap on the sources of one worker task, so that a parallel scan holds at most
+# 2 * _ROWS_PER_TASK distance rows per worker however large the graph
+_ROWS_PER_TASK = 32
 
-    if target not in pred_map or pred_map[target] == None:
-        return [], []
+def iter_distances(g, sources=None, weights=None, sparse=False, workers=1, chunksize=None):
+    """
+    Streams single-source distances one source at a time, so all-pairs analyses only ever
+    hold one row in memory.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        sources (iterable, optional): The sources to search from, defaults to every vertex.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        sparse (bool): If True, rows are {vertex: distance} dicts of reachable vertices only.
+        workers (int): Worker processes, as in shortest_distance.
+        chunksize (int, optional): Sources per worker task, at most 32 by default. A parallel
+                                   scan holds up to 2 * workers * chunksize rows.
+
+    Yields:
+        tuple: (source, row). By default a row is a float64 array aligned with the iteration
+               order of g.vertices, with inf for unreachable vertices.
+    """
+
+    g, weights = _shared_weights(g, weights)
+    if sources is None:
+        sources = g.vertices
+
+    if workers == 1:
+        for source in sources:
+            yield source, _distance_row(g, source, weights, sparse)
+    else:
+        yield from map_sources(_distance_row, g, sources, workers=workers, chunksize=chunksize,
+                               max_chunksize=_ROWS_PER_TASK, weights=weights, sparse=sparse)
+
+def _distance_row(g, source, weights=None, sparse=False):
+    weighted = resolve_weights(g, weights) is not None
+    found = _bucket_search(g, weights, [source], 'auto') if weighted else None
+    if found is not None:
+        csr, dist, _ = found
+        row = _array_row(csr.labels, dist, sparse)
+        if sparse:
+            # the source is at 0 as in the heap search, not at 0.0 under float weights
+            row[source] = 0
+        return row
+
+    if not weighted and isinstance(g, CompactGraph):
+        dist, _ = frontier_bfs(g.offsets, g.indices, g.index[source])
+        return _array_row(g.labels, dist, sparse)
+
+    distances = shortest_distance(g, source, weights=weights)
+    if sparse:
+        return {v: d for v, d in distances.items() if d != float('inf')}
+    return np.fromiter(distances.values(), dtype=np.float64, count=len(distances))
+
+def _array_row(labels, dist, sparse):
+    """A distance array with -1 for unreachable ids as a row of iter_distances"""
+    if sparse:
+        reached = np.flatnonzero(dist >= 0)
+        return {labels[i]: d for i, d in zip(reached.tolist(), dist[reached].tolist())}
+    row = dist.astype(np.float64)
+    row[dist < 0] = np.inf
+    return row
+
+@profiled
+@cached
+def distance_matrix(g, sources, weights=None, workers=1, chunksize=None):
+    """
+    Computes distances from a batch of sources, such as routing landmarks, as one dense matrix.
+    The CSR view or normalized weights are set up once for the whole batch, and unweighted
+    batches run as simultaneous BFS searches that share every NumPy operation.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        sources (iterable): The source vertices, one matrix row each.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        workers (int): Worker processes, as in shortest_distance.
+        chunksize (int, optional): Sources per batched search or worker task.
+
+    Returns:
+        ndarray: A (len(sources), V) float64 matrix with columns in the iteration order of
+                 g.vertices and inf for unreachable vertices.
+    """
 
-    path_vertices = [target]
-    path_edges = []
+    sources = list(sources)
+    matrix = np.empty((len(sources), len(g.vertices)), dtype=np.float64)
 
-    current_vertex = target
-    while current_vertex != source:
-        predecessor = pred_map[current_vertex]
-        path_edges.insert(0, (predecessor, current_vertex))
-        path_vertices.insert(0, predecessor)
-        current_vertex = predecessor
+    if resolve_weights(g, weights) is None and workers == 1 and not isinstance(g, _VIEWS):
+        csr = _compact_view(g)
+        ids = [csr.index[source] for source in sources]
+        # batch only as many searches as keep the working arrays cache-sized
+        step = chunksize or max(1, min(len(ids), 2 ** 16 // max(csr.num_vertices, 1)))
+        for start in range(0, len(ids), step):
+            dist = batched_bfs(csr.offsets, csr.indices, ids[start:start + step])
+            block = matrix[start:start + len(dist)]
+            block[...] = dist
+            block[dist < 0] = np.inf
+        return matrix
 
+    rows = iter_distances(g, sources, weights, workers=workers, chunksize=chunksize)
+    for i, (_, row) in enumerate(rows):
+        matrix[i] = row
+    return matrix
+
+@profiled
+@cached
+def multi_source_distance(g, sources, target=None, weights=None, pred_map=False, queue='auto'):
+    """
+    Computes the distance from every vertex to its nearest source with a single BFS or
+    Dijkstra run seeded with all sources at distance 0, e.g. for nearest-facility queries.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        sources (iterable): The source vertices.
+        target (optional): A target vertex or an iterable of target vertices to report.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        pred_map (bool): If True, also return the predecessor map; following it from any
+                         vertex leads back to its nearest source.
+        queue (str): The priority queue of weighted searches, as in the single-source mode of
+                     shortest_distance.
+
+    Returns:
+        The distance map or the distance(s) to target, plus the predecessor map if pred_map
+        is True.
+    """
+
+    sources = list(sources)
+    space = SearchSpace(g, weights)
+    if space.weighted:
+        distances, predecessors = _dijkstra_distances(g, space, sources, weights, queue)
+    else:
+        distances, predecessors = _bfs_distances(g, sources)
+    return _select_targets(distances, predecessors, target, pred_map)
+
+@profiled
+@cached
+def shortest_path(g, source, target, weights=None, bidirectional=False):
+    """
+    Finds a shortest path between two vertices. The search stops as soon as the target is
+    settled, or, with bidirectional=True, once searches from both ends provably meet on a
+    shortest path. Directed graphs search backward along incoming edges.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        source: The start vertex.
+        target: The end vertex.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        bidirectional (bool): If True, run a bidirectional BFS or Dijkstra.
+
+    Returns:
+        tuple: (path_vertices, path_edges), both empty if target is unreachable or equal to
+               source.
+    """
+
+    if source == target:
+        return [], []
+
+    space = SearchSpace(g, weights)
+    if isinstance(g, _VIEWS) and not space.weighted:
+        # views already avoid stored edges; search them from one end
+        bidirectional = False
+    s, t = space.encode(source), space.encode(target)
+    if bidirectional:
+        if space.weighted:
+            found = bidirectional_dijkstra(space.weighted_neighbors, space.in_weighted_neighbors(), s, t)
+        else:
+            found = bidirectional_bfs(space.neighbors, space.in_neighbors(), s, t)
+        if found is None:
+            return [], []
+        path = build_path(*found)
+    elif space.weighted:
+        _, predecessors = dijkstra(space.weighted_neighbors, [s], t)
+    else:
+        _, predecessors = _bfs_search(g, space, s, t)
+    if not bidirectional:
+        if t not in predecessors:
+            return [], []
+        path = build_path(predecessors, None, t)
+
+    path_vertices = [space.decode(v) for v in path]
+    path_edges = list(zip(path_vertices, path_vertices[1:]))
     return path_vertices, path_edges
 
-def diameter(g, weights=None):
-    dist_map = shortest_distance(g, weights=weights)
+@profiled
+@cached
+def diameter(g, weights=None, workers=1, chunksize=None, method='all_pairs', tolerance=0, max_searches=None):
+    """
+    Finds the largest shortest distance in the graph and a pair of vertices realizing it.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing edges
+                                  weigh 1. Defaults to the weights attached to g, if any.
+        workers (int): Worker processes for the all-pairs scan.
+        chunksize (int, optional): Sources per worker task.
+        method (str): 'all_pairs' searches from every vertex. 'ifub' bounds the diameter of an
+                      unweighted graph with a few searches; see diameter_bounds.
+        tolerance (int): With 'ifub', stop once the bounds are this close and return the lower
+                         bound. 0 gives the exact diameter.
+        max_searches (int, optional): With 'ifub', a budget of BFS runs after which the lower
+                                      bound is returned.
+
+    Returns:
+        tuple: (max_distance, end_points). Graphs with unreachable pairs have an infinite
+               diameter.
+    """
 
+    if method == 'ifub':
+        if resolve_weights(g, weights) is not None:
+            raise ValueError("the 'ifub' diameter method requires an unweighted graph")
+        lower, _, end_points = diameter_bounds(g, tolerance, max_searches)
+        return lower, end_points
+    if method != 'all_pairs':
+        raise ValueError(f"unknown diameter method: {method!r}")
+    if isinstance(g, ProductGraph) and resolve_weights(g, weights) is None:
+        # the farthest pair of a product pairs up the farthest pairs of its factors
+        diameter1, ends1 = diameter(_unweighted(g.graph1), workers=workers, chunksize=chunksize)
+        diameter2, ends2 = diameter(_unweighted(g.graph2), workers=workers, chunksize=chunksize)
+        return _product_bounds(g, (diameter1, diameter1, ends1), (diameter2, diameter2, ends2))[::2]
+
+    labels = list(g.vertices)
+
+    # scan one distance row at a time; argmax keeps the first farthest target
     max_distance = 0
     end_points = ()
-    for source, value in dist_map.items():
-        for target, distance in value.items():
-            if distance > max_distance:
-                max_distance = distance
-                end_points = (source, target)
-    
+    for source, row in iter_distances(g, weights=weights, workers=workers, chunksize=chunksize):
+        if not len(row):
+            continue
+        i = int(np.argmax(row))
+        if row[i] > max_distance:
+            max_distance = row[i].item()
+            end_points = (source, labels[i])
+            if max_distance == float('inf'):
+                # nothing beats an unreachable pair, so the remaining rows are not needed
+                break
+
+    # rows are float64; report hop counts and integer-weighted lengths as ints
+    if integral_weights(resolve_weights(g, weights)) and max_distance != float('inf'):
+        max_distance = int(max_distance)
     return max_distance, end_points
+
+@profiled
+@cached
+def diameter_bounds(g, tolerance=0, max_searches=None):
+    """
+    Bounds the diameter of an unweighted graph with the iFUB algorithm, which typically needs
+    only a handful of BFS runs instead of one per vertex. Edge weights are ignored.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        tolerance (int): Stop once upper - lower <= tolerance. 0 gives the exact diameter.
+        max_searches (int, optional): Stop after this many BFS runs with the bounds reached so
+                                      far. The bounds are guaranteed either way.
+
+    Returns:
+        tuple: (lower, upper, end_points), where end_points realize the lower bound.
+    """
+
+    if isinstance(g, ProductGraph):
+        # a product's diameter is the sum of its factors' diameters, so the bounds add up
+        tolerance1 = tolerance // 2
+        return _product_bounds(g, diameter_bounds(_unweighted(g.graph1), tolerance1, max_searches),
+                               diameter_bounds(_unweighted(g.graph2), tolerance - tolerance1, max_searches))
+
+    csr = _csr(g)
+    lower, upper, ends = ifub(csr, tolerance, max_searches)
+    end_points = (csr.labels[ends[0]], csr.labels[ends[1]]) if lower else ()
+    return lower, upper, end_points
+
+def _product_bounds(g, bounds1, bounds2):
+    """Combines (lower, upper, end_points) of the two factors of a product view"""
+    if not len(g.vertices):
+        return 0, 0, ()
+    lower1, upper1, ends1 = bounds1
+    lower2, upper2, ends2 = bounds2
+    end_points = ()
+    if ends1 or ends2:
+        # a factor without a farthest pair contributes any vertex to both ends
+        v1, v2 = next(iter(g.graph1.vertices)), next(iter(g.graph2.vertices))
+        (a1, b1), (a2, b2) = ends1 or (v1, v1), ends2 or (v2, v2)
+        end_points = ((a1, a2), (b1, b2))
+    return lower1 + lower2, upper1 + upper2, end_points
+
+# Sampled statistics
+@profiled
+def average_path_length(g, samples=100, time_budget=None, strata=1, seed=None, weights=None, confidence=0.95):
+    """
+    Estimates the average shortest-path length over all ordered pairs of distinct vertices
+    where the second is reachable from the first, from searches out of a random sample of
+    sources.
+
+    Sources are drawn without replacement with a seeded generator, optionally stratified by
+    degree, and searched one at a time with the same engine as iter_distances. The estimate is
+    the ratio of the estimated total distance to the estimated number of reachable pairs,
+    with a normal confidence interval from the linearized ratio. Sampling every vertex gives
+    the exact value with a zero-width interval.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        samples (int, optional): The number of sources to search from; None for every vertex.
+        time_budget (float, optional): Stop drawing sources after this many seconds; at least
+                                       two sources per stratum are always searched.
+        strata (int): The number of degree strata. Vertices are split into this many groups
+                      of equal size by degree and each is sampled in proportion to its size,
+                      which narrows the intervals on graphs with skewed degrees.
+        seed (int, optional): Seed of the source sampling.
+        weights (dict, optional): Edge weights keyed by (v, u), as in shortest_distance.
+        confidence (float): The confidence level of the interval.
+
+    Returns:
+        Estimate: A (value, low, high, samples) named tuple. The value is nan if no pair is
+                  connected.
+    """
+
+    z = confidence_z(confidence)
+    totals = None
+    for stratum, sizes, _, row in _sampled_rows(g, samples, time_budget, strata, seed, weights):
+        if totals is None:
+            totals = StratifiedTotals(sizes, 2, 1)
+        reached = np.isfinite(row)
+        # the source itself is reached at distance 0, so it adds to the count but not the sum
+        totals.add(stratum, np.array([[row[reached].sum()], [reached.sum() - 1]]))
+    if totals is None:
+        return Estimate(float('nan'), float('nan'), float('nan'), 0)
+
+    (distance,), (pairs,) = totals.totals()
+    covariance = totals.covariance()[:, :, 0]
+    if pairs == 0:
+        return Estimate(float('nan'), float('nan'), float('nan'), totals.samples)
+    ratio = distance / pairs
+    variance = (covariance[0, 0] - 2 * ratio * covariance[0, 1] + ratio ** 2 * covariance[1, 1]) / pairs ** 2
+    return interval(ratio, variance, z, totals.samples)
+
+@profiled
+def eccentricity_distribution(g, samples=100, time_budget=None, strata=1, seed=None, weights=None,
+                              confidence=0.95):
+    """
+    Estimates the mean eccentricity and the share of vertices with each eccentricity from
+    searches out of a random sample of sources, drawn as in average_path_length. The
+    eccentricity of a vertex is its largest distance to another vertex, and inf if some
+    vertex is unreachable from it.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        samples, time_budget, strata, seed, weights, confidence: As in average_path_length.
+
+    Returns:
+        tuple: (mean, shares) with the mean eccentricity as an Estimate and a dict mapping
+               every eccentricity seen in the sample to an Estimate of the share of vertices
+               that have it, in increasing order of eccentricity.
+    """
+
+    z = confidence_z(confidence)
+    drawn = []
+    sizes = None
+    for stratum, sizes, _, row in _sampled_rows(g, samples, time_budget, strata, seed, weights):
+        drawn.append((stratum, row.max()))
+    if not drawn:
+        return Estimate(float('nan'), float('nan'), float('nan'), 0), {}
+
+    values = sorted({eccentricity for _, eccentricity in drawn})
+    column = {value: i for i, value in enumerate(values)}
+    shares = StratifiedTotals(sizes, 1, len(values))
+    mean = StratifiedTotals(sizes, 1, 1)
+    for stratum, eccentricity in drawn:
+        indicator = np.zeros((1, len(values)))
+        indicator[0, column[eccentricity]] = 1
+        shares.add(stratum, indicator)
+        mean.add(stratum, np.array([[eccentricity if np.isfinite(eccentricity) else 0.0]]))
+
+    num_vertices = float(np.sum(sizes))
+    samples = shares.samples
+    totals, variances = shares.totals()[0], shares.covariance()[0, 0]
+    distribution = {_number(value): interval(total / num_vertices, variance / num_vertices ** 2, z, samples)
+                    for value, total, variance in zip(values, totals.tolist(), variances.tolist())}
+    if np.isinf(values[-1]):
+        return Estimate(float('inf'), float('inf'), float('inf'), samples), distribution
+    return (interval(mean.totals()[0, 0] / num_vertices, mean.covariance()[0, 0, 0] / num_vertices ** 2, z, samples),
+            distribution)
+
+@profiled
+def closeness(g, samples=100, time_budget=None, strata=1, seed=None, weights=None, confidence=0.95):
+    """
+    Estimates the closeness centrality of every vertex from searches out of a random sample of
+    sources, drawn as in average_path_length, after Eppstein and Wang: one search from each
+    sampled source s yields d(s, v) for every v at once.
+
+    Closeness uses the distances into v, i.e. out of the other vertices, and the Wasserman and
+    Faust scaling for graphs that are not (strongly) connected:
+    (r / (n - 1)) * (r / D), where r vertices reach v at a total distance D. Both r and D are
+    estimated from the sample, and the interval of their ratio follows from the delta method.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        samples, time_budget, strata, seed, weights, confidence: As in average_path_length.
+
+    Returns:
+        dict: {vertex: Estimate} for every vertex, 0 for vertices that no other vertex reaches.
+    """
+
+    z = confidence_z(confidence)
+    totals = None
+    vertices = None
+    for stratum, sizes, source, row in _sampled_rows(g, samples, time_budget, strata, seed, weights):
+        if totals is None:
+            totals = StratifiedTotals(sizes, 2, len(row))
+            vertices = list(g.vertices)
+        reached = np.isfinite(row)
+        reached[source] = False
+        totals.add(stratum, np.stack((reached.astype(np.float64), np.where(reached, row, 0.0))))
+    if totals is None:
+        return {}
+
+    (reach, distance), covariance = totals.totals(), totals.covariance()
+    scale = max(len(vertices) - 1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.where(distance > 0, reach ** 2 / (scale * distance), 0.0)
+        # gradient of r^2 / ((n - 1) D) with respect to (r, D)
+        d_reach = np.where(distance > 0, 2 * reach / (scale * distance), 0.0)
+        d_distance = np.where(distance > 0, -value / distance, 0.0)
+        variance = (d_reach ** 2 * covariance[0, 0] + 2 * d_reach * d_distance * covariance[0, 1]
+                    + d_distance ** 2 * covariance[1, 1])
+    samples = totals.samples
+    return {v: interval(c, var, z, samples) for v, c, var in zip(vertices, value.tolist(), variance.tolist())}
+
+def _sampled_rows(g, samples, time_budget, strata, seed, weights):
+    """
+    Draws sources as described in average_path_length and yields (stratum, stratum sizes,
+    source position, distance row) for each, with rows aligned with g.vertices.
+    """
+
+    if samples is not None and samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples!r}")
+    if strata < 1:
+        raise ValueError(f"strata must be at least 1, got {strata!r}")
+    vertices = list(g.vertices)
+    if not vertices:
+        return
+    stratum = degree_strata(_degrees(g, vertices), strata) if strata > 1 else np.zeros(len(vertices), dtype=np.int64)
+    sizes = np.bincount(stratum)
+    order = sampling_order(stratum, np.random.default_rng(seed)).tolist()
+    if samples is not None:
+        # at least two sources per stratum, for its variance
+        order = order[:max(samples, 2 * len(sizes))]
+
+    minimum = min(2 * len(sizes), len(order))
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    rows = iter_distances(g, (vertices[i] for i in order), weights=weights)
+    for k, (i, (_, row)) in enumerate(zip(order, rows)):
+        yield int(stratum[i]), sizes, i, row
+        if deadline is not None and k + 1 >= minimum and time.perf_counter() >= deadline:
+            break
+
+def _degrees(g, vertices):
+    """Out-degrees aligned with vertices"""
+    if isinstance(g, CompactGraph):
+        return np.diff(g.offsets)
+    adj_list = g.adj_list
+    return np.fromiter((len(adj_list[v]) for v in vertices), dtype=np.int64, count=len(vertices))
+
+def _number(value):
+    """A distance as an int when it is integral, as the exact searches report it"""
+    return int(value) if np.isfinite(value) and value == int(value) else float(value)
+
+# Components
+@profiled
+def connected_components(g):
+    """
+    Finds the connected components of a graph, or the weakly connected components of a
+    directed graph, with an array-backed union-find.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+
+    Returns:
+        tuple: (count, labels) where labels is an int64 array of component ids aligned with
+               the iteration order of g.vertices, numbered in order of first vertex.
+    """
+
+    return _components(g, strong=False)
+
+@profiled
+def strongly_connected_components(g):
+    """
+    Finds the strongly connected components of a graph with an iterative Tarjan search. They
+    are the connected components of an undirected graph.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+
+    Returns:
+        tuple: (count, labels) where labels is an int64 array of component ids aligned with
+               the iteration order of g.vertices, numbered in order of first vertex.
+    """
+
+    return _components(g, strong=True)
+
+@profiled
+def component_graph(g, vertex, strong=False):
+    """
+    Return the component containing a vertex as a CompactGraph, with the attached weights of
+    its edges. Every distance function accepts it, so all-pairs distances and diameters can
+    be computed one component at a time instead of across unreachable pairs.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        vertex: A vertex of the component.
+        strong (bool): If True, use the strongly connected component of a directed graph
+                       instead of the weakly connected one.
+
+    Returns:
+        CompactGraph: The subgraph induced by the component.
+    """
+
+    csr = _csr(g)
+    _, labels = _csr_components(csr, strong)
+    return csr._induced(labels == labels[csr.index[vertex]])
+
+def _components(g, strong):
+    if isinstance(g, ProductGraph):
+        # reachability in a product is reachability in both factors at once
+        count1, labels1 = _components(g.graph1, strong)
+        count2, labels2 = _components(g.graph2, strong)
+        return count1 * count2, (labels1[:, None] * count2 + labels2[None, :]).ravel()
+    return _csr_components(_csr(g), strong)
+
+def _csr_components(csr, strong):
+    if strong and csr.directed:
+        return strong_components(csr.offsets, csr.indices)
+    return weak_components(csr.offsets, csr.indices)
+
+# Graph comparison
+
+# graphs up to this size also compare BFS distance fingerprints when refinement leaves ties
+_FINGERPRINT_MAX_VERTICES = 2048
+
+@profiled
+def isomorphism(g1, g2):
+    """
+    Finds an isomorphism between two graphs: a bijection between their vertices that maps
+    edges onto edges, in the same direction for directed graphs. Vertex labels and edge
+    weights are ignored.
+
+    Cheap invariants are compared first: the vertex and edge counts, the degree sequences and
+    the Weisfeiler-Lehman color classes, which most non-isomorphic pairs already fail. For
+    graphs of up to a few thousand vertices whose refined colors still tie, the multisets of
+    BFS distances from every vertex split the classes further. A VF2-style backtracking search
+    then only pairs vertices of the same color.
+
+    Parameters:
+        g1 (Graph or CompactGraph): The first graph.
+        g2 (Graph or CompactGraph): The second graph.
+
+    Returns:
+        dict: {v1: v2} mapping every vertex of g1 to a vertex of g2, or None if the graphs are
+              not isomorphic.
+    """
+
+    csr1, csr2 = _csr(g1), _csr(g2)
+    if (csr1.directed != csr2.directed or csr1.num_vertices != csr2.num_vertices
+            or len(csr1.indices) != len(csr2.indices)):
+        return None
+    if not np.array_equal(_degree_sequence(csr1), _degree_sequence(csr2)):
+        return None
+
+    colors1, colors2 = refine_colors(csr1), refine_colors(csr2)
+    if not np.array_equal(np.sort(colors1), np.sort(colors2)):
+        return None
+    if len(np.unique(colors1)) < csr1.num_vertices and csr1.num_vertices <= _FINGERPRINT_MAX_VERTICES:
+        colors1 = refine_colors(csr1, distance_fingerprints(csr1) ^ colors1)
+        colors2 = refine_colors(csr2, distance_fingerprints(csr2) ^ colors2)
+        if not np.array_equal(np.sort(colors1), np.sort(colors2)):
+            return None
+
+    mapping = match(csr1, csr2, colors1, colors2)
+    if mapping is None:
+        return None
+    labels1, labels2 = csr1.labels, csr2.labels
+    return {labels1[i]: labels2[j] for i, j in enumerate(mapping.tolist())}
+
+def is_isomorphic(g1, g2):
+    """
+    Tests whether two graphs are isomorphic, ignoring vertex labels and edge weights.
+
+    Parameters:
+        g1 (Graph or CompactGraph): The first graph.
+        g2 (Graph or CompactGraph): The second graph.
+
+    Returns:
+        bool: True if isomorphism(g1, g2) finds a mapping.
+    """
+
+    return isomorphism(g1, g2) is not None
+
+@profiled
+@cached
+def graph_hash(g, iterations=None):
+    """
+    Computes a Weisfeiler-Lehman hash of a graph's structure, in time near-linear in its size.
+
+    Isomorphic graphs always get the same hash, so graphs can be bucketed by hash and only
+    compared with is_isomorphic within a bucket. Different graphs usually get different hashes,
+    but not always: color refinement cannot tell apart, for example, two regular graphs of the
+    same degree and size. Vertex labels and edge weights are ignored.
+
+    Parameters:
+        g (Graph or CompactGraph): The input graph.
+        iterations (int, optional): The number of refinement rounds. By default rounds run
+                                    until the color classes stop splitting.
+
+    Returns:
+        str: A 32-character hexadecimal digest.
+    """
+
+    csr = _csr(g)
+    colors = np.sort(refine_colors(csr, rounds=iterations))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray([csr.directed, csr.num_vertices, len(csr.indices)], dtype='<i8').tobytes())
+    digest.update(colors.astype('<u8').tobytes())
+    return digest.hexdigest()
+
+def _degree_sequence(csr):
+    """Sorted out-degrees, paired with in-degrees for directed graphs"""
+    out_degrees = np.diff(csr.offsets)
+    if not csr.directed:
+        return np.sort(out_degrees)
+    in_degrees = np.bincount(csr.indices, minlength=csr.num_vertices)
+    return np.sort(out_degrees * (len(csr.indices) + 1) + in_degrees)
@@ -0,0 +1,172 @@
+import numpy as np
+
+from pygraphnet.profiling import _active, count, peak
+
+def frontier_bfs(offsets, indices, sources):
+    """
+    Level-synchronous breadth-first search over CSR arrays.
+
+    Each level expands the whole frontier at once with NumPy operations instead of
+    popping one vertex at a time. Vertices in a level are kept in discovery order and a
+    vertex's predecessor is the first frontier vertex that reaches it, so the result is
+    identical to a FIFO queue BFS visiting neighbors in CSR order.
+
+    Parameters:
+        offsets (ndarray): CSR offsets, of length num_vertices + 1.
+        indices (ndarray): CSR neighbor ids.
+        sources (int or array-like): Id(s) of the source vertices, all at distance 0.
+
+    Returns:
+        tuple: (dist, pred) int64 arrays indexed by vertex id. Unreachable vertices have
+               a distance of -1; sources and unreachable vertices have a predecessor of -1.
+    """
+
+    num_vertices = len(offsets) - 1
+    dist = np.full(num_vertices, -1, dtype=np.int64)
+    pred = np.full(num_vertices, -1, dtype=np.int64)
+
+    frontier = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    dist[frontier] = 0
+    level = 0
+    scanned = reached = widest = 0
+    while len(frontier):
+        level += 1
+        reached += len(frontier)
+        widest = max(widest, len(frontier))
+        positions, counts = _gather(offsets, frontier)
+        scanned += len(positions)
+        if not len(positions):
+            break
+
+        neighbors = indices[positions].astype(np.int64, copy=False)
+        parents = np.repeat(frontier, counts)
+
+        unvisited = dist[neighbors] < 0
+        neighbors = neighbors[unvisited]
+        parents = parents[unvisited]
+
+        # first occurrence of each newly reached vertex, kept in discovery order
+        _, first = np.unique(neighbors, return_index=True)
+        first.sort()
+        frontier = neighbors[first]
+        dist[frontier] = level
+        pred[frontier] = parents[first]
+
+    if _active:
+        count('bfs.searches')
+        count('bfs.levels', level)
+        count('bfs.vertices_reached', reached)
+        count('bfs.edges_scanned', scanned)
+        peak('bfs.frontier', widest)
+    return dist, pred
+
+def batched_bfs(offsets, indices, sources):
+    """
+    Breadth-first searches from many sources at once. The frontier holds (source, vertex)
+    pairs encoded as ``row * num_vertices + vertex`` so that every level of every search is
+    expanded by the same handful of NumPy operations.
+
+    Parameters:
+        offsets (ndarray): CSR offsets, of length num_vertices + 1.
+        indices (ndarray): CSR neighbor ids.
+        sources (array-like): Source ids, one search per entry.
+
+    Returns:
+        ndarray: (len(sources), num_vertices) int64 distances, -1 where unreachable.
+    """
+
+    num_vertices = len(offsets) - 1
+    sources = np.asarray(sources, dtype=np.int64)
+    dist = np.full(len(sources) * num_vertices, -1, dtype=np.int64)
+
+    frontier = np.arange(len(sources), dtype=np.int64) * num_vertices + sources
+    dist[frontier] = 0
+    level = 0
+    scanned = widest = 0
+    while len(frontier):
+        level += 1
+        widest = max(widest, len(frontier))
+        vertices = frontier % num_vertices
+        positions, counts = _gather(offsets, vertices)
+        scanned += len(positions)
+        if not len(positions):
+            break
+
+        reached = indices[positions] + np.repeat(frontier - vertices, counts)
+        reached = reached[dist[reached] < 0]
+
+        # deduplicate without sorting: tag each hit with a unique negative code, and
+        # whichever tag survives a repeated write marks exactly one copy of that pair
+        tags = -2 - np.arange(len(reached), dtype=np.int64)
+        dist[reached] = tags
+        frontier = reached[dist[reached] == tags]
+        dist[frontier] = level
+
+    if _active:
+        count('batched_bfs.searches', len(sources))
+        count('batched_bfs.levels', level)
+        count('batched_bfs.edges_scanned', scanned)
+        peak('batched_bfs.frontier', widest)
+    return dist.reshape(len(sources), num_vertices)
+
+def _gather(offsets, vertices):
+    """
+    Return the positions in the CSR `indices` of the neighbors of every vertex, concatenated
+    in the order of vertices, and the number of neighbors of each.
+    """
+
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    run_starts = np.cumsum(counts) - counts
+    positions = np.arange(int(counts.sum()), dtype=np.int64) + np.repeat(starts - run_starts, counts)
+    return positions, counts
+
+def complement_bfs(excluded, vertices, sources, target=None):
+    """
+    Breadth-first search over the complement of a graph without materializing it. Vertices
+    not reached yet are kept in one unvisited set; expanding v moves every unvisited vertex
+    outside excluded(v) to the next level. A vertex scanned but kept is a neighbor of v in the
+    underlying graph, so a full search costs O(V + E) rather than O(V^2).
+
+    Parameters:
+        excluded (callable): Returns the neighbors of v in the underlying graph, as a set.
+        vertices (iterable): The vertices of the graph.
+        sources (iterable): Source vertices, all at distance 0.
+        target (optional): Stop as soon as this vertex is discovered.
+
+    Returns:
+        tuple: (distances, predecessors) dicts covering the discovered vertices.
+    """
+
+    distances = {source: 0 for source in sources}
+    predecessors = {source: None for source in distances}
+    if target in distances:
+        return distances, predecessors
+
+    unvisited = set(vertices).difference(distances)
+    frontier = list(distances)
+    level = 0
+    scanned = 0
+    while frontier and unvisited:
+        level += 1
+        next_frontier = []
+        for v in frontier:
+            neighbors = excluded(v)
+            scanned += len(unvisited)
+            reached = [u for u in unvisited if u not in neighbors]
+            if not reached:
+                continue
+            unvisited.difference_update(reached)
+            for u in reached:
+                distances[u] = level
+                predecessors[u] = v
+            if target is not None and target in distances:
+                return distances, predecessors
+            next_frontier.extend(reached)
+        frontier = next_frontier
+
+    if _active:
+        count('complement_bfs.searches')
+        count('complement_bfs.vertices_reached', len(distances))
+        count('complement_bfs.unvisited_scanned', scanned)
+    return distances, predecessors
@@ -0,0 +1,113 @@
+import numpy as np
+
+from pygraphnet.profiling import _active, count, peak
+from ._bfs import _gather
+
+def bucket_dijkstra(offsets, indices, weights, sources, delta):
+    """
+    Shortest distances over weighted CSR arrays with a bucket queue (delta-stepping).
+
+    Tentative distances are grouped into buckets of width delta. The lowest non-empty bucket
+    is settled by relaxing the out-edges of all its vertices at once with NumPy operations,
+    re-relaxing the vertices whose distance drops within the same bucket, until it empties;
+    vertices pushed further out wait in the pending list. No heap and no decrease-key are
+    needed. With integer weights and a delta of 1 this is Dial's algorithm: each bucket
+    holds one distance value and, for positive weights, is settled in a single pass.
+
+    Parameters:
+        offsets (ndarray): CSR offsets, of length num_vertices + 1.
+        indices (ndarray): CSR neighbor ids.
+        weights (ndarray): Non-negative integer or float weights parallel to indices.
+        sources (int or array-like): Id(s) of the source vertices, all at distance 0.
+        delta: The bucket width, a positive number.
+
+    Returns:
+        tuple: (dist, pred) arrays indexed by vertex id, dist in the dtype of weights (int64
+               or float64). Unreachable vertices have a distance of -1; sources and
+               unreachable vertices have a predecessor of -1.
+    """
+
+    num_vertices = len(offsets) - 1
+    integral = weights.dtype.kind in 'iub'
+    dtype = np.int64 if integral else np.float64
+    unreached = np.iinfo(np.int64).max if integral else np.inf
+    weights = weights.astype(dtype, copy=False)
+
+    dist = np.full(num_vertices, unreached, dtype=dtype)
+    pred = np.full(num_vertices, -1, dtype=np.int64)
+    settled = np.zeros(num_vertices, dtype=bool)
+    queued = np.zeros(num_vertices, dtype=bool)
+    pending = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    dist[pending] = 0
+    queued[pending] = True
+
+    buckets = passes = relaxed = longest = 0
+    while len(pending):
+        pending = pending[~settled[pending]]
+        if not len(pending):
+            break
+        buckets += 1
+        longest = max(longest, len(pending))
+        # select by bucket index: with float weights, (index + 1) * delta can round down to
+        # the smallest distance and leave the bucket empty
+        bucket_index = dist[pending] // delta
+        current = bucket_index.min()
+        inside = bucket_index == current
+        frontier = pending[inside]
+        pending = pending[~inside]
+        queued[frontier] = False
+
+        while len(frontier):
+            passes += 1
+            settled[frontier] = True
+            positions, counts = _gather(offsets, frontier)
+            relaxed += len(positions)
+            if not len(positions):
+                break
+
+            targets = indices[positions].astype(np.int64, copy=False)
+            new_dist = np.repeat(dist[frontier], counts) + weights[positions]
+            better = new_dist < dist[targets]
+            if not better.any():
+                break
+
+            # keep the shortest candidate per target; the stable sort keeps the first parent
+            parents = np.repeat(frontier, counts)[better]
+            targets, new_dist = targets[better], new_dist[better]
+            order = np.argsort(new_dist, kind='stable')
+            targets, first = np.unique(targets[order], return_index=True)
+            dist[targets] = new_dist[order[first]]
+            pred[targets] = parents[order[first]]
+
+            # improvements inside the bucket are relaxed again right away
+            again = dist[targets] // delta == current
+            frontier = targets[again]
+            later = targets[~again]
+            later = later[~queued[later]]
+            queued[later] = True
+            pending = np.concatenate((pending, later))
+
+    if _active:
+        count('buckets.searches')
+        count('buckets.buckets', buckets)
+        count('buckets.passes', passes)
+        count('buckets.edges_relaxed', relaxed)
+        peak('buckets.pending', longest)
+    dist[dist == unreached] = -1
+    return dist, pred
+
+def bucket_width(weights, offsets, queue='delta'):
+    """
+    The bucket width for bucket_dijkstra: 1 for Dial's algorithm, otherwise the largest
+    weight divided by the average out-degree, after Meyer and Sanders, which keeps buckets
+    full enough to vectorize without relaxing most edges more than once.
+    """
+
+    if queue == 'dial':
+        return 1
+    num_vertices = max(len(offsets) - 1, 1)
+    max_weight = weights.max() if len(weights) else 1
+    width = max_weight / max(len(weights) / num_vertices, 1)
+    if weights.dtype.kind in 'iub':
+        return max(int(width), 1)
+    return width if width > 0 else 1.0
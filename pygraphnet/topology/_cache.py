@@ -0,0 +1,132 @@
+import functools
+import inspect
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from pygraphnet.profiling import _active, count
+
+class QueryCache:
+    """Least-recently-used cache of topology query results
+
+    Once attached to a graph, shortest_distance, multi_source_distance, distance_matrix,
+    shortest_path, diameter and diameter_bounds look their results up here before computing
+    them. Entries are keyed on the graph, its mutation version, the function and its
+    arguments, with the weights argument keyed by identity. Any mutation bumps the version,
+    so a stale result can never be returned; entries of old versions simply age out.
+
+    Cached results are shared between callers and must not be modified. Weight dicts passed
+    explicitly are treated as immutable while their results are cached; weights attached to
+    a Graph are covered by its version.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Parameters:
+            maxsize (int): The number of results kept before the least recently used is evicted.
+        """
+
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize!r}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._views = {}
+        self._computing = False
+
+    def __reduce__(self):
+        # worker processes get an empty cache rather than a copy of every entry
+        return QueryCache, (self.maxsize,)
+
+    def attach(self, g):
+        """Starts caching the queries made on g, returning g"""
+        g.query_cache = self
+        return g
+
+    def stats(self):
+        """Return the hit, miss and eviction counts and the current and maximum sizes"""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """Drops every cached result and resets the statistics"""
+        self._entries.clear()
+        self._views.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def call(self, func, key, g, kwargs):
+        """Return func(g, **kwargs), computed only if key is not cached yet"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            if _active:
+                count('cache.hits')
+            self._entries.move_to_end(key)
+            return entry[-1]
+
+        self.misses += 1
+        if _active:
+            count('cache.misses')
+        # nested topology calls made while computing are not cached separately
+        self._computing = True
+        try:
+            result = func(g, **kwargs)
+        finally:
+            self._computing = False
+
+        # the entry holds the graph and weights, so the ids in its key cannot be reused
+        self._entries[key] = (g, kwargs.get('weights'), result)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def view(self, g, build):
+        """Return the view build(g) made at g's current version, building it once per version"""
+        entry = self._views.get(id(g))
+        if entry is None or entry[0] is not g or entry[1] != g.version:
+            entry = self._views[id(g)] = (g, g.version, build(g))
+        return entry[2]
+
+def cached(func):
+    """Routes calls of a topology function through the QueryCache attached to its graph"""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(g, *args, **kwargs):
+        cache = getattr(g, 'query_cache', None)
+        if cache is None or cache._computing:
+            return func(g, *args, **kwargs)
+
+        bound = signature.bind(g, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments[next(iter(signature.parameters))]
+        key = _cache_key(func, g, arguments)
+        if key is None:
+            return func(g, *args, **kwargs)
+        return cache.call(func, key, g, arguments)
+
+    return wrapper
+
+def _cache_key(func, g, arguments):
+    """(function, graph, version, arguments) with weights by identity, or None if unhashable"""
+    items = []
+    for name, value in arguments.items():
+        if name == 'weights':
+            value = None if value is None else id(value)
+        elif isinstance(value, list):
+            # lists of sources or targets are keyed by their contents
+            value = ('list', tuple(value))
+        elif isinstance(value, Iterator):
+            # a consumed iterator would not mean the same thing twice
+            return None
+        items.append((name, value))
+
+    key = (func.__qualname__, id(g), g.version, tuple(items))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -0,0 +1,119 @@
+import numpy as np
+
+def weak_components(offsets, indices):
+    """
+    Weakly connected components of a CSR graph with an array-backed union-find.
+
+    Every round hooks the larger root of each edge onto the smaller one, then compresses the
+    paths by pointer jumping until every vertex points at its root, all as whole-array NumPy
+    operations. Parents only ever decrease, so no cycle can form, and a round without a
+    hook means every edge lies within one tree.
+
+    Parameters:
+        offsets (ndarray): CSR row offsets.
+        indices (ndarray): CSR neighbor ids.
+
+    Returns:
+        tuple: (count, labels) with an int64 component id per vertex, numbered in order of
+               each component's first vertex.
+    """
+
+    num_vertices = len(offsets) - 1
+    parent = np.arange(num_vertices, dtype=np.int64)
+    src = np.repeat(parent, np.diff(offsets))
+    dst = indices.astype(np.int64)
+    while True:
+        root_src, root_dst = parent[src], parent[dst]
+        crossing = root_src != root_dst
+        if not crossing.any():
+            break
+        # edges inside a tree never need hooking again
+        src, dst = src[crossing], dst[crossing]
+        low = np.minimum(root_src[crossing], root_dst[crossing])
+        high = np.maximum(root_src[crossing], root_dst[crossing])
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # roots are the smallest id of their component, so sorted roots follow first vertices
+    roots, labels = np.unique(parent, return_inverse=True)
+    return len(roots), labels.astype(np.int64)
+
+def strong_components(offsets, indices):
+    """
+    Strongly connected components of a CSR graph with Tarjan's algorithm, run with an explicit
+    stack of (vertex, next edge) frames so deep graphs never hit the recursion limit.
+
+    Parameters:
+        offsets (ndarray): CSR row offsets.
+        indices (ndarray): CSR neighbor ids.
+
+    Returns:
+        tuple: (count, labels) with an int64 component id per vertex, numbered in order of
+               each component's first vertex.
+    """
+
+    num_vertices = len(offsets) - 1
+    offsets = offsets.tolist()
+    indices = indices.tolist()
+    order = [-1] * num_vertices
+    low = [0] * num_vertices
+    on_stack = [False] * num_vertices
+    component = [0] * num_vertices
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(num_vertices):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        frames = [(root, offsets[root])]
+        while frames:
+            v, position = frames[-1]
+            end = offsets[v + 1]
+            while position < end:
+                w = indices[position]
+                position += 1
+                if order[w] < 0:
+                    # descend into w and come back to v's next edge afterwards
+                    frames[-1] = (v, position)
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    frames.append((w, offsets[w]))
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                frames.pop()
+                if low[v] == order[v]:
+                    # v roots a component made of everything above it on the stack
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+                if frames:
+                    parent = frames[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+
+    return count, _by_first_vertex(np.asarray(component, dtype=np.int64), count)
+
+def _by_first_vertex(labels, count):
+    """Renumbers component ids in order of each component's first vertex"""
+    first = np.full(count, len(labels), dtype=np.int64)
+    np.minimum.at(first, labels, np.arange(len(labels), dtype=np.int64))
+    rank = np.empty(count, dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(count, dtype=np.int64)
+    return rank[labels]
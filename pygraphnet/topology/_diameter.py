@@ -0,0 +1,93 @@
+import numpy as np
+
+from pygraphnet.profiling import phase
+from ._bfs import frontier_bfs
+
+def ifub(graph, tolerance=0, max_searches=None, sweeps=4):
+    """
+    Diameter bounds of an unweighted CompactGraph with the iFUB algorithm (DiFUB for directed
+    graphs).
+
+    A few farthest-first sweeps pick a central vertex u. Every pair at distance greater than 2(i - 1)
+    has an endpoint at least i levels away from u, so sweeping the BFS levels of u from the
+    outside in, and searching from the vertices of each level, proves the diameter after a
+    handful of searches on most real graphs.
+
+    Parameters:
+        graph (CompactGraph): The input graph.
+        tolerance (int): Stop once upper - lower <= tolerance. 0 gives the exact diameter.
+        max_searches (int, optional): Stop after this many BFS runs and report the bounds
+                                      reached so far.
+        sweeps (int): Number of searches used to pick the start vertex.
+
+    Returns:
+        tuple: (lower, upper, (x, y)) where d(x, y) == lower, with vertex ids for x and y.
+               Graphs that are not (strongly) connected have lower == upper == inf.
+    """
+
+    num_vertices = graph.num_vertices
+    if num_vertices == 0:
+        return 0, 0, None
+
+    reverse = graph.reverse()
+    def forward(i):
+        return frontier_bfs(graph.offsets, graph.indices, i)
+    def backward(i):
+        return frontier_bfs(reverse.offsets, reverse.indices, i)
+
+    with phase('sweeps'):
+        # farthest-first sweeps from the highest-degree vertex; the vertex closest to the
+        # farthest of them all is a good central start and every sweep raises the lower bound
+        r = int(np.argmax(np.diff(graph.offsets)))
+        dist_r, _ = forward(r)
+        if (dist_r < 0).any():
+            return float('inf'), float('inf'), (r, int(np.argmin(dist_r)))
+        lower, ends = int(dist_r.max()), (r, int(np.argmax(dist_r)))
+        nearest, spread = dist_r, dist_r
+        for _ in range(sweeps):
+            x = int(np.argmax(nearest))
+            dist_x, _ = forward(x)
+            if (dist_x < 0).any():
+                return float('inf'), float('inf'), (x, int(np.argmin(dist_x)))
+            if dist_x.max() > lower:
+                lower, ends = int(dist_x.max()), (x, int(np.argmax(dist_x)))
+            nearest, spread = np.minimum(nearest, dist_x), np.maximum(spread, dist_x)
+        u = int(np.argmin(spread))
+
+    forward_u, _ = forward(u)
+    backward_u = backward(u)[0] if graph.directed else forward_u
+    if (forward_u < 0).any():
+        return float('inf'), float('inf'), (u, int(np.argmin(forward_u)))
+    if (backward_u < 0).any():
+        return float('inf'), float('inf'), (int(np.argmin(backward_u)), u)
+
+    for x, y, d in ((u, int(np.argmax(forward_u)), forward_u.max()),
+                    (int(np.argmax(backward_u)), u, backward_u.max())):
+        if d > lower:
+            lower, ends = int(d), (x, y)
+
+    level = int(max(forward_u.max(), backward_u.max()))
+    upper = 2 * level
+    searches = sweeps + (3 if graph.directed else 2)
+    with phase('fringe'):
+        while upper - lower > tolerance and level > 0:
+            # sources at distance `level` to u, then (directed only) targets at distance `level` from u
+            fringe = [(x, True) for x in np.flatnonzero(backward_u == level).tolist()]
+            if graph.directed:
+                fringe += [(y, False) for y in np.flatnonzero(forward_u == level).tolist()]
+
+            for v, outward in fringe:
+                if max_searches is not None and searches >= max_searches:
+                    # the current level is unfinished, so `upper` still bounds the diameter
+                    return lower, upper, ends
+                searches += 1
+                dist, _ = forward(v) if outward else backward(v)
+                w = int(np.argmax(dist))
+                if dist[w] > lower:
+                    lower, ends = int(dist[w]), ((v, w) if outward else (w, v))
+
+            # every remaining pair is within level - 1 of u on both sides
+            level -= 1
+            upper = max(lower, 2 * level)
+
+    return lower, upper, ends
@@ -0,0 +1,212 @@
+import heapq
+import itertools
+
+from pygraphnet.profiling import _active, count
+
+class DynamicDistances:
+    """Single-source shortest distances kept up to date as a graph changes
+
+    The structure subscribes to the mutations of a Graph and repairs its distance and
+    predecessor maps in the style of Ramalingam and Reps instead of searching again:
+
+    - An inserted edge, or an edge whose weight went down, that shortens the path to its head
+      starts a Dijkstra search from the head that only visits vertices whose distance drops.
+    - A deleted edge, or an edge whose weight went up, only matters if it is on the shortest
+      path tree. Its head first looks for another in-neighbor that keeps its distance.
+      Otherwise its subtree is cut off, each vertex of the subtree is reattached through its
+      best in-neighbor outside the subtree, and a Dijkstra search restricted to the subtree
+      settles the rest.
+
+    Distances count hops, or follow the weights attached to the graph with set_weights.
+    """
+
+    def __init__(self, g, source, check=False):
+        """
+        Parameters:
+            g (Graph): The graph to follow.
+            source: The source vertex.
+            check (bool): If True, every repair is verified against a full recomputation and
+                          a RuntimeError is raised on any difference. Meant for tests.
+        """
+
+        if source not in g.vertices:
+            raise KeyError(source)
+        self.graph = g
+        self.source = source
+        self.check = check
+        self.distances = {}
+        self.predecessors = {}
+        self.recompute()
+        g.subscribe(self._on_mutation)
+
+    def close(self):
+        """Stops following the graph's mutations"""
+        self.graph.unsubscribe(self._on_mutation)
+
+    def recompute(self):
+        """Rebuilds the distance and predecessor maps from scratch"""
+        from pygraphnet.topology import shortest_distance
+
+        if self.source not in self.graph.vertices:
+            self.distances = {v: float('inf') for v in self.graph.vertices}
+            self.predecessors = {v: None for v in self.graph.vertices}
+            return
+        self.distances, self.predecessors = shortest_distance(self.graph, self.source, pred_map=True)
+
+    def verify(self):
+        """
+        Checks the maintained maps against a full recomputation.
+
+        Raises:
+            RuntimeError: If a distance differs, or a predecessor does not lie on a shortest path.
+        """
+
+        from pygraphnet.topology import shortest_distance
+
+        g = self.graph
+        if self.source in g.vertices:
+            expected = shortest_distance(g, self.source)
+        else:
+            expected = {v: float('inf') for v in g.vertices}
+        if self.distances != expected:
+            wrong = [v for v in expected if self.distances.get(v) != expected[v]]
+            raise RuntimeError(f"maintained distances differ from a recomputation at {wrong[:10]!r}")
+
+        for v, p in self.predecessors.items():
+            if p is None:
+                continue
+            if v not in g.adj_list[p] or self.distances[p] + self._weight(p, v) != self.distances[v]:
+                raise RuntimeError(f"predecessor {p!r} of {v!r} is not on a shortest path")
+
+    # Mutation handling
+    def _on_mutation(self, event, *args):
+        if event == 'add_vertex':
+            self._add_vertex(*args)
+        elif event == 'del_vertex':
+            self._delete_vertex(*args)
+        elif event in ('add_edge', 'del_edge'):
+            self._update_edges([args])
+        elif event == 'add_edges':
+            new_vertices, edges = args
+            for v in new_vertices:
+                self._add_vertex(v)
+            self._update_edges(edges)
+        else:
+            self.recompute()
+
+        if self.check:
+            self.verify()
+
+    def _add_vertex(self, v):
+        self.distances[v] = float('inf')
+        self.predecessors[v] = None
+
+    def _update_edges(self, edges):
+        directed = self.graph.directed
+        for v, u in edges:
+            self._update_edge(v, u)
+            if not directed:
+                self._update_edge(u, v)
+
+    def _delete_vertex(self, v, successors):
+        self.distances.pop(v, None)
+        self.predecessors.pop(v, None)
+        if v == self.source:
+            self.recompute()
+            return
+        self._repair([u for u in successors if u != v and self.predecessors.get(u) == v])
+
+    def _update_edge(self, v, u):
+        """Repairs the maps after the edge (v, u) was inserted, deleted or re-weighted"""
+        g = self.graph
+        distances = self.distances
+        present = v in g.adj_list and u in g.adj_list[v]
+        if self.predecessors.get(u) == v and v != u:
+            if not present or distances[v] + self._weight(v, u) > distances[u]:
+                self._repair([u])
+        if present and distances[v] + self._weight(v, u) < distances[u]:
+            self._decrease(u, v, distances[v] + self._weight(v, u))
+
+    def _weight(self, v, u):
+        adj_weights = self.graph.adj_weights
+        return 1 if adj_weights is None else adj_weights[v][u]
+
+    def _decrease(self, u, parent, distance):
+        """Propagates a shorter distance to u through every vertex it improves"""
+        distances, predecessors = self.distances, self.predecessors
+        adj_list = self.graph.adj_list
+        tie = itertools.count()
+        queue = [(distance, next(tie), u, parent)]
+        updated = 0
+        while queue:
+            dist, _, current_vertex, parent = heapq.heappop(queue)
+            if dist >= distances[current_vertex]:
+                continue
+            updated += 1
+            distances[current_vertex] = dist
+            predecessors[current_vertex] = parent
+            for neighbor in adj_list[current_vertex]:
+                new_dist = dist + self._weight(current_vertex, neighbor)
+                if new_dist < distances[neighbor]:
+                    heapq.heappush(queue, (new_dist, next(tie), neighbor, current_vertex))
+        if _active:
+            count('dynamic.decreases')
+            count('dynamic.vertices_decreased', updated)
+
+    def _repair(self, roots):
+        """Recomputes the distances of the shortest path subtrees hanging from roots"""
+        g = self.graph
+        distances, predecessors = self.distances, self.predecessors
+
+        if len(roots) == 1:
+            # a root that can keep its distance through another in-neighbor keeps its subtree.
+            # Over a positive weight that neighbor cannot be one of its descendants; with
+            # several roots it could still hang below another root, so this is skipped.
+            u, = roots
+            for p in g.in_neighbors(u):
+                weight = self._weight(p, u)
+                if p != predecessors[u] and weight > 0 and distances[p] + weight == distances[u]:
+                    predecessors[u] = p
+                    return
+
+        affected = set(roots)
+        stack = list(roots)
+        while stack:
+            current_vertex = stack.pop()
+            for neighbor in g.adj_list[current_vertex]:
+                if neighbor not in affected and predecessors.get(neighbor) == current_vertex:
+                    affected.add(neighbor)
+                    stack.append(neighbor)
+        if _active:
+            count('dynamic.repairs')
+            count('dynamic.vertices_repaired', len(affected))
+
+        # distances only grow, so vertices outside the subtree are final
+        inf = float('inf')
+        for v in affected:
+            distances[v] = inf
+            predecessors[v] = None
+        tie = itertools.count()
+        queue = []
+        for v in affected:
+            for p in g.in_neighbors(v):
+                if p not in affected:
+                    new_dist = distances[p] + self._weight(p, v)
+                    if new_dist < distances[v]:
+                        distances[v] = new_dist
+                        predecessors[v] = p
+            if distances[v] < inf:
+                queue.append((distances[v], next(tie), v))
+        heapq.heapify(queue)
+
+        while queue:
+            dist, _, current_vertex = heapq.heappop(queue)
+            if dist > distances[current_vertex]:
+                continue
+            for neighbor in g.adj_list[current_vertex]:
+                if neighbor in affected:
+                    new_dist = dist + self._weight(current_vertex, neighbor)
+                    if new_dist < distances[neighbor]:
+                        distances[neighbor] = new_dist
+                        predecessors[neighbor] = current_vertex
+                        heapq.heappush(queue, (new_dist, next(tie), neighbor))
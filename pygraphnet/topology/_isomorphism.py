@@ -0,0 +1,208 @@
+from collections import deque
+
+import numpy as np
+
+from pygraphnet.profiling import _active, count
+from ._bfs import batched_bfs
+
+# odd 64-bit constants keeping out-neighbor, in-neighbor and distance terms apart
+_OUT = np.uint64(0x9e3779b97f4a7c15)
+_IN = np.uint64(0xc2b2ae3d27d4eb4f)
+_DIST = np.uint64(0x165667b19e3779f9)
+
+# sources per batch of distance fingerprint searches
+_FINGERPRINT_BATCH = 256
+
+def _mix(x):
+    """The splitmix64 finalizer, applied elementwise to a uint64 array"""
+    x = x.astype(np.uint64)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xbf58476d1ce4e5b9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94d049bb133111eb)
+    x ^= x >> np.uint64(31)
+    return x
+
+def _row_sums(values, offsets, indices):
+    """Wrapping uint64 sum of values over the neighbors of every vertex"""
+    sums = np.zeros(len(indices) + 1, dtype=np.uint64)
+    np.cumsum(values[indices], out=sums[1:])
+    return sums[offsets[1:]] - sums[offsets[:-1]]
+
+def refine_colors(graph, colors=None, rounds=None):
+    """
+    Weisfeiler-Lehman color refinement of a CompactGraph.
+
+    Each round hashes the color of every vertex together with the multisets of its out- and
+    in-neighbor colors. A multiset is hashed as the wrapping sum of its mixed members, which
+    needs no sorting, so a round is a few vectorized passes over the CSR arrays. Colors are a
+    pure function of the structure: isomorphic graphs get the same multiset of colors, and
+    the colors of vertices matched by an isomorphism agree.
+
+    Parameters:
+        graph (CompactGraph): The input graph.
+        colors (ndarray, optional): Initial uint64 colors; all vertices start alike by default.
+        rounds (int, optional): The number of rounds. By default refinement stops at the first
+                                round that splits no color class.
+
+    Returns:
+        ndarray: The refined uint64 color of every vertex.
+    """
+
+    num_vertices = graph.num_vertices
+    if colors is None:
+        colors = np.zeros(num_vertices, dtype=np.uint64)
+    reverse = graph.reverse() if graph.directed else None
+    classes = len(np.unique(colors))
+    done = 0
+    while rounds is None or done < rounds:
+        signature = colors * _OUT + _row_sums(_mix(colors ^ _OUT), graph.offsets, graph.indices)
+        if reverse is not None:
+            signature += _mix(_row_sums(_mix(colors ^ _IN), reverse.offsets, reverse.indices))
+        refined = _mix(signature)
+        done += 1
+        refined_classes = len(np.unique(refined))
+        if rounds is None and refined_classes == classes:
+            # the partition is stable; keep the colors one round short of the repeat
+            break
+        colors, classes = refined, refined_classes
+    return colors
+
+def distance_fingerprints(graph):
+    """
+    The multiset of BFS distances from every vertex, hashed into one uint64 per vertex.
+    Tells apart vertices of regular graphs that color refinement cannot, at the cost of one
+    search per vertex, run in batches.
+    """
+
+    num_vertices = graph.num_vertices
+    fingerprints = np.empty(num_vertices, dtype=np.uint64)
+    for start in range(0, num_vertices, _FINGERPRINT_BATCH):
+        sources = np.arange(start, min(start + _FINGERPRINT_BATCH, num_vertices))
+        dist = batched_bfs(graph.offsets, graph.indices, sources)
+        # unreachable vertices (-1) wrap to the largest value and still hash consistently
+        fingerprints[sources] = _mix(dist.astype(np.uint64) ^ _DIST).sum(axis=1, dtype=np.uint64)
+    return fingerprints
+
+def match(graph1, graph2, colors1, colors2):
+    """
+    VF2-style backtracking search for an isomorphism between two CompactGraphs whose vertex
+    colors are isomorphism invariants.
+
+    The vertices of graph1 are matched in breadth-first order from the rarest colors, so each
+    vertex after the first of its component has an already matched neighbor and its candidates
+    are the unmatched neighbors of that neighbor's image. A candidate must have the same
+    color, agree on self-loops, and be adjacent to the images of exactly the matched
+    neighbors of the vertex, in both directions.
+
+    Returns:
+        ndarray: The id in graph2 of every vertex id of graph1, or None if the graphs are not
+                 isomorphic.
+    """
+
+    num_vertices = graph1.num_vertices
+    directed = graph1.directed
+    out1 = [graph1.neighbor_ids(i).tolist() for i in range(num_vertices)]
+    in1 = [graph1.reverse().neighbor_ids(i).tolist() for i in range(num_vertices)] if directed else out1
+    out2 = [set(graph2.neighbor_ids(i).tolist()) for i in range(num_vertices)]
+    in2 = [set(graph2.reverse().neighbor_ids(i).tolist()) for i in range(num_vertices)] if directed else out2
+    colors1, colors2 = colors1.tolist(), colors2.tolist()
+
+    classes = {}
+    for j, color in enumerate(colors2):
+        classes.setdefault(color, []).append(j)
+    order, parents = _matching_order(out1, in1, colors1, classes)
+    position = [0] * num_vertices
+    for k, v in enumerate(order):
+        position[v] = k
+    # matched neighbors of each vertex at the time it is matched, excluding itself
+    back_out = [[w for w in out1[v] if position[w] < position[v]] for v in range(num_vertices)]
+    back_in = [[w for w in in1[v] if position[w] < position[v]] for v in range(num_vertices)]
+    loops = [v in out1[v] for v in range(num_vertices)]
+
+    core1 = [-1] * num_vertices
+    core2 = [-1] * num_vertices
+
+    def candidates(v):
+        parent, outward = parents[v]
+        if parent < 0:
+            pool = classes.get(colors1[v], ())
+        else:
+            pool = out2[core1[parent]] if outward else in2[core1[parent]]
+        color = colors1[v]
+        return (c for c in pool if core2[c] < 0 and colors2[c] == color)
+
+    def feasible(v, c):
+        if (c in out2[c]) != loops[v]:
+            return False
+        if not all(core1[w] in out2[c] for w in back_out[v]):
+            return False
+        if directed and not all(core1[w] in in2[c] for w in back_in[v]):
+            return False
+        # no extra edges between c and the matched vertices
+        matched_out = sum(1 for x in out2[c] if x != c and core2[x] >= 0)
+        if matched_out != len(back_out[v]):
+            return False
+        if directed:
+            matched_in = sum(1 for x in in2[c] if x != c and core2[x] >= 0)
+            if matched_in != len(back_in[v]):
+                return False
+        return True
+
+    states = 0
+    stack = [candidates(order[0])] if num_vertices else []
+    while stack:
+        v = order[len(stack) - 1]
+        if core1[v] >= 0:
+            core2[core1[v]] = -1
+            core1[v] = -1
+        for c in stack[-1]:
+            states += 1
+            if feasible(v, c):
+                core1[v], core2[c] = c, v
+                break
+        else:
+            stack.pop()
+            continue
+        if len(stack) == num_vertices:
+            break
+        stack.append(candidates(order[len(stack)]))
+
+    if _active:
+        count('isomorphism.searches')
+        count('isomorphism.states', states)
+    if num_vertices and not stack:
+        return None
+    return np.asarray(core1, dtype=np.int64)
+
+def _matching_order(out1, in1, colors1, classes):
+    """
+    Breadth-first order of graph1's ids, each component starting at a vertex of the rarest
+    color and neighbors queued rarest color first. Returns the order and, for every vertex,
+    (parent, outward) with the first matched neighbor, -1 for component roots, and whether
+    the vertex is an out-neighbor of it.
+    """
+
+    num_vertices = len(out1)
+    rarity = [len(classes.get(color, ())) for color in colors1]
+    parents = [(-1, True)] * num_vertices
+    seen = [False] * num_vertices
+    order = []
+    for root in sorted(range(num_vertices), key=lambda v: (rarity[v], -len(out1[v]))):
+        if seen[root]:
+            continue
+        seen[root] = True
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            adjacent = [(u, True) for u in out1[v]]
+            if in1 is not out1:
+                adjacent += [(u, False) for u in in1[v]]
+            adjacent.sort(key=lambda item: (rarity[item[0]], -len(out1[item[0]])))
+            for u, outward in adjacent:
+                if not seen[u]:
+                    seen[u] = True
+                    parents[u] = (v, outward)
+                    queue.append(u)
+    return order, parents
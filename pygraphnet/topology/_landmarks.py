@@ -0,0 +1,296 @@
+import heapq
+
+import numpy as np
+
+from pygraphnet.classes.storage import _write, _read
+from pygraphnet.profiling import _active, count
+from ._search import build_path
+
+SELECTIONS = ('farthest', 'random', 'degree')
+
+# stands in for inf in the tables: the difference of two is 0 rather than nan, and the sum
+# of two stays finite
+UNREACHABLE = np.finfo(np.float64).max / 4
+
+class LandmarkOracle:
+    """Point-to-point distances answered from precomputed landmark distances (ALT)
+
+    A handful of landmark vertices are searched from once, in both directions on directed
+    graphs, and their distances to and from every vertex are kept in a table. By the
+    triangle inequality, for every landmark L
+
+        d(L, t) - d(L, s) <= d(s, t)    and    d(s, L) - d(t, L) <= d(s, t)
+
+    so the best of these is a lower bound on d(s, t), and d(s, L) + d(L, t) an upper bound.
+    Exact queries run A* with the lower bound to the target as potential, which steers the
+    search towards the target and settles a fraction of the vertices Dijkstra's algorithm
+    would; vertices a landmark proves cannot reach the target are never queued.
+
+    The oracle works on a CompactGraph snapshot of the graph and the weights given when it
+    was built; rebuild it after the graph changes. save and load keep the snapshot and the
+    table in one file, so the preprocessing is paid once across processes.
+    """
+
+    def __init__(self, g, landmarks=16, weights=None, selection='farthest', seed=None):
+        """
+        Parameters:
+            g (Graph or CompactGraph): The graph to answer queries on. Edge weights must not
+                                       be negative.
+            landmarks (int or iterable): The number of landmarks, or the landmark vertices.
+            weights (dict, optional): Edge weights keyed by (v, u), or EdgeWeights; missing
+                                      edges weigh 1. Defaults to the weights attached to g.
+            selection (str): How to pick a number of landmarks. 'farthest' starts from the
+                             vertex farthest from a random one and repeatedly adds the vertex
+                             farthest from every landmark so far, preferring vertices that no
+                             landmark reaches. 'random' samples them uniformly and 'degree'
+                             takes the vertices of highest degree.
+            seed (int, optional): Seed of the random choices in 'farthest' and 'random'.
+
+        Raises:
+            ValueError: If selection is unknown.
+        """
+
+        from pygraphnet.topology import _csr
+
+        if selection not in SELECTIONS:
+            raise ValueError(f"unknown landmark selection: {selection!r}")
+        csr = _csr(g)
+        if weights:
+            csr = csr.with_weights(weights, strict=False)
+        if isinstance(landmarks, int):
+            ids, forward = _select(csr, landmarks, selection, np.random.default_rng(seed))
+        else:
+            ids = [csr.index[v] for v in landmarks]
+            forward = _rows(csr, ids)
+
+        symmetric = _symmetric(csr)
+        if symmetric:
+            # row v holds d(L, v) = d(v, L) for every landmark L
+            table = forward.T
+        else:
+            # row v holds -d(L, v) for every landmark, then d(v, L), so that row v minus row t
+            # lists the lower bounds through each landmark
+            table = np.hstack((-forward.T, _rows(csr.reverse(), ids).T))
+        self._init(csr, np.asarray(ids, dtype=np.int64), np.ascontiguousarray(table), symmetric)
+
+    def _init(self, graph, ids, table, symmetric):
+        self.graph = graph
+        self.landmarks = [graph.labels[i] for i in ids.tolist()]
+        self._ids = ids
+        # plain views of memory-mapped arrays, whose slices are cheaper to make
+        self._table = np.asarray(table)
+        self._arrays = tuple(None if array is None else np.asarray(array)
+                             for array in (graph.offsets, graph.indices, graph.weights))
+        self._symmetric = symmetric
+        self._integral = graph.weights is None or graph.weights.dtype.kind in 'iub'
+
+    @property
+    def nbytes(self):
+        """Size of the landmark table in bytes"""
+        return self._table.nbytes
+
+    def bounds(self, source, target):
+        """
+        Lower and upper bounds on the distance from source to target, from the landmark
+        table alone.
+
+        Returns:
+            tuple: (lower, upper). lower is inf if a landmark proves target unreachable, and
+                   upper is inf if no landmark lies on a walk from source to target.
+        """
+
+        s, t = self.graph.index[source], self.graph.index[target]
+        if s == t:
+            return 0, 0
+        return self._convert(self._lower(s, t)), self._convert(self._upper(s, t))
+
+    def distance(self, source, target):
+        """
+        The shortest distance from source to target, as shortest_distance(g, source, target)
+        returns it. Queries whose landmark bounds meet skip the search, unless the weights are
+        floats, whose sums along different walks may differ in the last digit.
+        """
+
+        s, t = self.graph.index[source], self.graph.index[target]
+        if s == t:
+            return 0
+        lower = self._lower(s, t)
+        if lower >= UNREACHABLE / 2 or (self._integral and lower == self._upper(s, t)):
+            if _active:
+                count('landmarks.bound_hits')
+            return self._convert(lower)
+        return self._search(s, t)[0]
+
+    def path(self, source, target):
+        """
+        A shortest path from source to target.
+
+        Returns:
+            tuple: (path_vertices, path_edges) as shortest_path returns them, both empty if
+                   target is unreachable or equal to source.
+        """
+
+        s, t = self.graph.index[source], self.graph.index[target]
+        if s == t or self._lower(s, t) >= UNREACHABLE / 2:
+            return [], []
+        distance, predecessors = self._search(s, t)
+        if distance == float('inf'):
+            return [], []
+        labels = self.graph.labels
+        path_vertices = [labels[v] for v in build_path(predecessors, None, t)]
+        return path_vertices, list(zip(path_vertices, path_vertices[1:]))
+
+    def save(self, path):
+        """Writes the graph snapshot and the landmark table to a file; load_graph also reads it"""
+        _write(self.graph, path,
+               {'landmark_ids': self._ids, 'landmark_table': self._table},
+               {'landmarks': {'count': len(self._ids), 'symmetric': self._symmetric}})
+
+    @classmethod
+    def load(cls, path, mmap=True, allow_pickle=False):
+        """
+        Opens an oracle written by save. With mmap, the graph and the landmark table are
+        memory-mapped as in load_graph, so processes that open the same file share them.
+
+        Raises:
+            ValueError: If the file is not a saved oracle, as well as for the reasons load_graph
+                        raises it.
+        """
+
+        graph, header, sections = _read(path, mmap, allow_pickle)
+        if 'landmarks' not in header:
+            raise ValueError(f"{path!r} is a saved graph without landmark distances")
+        oracle = cls.__new__(cls)
+        oracle._init(graph, np.asarray(sections['landmark_ids']), sections['landmark_table'],
+                     header['landmarks']['symmetric'])
+        return oracle
+
+    def _lower(self, s, t):
+        return potentials(self._table, self._symmetric, np.array([s]), self._table[t])[0]
+
+    def _upper(self, s, t):
+        table = self._table
+        if self._symmetric:
+            return (table[s] + table[t]).min(initial=np.inf)
+        # d(s, L) + d(L, t) from the two halves of the rows
+        num_landmarks = len(self._ids)
+        return (table[s, num_landmarks:] - table[t, :num_landmarks]).min(initial=np.inf)
+
+    def _convert(self, distance):
+        if distance >= UNREACHABLE / 2:
+            return float('inf')
+        return int(distance) if self._integral else float(distance)
+
+    def _search(self, s, t):
+        return alt_search(*self._arrays, self._table, self._symmetric, s, t)
+
+def alt_search(offsets, indices, weights, table, symmetric, source, target):
+    """
+    A* search on CSR arrays from source to target, with the landmark lower bounds to target
+    as potentials. They are consistent, so every vertex is settled once at its final
+    distance, and the search stops when target is settled.
+
+    Returns:
+        tuple: (distance, predecessors) with inf if target is unreachable.
+    """
+
+    inf = float('inf')
+    limit = UNREACHABLE / 2
+    target_row = table[target]
+    distances = {source: 0}
+    predecessors = {source: None}
+    settled = set()
+    queue = [(0, source)]
+    pops = 0
+    while queue:
+        pops += 1
+        _, v = heapq.heappop(queue)
+        if v in settled:
+            continue
+        settled.add(v)
+        if v == target:
+            break
+
+        start, end = offsets[v], offsets[v + 1]
+        if start == end:
+            continue
+        neighbors = indices[start:end]
+        # the potentials of all neighbors at once
+        bounds = potentials(table, symmetric, neighbors, target_row).tolist()
+        steps = weights[start:end].tolist() if weights is not None else [1] * len(bounds)
+        dist = distances[v]
+        for u, step, bound in zip(neighbors.tolist(), steps, bounds):
+            if bound > limit:
+                continue
+            new_dist = dist + step
+            if new_dist < distances.get(u, inf):
+                distances[u] = new_dist
+                predecessors[u] = v
+                heapq.heappush(queue, (new_dist + bound, u))
+
+    if _active:
+        count('landmarks.searches')
+        count('landmarks.vertices_settled', len(settled))
+        count('landmarks.stale_pops', pops - len(settled))
+    return distances.get(target, inf), predecessors
+
+def potentials(table, symmetric, vertices, target_row):
+    """
+    The best landmark lower bound on the distance from each vertex to the target: 0 where no
+    landmark gives one, and beyond UNREACHABLE / 2 where one proves the target unreachable.
+    """
+
+    gaps = table.take(vertices, axis=0) - target_row
+    if symmetric:
+        np.abs(gaps, out=gaps)
+    return np.maximum.reduce(gaps, axis=1, initial=0.0)
+
+def _rows(csr, ids):
+    """The (len(ids), n) distances from each id, with UNREACHABLE for inf"""
+    from pygraphnet.topology import iter_distances
+
+    labels = csr.labels
+    rows = np.empty((len(ids), csr.num_vertices))
+    for k, (_, row) in enumerate(iter_distances(csr, [labels[i] for i in ids])):
+        rows[k] = row
+    rows[np.isinf(rows)] = UNREACHABLE
+    return rows
+
+def _symmetric(csr):
+    """True if every distance is the same in both directions"""
+    if csr.directed:
+        return False
+    if csr.weights is None:
+        return True
+    # an undirected edge may weigh differently from each end: compare every edge (v, u)
+    # with (u, v)
+    sources = csr.source_ids()
+    forward = np.lexsort((csr.indices, sources))
+    backward = np.lexsort((sources, csr.indices))
+    return np.array_equal(csr.weights[forward], csr.weights[backward])
+
+def _select(csr, num_landmarks, selection, rng):
+    """Return the landmark ids and their distance rows"""
+    num_vertices = csr.num_vertices
+    num_landmarks = min(num_landmarks, num_vertices)
+    if selection == 'random':
+        ids = rng.choice(num_vertices, size=num_landmarks, replace=False).tolist()
+        return ids, _rows(csr, ids)
+    if selection == 'degree':
+        ids = np.argsort(-np.diff(csr.offsets), kind='stable')[:num_landmarks].tolist()
+        return ids, _rows(csr, ids)
+
+    rows = np.empty((num_landmarks, num_vertices))
+    if num_landmarks == 0:
+        return [], rows
+    # distance to the nearest landmark, which is UNREACHABLE, and so preferred, for vertices
+    # that none reaches
+    nearest = _rows(csr, [int(rng.integers(num_vertices))])[0]
+    ids = []
+    for k in range(num_landmarks):
+        far = nearest.copy()
+        far[ids] = -1
+        ids.append(int(np.argmax(far)))
+        rows[k] = _rows(csr, ids[-1:])[0]
+        nearest = rows[k] if k == 0 else np.minimum(nearest, rows[k])
+    return ids, rows
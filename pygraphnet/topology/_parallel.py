@@ -0,0 +1,64 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# per-process state installed by the pool initializer
+_worker_state = {}
+
+def _pool_context():
+    # forked workers inherit the initializer arguments instead of unpickling them
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def _init_worker(func, g, kwargs):
+    _worker_state['func'] = func
+    _worker_state['g'] = g
+    _worker_state['kwargs'] = kwargs
+
+def _run_chunk(sources):
+    func, g, kwargs = _worker_state['func'], _worker_state['g'], _worker_state['kwargs']
+    return [func(g, source, **kwargs) for source in sources]
+
+def map_sources(func, g, sources, workers=None, chunksize=None, max_chunksize=None, **kwargs):
+    """
+    Evaluates ``func(g, source, **kwargs)`` for every source on a process pool.
+
+    The graph and keyword arguments are handed to each worker once, through the pool
+    initializer (inherited by fork where available), and only source chunks and their
+    results travel between processes. At most two chunks per worker are in flight, so the
+    results waiting to be consumed are bounded by 2 * workers * chunksize.
+
+    Parameters:
+        func (callable): A picklable module-level function.
+        g: The graph passed to every call.
+        sources (list): The sources to evaluate.
+        workers (int, optional): Number of worker processes, defaults to os.cpu_count().
+        chunksize (int, optional): Sources per task, defaults to an even split into about
+                                   four tasks per worker.
+        max_chunksize (int, optional): A cap on the default chunksize.
+
+    Yields:
+        tuple: (source, result) pairs, in the order of sources.
+    """
+
+    sources = list(sources)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, min(-(-len(sources) // (workers * 4)), max_chunksize or len(sources)))
+    chunks = iter([sources[i:i + chunksize] for i in range(0, len(sources), chunksize)])
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                             initializer=_init_worker, initargs=(func, g, kwargs)) as pool:
+        pending = deque((chunk, pool.submit(_run_chunk, chunk))
+                        for chunk in islice(chunks, 2 * workers))
+        while pending:
+            chunk, future = pending.popleft()
+            results = future.result()
+            # refill the window before handing the results out
+            refill = next(chunks, None)
+            if refill is not None:
+                pending.append((refill, pool.submit(_run_chunk, refill)))
+            yield from zip(chunk, results)
@@ -0,0 +1,97 @@
+from collections import namedtuple
+from statistics import NormalDist
+
+import numpy as np
+
+Estimate = namedtuple('Estimate', ['value', 'low', 'high', 'samples'])
+Estimate.__doc__ = """A point estimate with the bounds of its confidence interval and the number of sources it used"""
+
+def degree_strata(degrees, strata):
+    """
+    Stratum ids splitting the vertices into `strata` groups of equal size by degree, lowest
+    degrees first, with ties broken by vertex id.
+    """
+
+    num_vertices = len(degrees)
+    strata = max(1, min(strata, num_vertices))
+    ranks = np.empty(num_vertices, dtype=np.int64)
+    ranks[np.argsort(degrees, kind='stable')] = np.arange(num_vertices)
+    return ranks * strata // max(num_vertices, 1)
+
+def sampling_order(stratum, rng):
+    """
+    A random order of the vertex ids in which every prefix samples each stratum in proportion
+    to its size, within one vertex: the i-th vertex drawn from a stratum of size N gets the
+    key (i + u) / N for a uniform u, and vertices are taken by increasing key.
+    """
+
+    order = rng.permutation(len(stratum))
+    stratum = stratum[order]
+    sizes = np.bincount(stratum)
+    # position of every vertex within its stratum, in permuted order
+    by_stratum = np.argsort(stratum, kind='stable')
+    position = np.empty(len(stratum), dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    position[by_stratum] = np.arange(len(stratum)) - np.repeat(starts, sizes)
+    keys = (position + rng.random(len(stratum))) / sizes[stratum]
+    return order[np.argsort(keys, kind='stable')]
+
+class StratifiedTotals:
+    """Estimated population totals of per-source quantities under stratified sampling
+
+    Every sampled source contributes q quantity vectors of width m. Totals are the
+    Horvitz-Thompson sums sum_h N_h / n_h * sum_(s in S_h) y_s, and their covariance
+    includes the finite population correction, so a census of every vertex has none.
+    """
+
+    def __init__(self, stratum_sizes, quantities, width):
+        num_strata = len(stratum_sizes)
+        self.sizes = np.asarray(stratum_sizes, dtype=np.float64)
+        self.counts = np.zeros(num_strata, dtype=np.int64)
+        self.sums = np.zeros((num_strata, quantities, width))
+        self.products = np.zeros((num_strata, quantities, quantities, width))
+
+    def add(self, stratum, values):
+        """Adds the (q, m) array of values of one source drawn from stratum"""
+        self.counts[stratum] += 1
+        self.sums[stratum] += values
+        self.products[stratum] += values[:, None, :] * values[None, :, :]
+
+    @property
+    def samples(self):
+        return int(self.counts.sum())
+
+    def totals(self):
+        """The (q, m) estimated totals"""
+        sampled = self.counts > 0
+        scale = self.sizes[sampled] / self.counts[sampled]
+        return np.einsum('h,hqm->qm', scale, self.sums[sampled])
+
+    def covariance(self):
+        """The (q, q, m) estimated covariance of the totals; inf where a stratum has too few samples"""
+        sampled = self.counts > 0
+        n, size = self.counts[sampled].astype(np.float64), self.sizes[sampled]
+        sums, products = self.sums[sampled], self.products[sampled]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread = (products - sums[:, :, None, :] * sums[:, None, :, :] / n[:, None, None, None])
+            spread /= (n - 1)[:, None, None, None]
+        # a stratum sampled once has no variance estimate unless it was sampled in full
+        census = n >= size
+        spread[census] = 0
+        spread[(n < 2) & ~census] = np.inf
+        weight = size ** 2 * (1 - n / size) / n
+        return np.einsum('h,hqrm->qrm', weight, spread)
+
+def confidence_z(confidence):
+    """The two-sided standard normal quantile for a confidence level"""
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence!r}")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+def interval(value, variance, z, samples):
+    """An Estimate of value with a normal confidence interval, as plain floats"""
+    value = float(value)
+    half = z * float(np.sqrt(max(float(variance), 0.0))) if np.isfinite(variance) else np.inf
+    if not np.isfinite(value):
+        half = np.inf if np.isnan(value) else 0.0
+    return Estimate(value, value - half, value + half, samples)
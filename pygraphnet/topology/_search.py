@@ -0,0 +1,198 @@
+"""
+Point-to-point search kernels. Each works on any vertex type through a ``neighbors(v)``
+callable, and the weighted ones through a ``weighted_neighbors(v)`` callable yielding
+(neighbor, weight) pairs, so the same code runs on Graph labels and on CompactGraph ids.
+"""
+
+import heapq
+from collections import deque
+
+from pygraphnet.profiling import _active, count, peak
+
+def bfs(neighbors, source, target=None):
+    """
+    FIFO breadth-first search that stops as soon as target is discovered.
+
+    Returns:
+        tuple: (distances, predecessors) dicts covering the discovered vertices.
+    """
+
+    distances = {source: 0}
+    predecessors = {source: None}
+    if source == target:
+        return distances, predecessors
+
+    queue = deque([source])
+    while queue:
+        current_vertex = queue.popleft()
+        next_distance = distances[current_vertex] + 1
+        for neighbor in neighbors(current_vertex):
+            if neighbor not in distances:
+                distances[neighbor] = next_distance
+                predecessors[neighbor] = current_vertex
+                if neighbor == target:
+                    queue.clear()
+                    break
+                queue.append(neighbor)
+
+    if _active:
+        count('bfs.searches')
+        count('bfs.vertices_reached', len(distances))
+    return distances, predecessors
+
+def dijkstra(weighted_neighbors, sources, target=None):
+    """
+    Lazy-deletion binary-heap Dijkstra from one or more sources, all seeded at distance 0,
+    that stops as soon as target is settled.
+
+    Returns:
+        tuple: (distances, predecessors) dicts covering the reached vertices. Only settled
+               vertices are guaranteed to have final values when the search stops early.
+    """
+
+    distances = {source: 0 for source in sources}
+    predecessors = {source: None for source in sources}
+    visited = set()
+    queue = [(0, source) for source in distances]
+    heapq.heapify(queue)
+    pops = 0
+    largest = 0
+    while queue:
+        pops += 1
+        # the heap only grows between pops, so its peak is seen just before one
+        if len(queue) > largest:
+            largest = len(queue)
+        dist, current_vertex = heapq.heappop(queue)
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+        if current_vertex == target:
+            break
+
+        for neighbor, weight in weighted_neighbors(current_vertex):
+            new_dist = dist + weight
+            if new_dist < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_dist
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(queue, (new_dist, neighbor))
+
+    if _active:
+        # every entry is popped once unless the search stopped early
+        count('dijkstra.searches')
+        count('dijkstra.vertices_settled', len(visited))
+        count('dijkstra.heap_pushes', pops + len(queue))
+        count('dijkstra.stale_pops', pops - len(visited))
+        peak('dijkstra.heap', largest)
+    return distances, predecessors
+
+def bidirectional_bfs(neighbors, in_neighbors, source, target):
+    """
+    Breadth-first search from both ends, always expanding the smaller frontier by a full
+    level.
+
+    Returns:
+        tuple: (predecessors, successors, meet) where predecessors lead back to source and
+               successors lead on to target from the meeting vertex, or None if target is
+               unreachable.
+    """
+
+    if source == target:
+        return {source: None}, {target: None}, source
+
+    forward = ({source: None}, {source: 0}, [source], neighbors)
+    backward = ({target: None}, {target: 0}, [target], in_neighbors)
+    while forward[2] and backward[2]:
+        if len(forward[2]) > len(backward[2]):
+            forward, backward, swapped = backward, forward, True
+        else:
+            swapped = False
+
+        parents, depth, frontier, adjacent = forward
+        other_depth = backward[1]
+        next_frontier = []
+        best, meet = float('inf'), None
+        for current_vertex in frontier:
+            for neighbor in adjacent(current_vertex):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = current_vertex
+                depth[neighbor] = depth[current_vertex] + 1
+                next_frontier.append(neighbor)
+                if neighbor in other_depth and depth[neighbor] + other_depth[neighbor] < best:
+                    best, meet = depth[neighbor] + other_depth[neighbor], neighbor
+        forward = (parents, depth, next_frontier, adjacent)
+
+        if swapped:
+            forward, backward = backward, forward
+        if meet is not None:
+            break
+
+    if _active:
+        count('bidirectional_bfs.searches')
+        count('bidirectional_bfs.vertices_reached', len(forward[0]) + len(backward[0]))
+    if meet is None:
+        return None
+    return forward[0], backward[0], meet
+
+def bidirectional_dijkstra(weighted_neighbors, in_weighted_neighbors, source, target):
+    """
+    Dijkstra's algorithm from both ends, stopping once the two heap minima together can no
+    longer beat the best meeting point found so far.
+
+    Returns:
+        tuple: (predecessors, successors, meet) as in bidirectional_bfs, or None if target is
+               unreachable.
+    """
+
+    if source == target:
+        return {source: None}, {target: None}, source
+
+    sides = [
+        ({source: 0}, {source: None}, set(), [(0, source)], weighted_neighbors),
+        ({target: 0}, {target: None}, set(), [(0, target)], in_weighted_neighbors),
+    ]
+    best, meet = float('inf'), None
+    while sides[0][3] and sides[1][3]:
+        if sides[0][3][0][0] + sides[1][3][0][0] >= best:
+            break
+
+        # expand the side with the smaller heap
+        side = 0 if len(sides[0][3]) <= len(sides[1][3]) else 1
+        distances, parents, visited, queue, adjacent = sides[side]
+        other_distances = sides[1 - side][0]
+
+        dist, current_vertex = heapq.heappop(queue)
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+
+        for neighbor, weight in adjacent(current_vertex):
+            new_dist = dist + weight
+            if new_dist < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_dist
+                parents[neighbor] = current_vertex
+                heapq.heappush(queue, (new_dist, neighbor))
+            if neighbor in other_distances and distances[neighbor] + other_distances[neighbor] < best:
+                best, meet = distances[neighbor] + other_distances[neighbor], neighbor
+
+    if _active:
+        count('bidirectional_dijkstra.searches')
+        count('bidirectional_dijkstra.vertices_settled', len(sides[0][2]) + len(sides[1][2]))
+    if meet is None:
+        return None
+    return sides[0][1], sides[1][1], meet
+
+def build_path(predecessors, successors, meet):
+    """Joins the source -> meet and meet -> target halves in linear time"""
+    path = []
+    current_vertex = meet
+    while current_vertex is not None:
+        path.append(current_vertex)
+        current_vertex = predecessors[current_vertex]
+    path.reverse()
+
+    current_vertex = successors.get(meet) if successors else None
+    while current_vertex is not None:
+        path.append(current_vertex)
+        current_vertex = successors[current_vertex]
+    return path
@@ -0,0 +1,113 @@
+from pygraphnet.classes import CompactGraph, EdgeWeights
+
+def resolve_weights(g, weights=None):
+    """
+    Picks the weights a search should use: the weights argument if given, otherwise the
+    weights attached to the graph (Graph.adj_weights or CompactGraph.weights), otherwise None.
+    """
+
+    if weights:
+        return weights
+    if isinstance(g, CompactGraph):
+        return g.weights
+    return getattr(g, 'adj_weights', None)
+
+def integral_weights(weights):
+    """True if every path length under these resolved weights is an integer"""
+    if weights is None:
+        return True
+    if isinstance(weights, EdgeWeights):
+        return all(isinstance(w, int) for w in weights.values_flat())
+    if isinstance(weights, dict):
+        return all(isinstance(w, int) for w in weights.values())
+    return weights.dtype.kind in 'iub'
+
+def _edge_weight(weights, v, u, directed):
+    edge = (v, u)
+    if not directed and edge not in weights:
+        edge = (u, v)
+    return weights[edge] if edge in weights else 1
+
+class SearchSpace:
+    """Adapts a graph and its edge weights to the search kernels
+
+    Graphs are searched by vertex label and compact graphs by integer id; encode and decode
+    translate between labels and search vertices. Weighted searches iterate the
+    (neighbor, weight) pairs of weighted_neighbors, read straight from attached weights or
+    EdgeWeights, or looked up per edge in a plain {(v, u): weight} dict.
+    """
+
+    def __init__(self, g, weights=None):
+        self.graph = g
+        self.weights = resolve_weights(g, weights)
+        self.weighted = self.weights is not None
+        self.compact = isinstance(g, CompactGraph)
+        self.attached = self.compact and self.weighted and self.weights is g.weights
+        if self.compact:
+            self.encode = g.index.__getitem__
+            self.decode = g.labels.__getitem__
+        else:
+            self.encode = self.decode = _identity
+
+    def neighbors(self, v):
+        g = self.graph
+        if self.compact:
+            return g.indices[g.offsets[v]:g.offsets[v + 1]].tolist()
+        return g.adj_list[v]
+
+    def weighted_neighbors(self, v):
+        return self._weighted_neighbors(self.graph, v, reverse=False)
+
+    def in_neighbors(self):
+        """Return an in-neighbors callable, building the reverse adjacency if needed"""
+        g = self.graph
+        if not g.directed:
+            return self.neighbors
+        if self.compact:
+            reverse = g.reverse()
+            return lambda i: reverse.indices[reverse.offsets[i]:reverse.offsets[i + 1]].tolist()
+        return g.in_neighbors
+
+    def in_weighted_neighbors(self):
+        """
+        Return a callable yielding (in-neighbor, weight of the edge into v) pairs. Undirected
+        edges may weigh differently in each direction, so they are read from the far end.
+        """
+
+        g = self.graph
+        if self.compact:
+            reverse = g.reverse()
+            return lambda i: self._weighted_neighbors(reverse, i, reverse=True)
+
+        in_neighbors = g.in_neighbors
+        weights = self.weights
+        if isinstance(weights, EdgeWeights):
+            return lambda u: [(v, weights[v][u]) for v in in_neighbors(u)]
+        return lambda u: [(v, _edge_weight(weights, v, u, g.directed)) for v in in_neighbors(u)]
+
+    def _weighted_neighbors(self, g, v, reverse):
+        weights = self.weights
+        if not self.compact:
+            if isinstance(weights, EdgeWeights):
+                return weights[v].items()
+            return [(u, _edge_weight(weights, v, u, g.directed)) for u in g.adj_list[v]]
+
+        start, end = g.offsets[v], g.offsets[v + 1]
+        neighbors = g.indices[start:end].tolist()
+        if self.attached:
+            # the reverse of a weighted compact graph carries its own permuted weights
+            return zip(neighbors, g.weights[start:end].tolist())
+
+        labels = g.labels
+        label = labels[v]
+        if isinstance(weights, EdgeWeights):
+            if reverse:
+                return [(u, weights[labels[u]][label]) for u in neighbors]
+            row = weights[label]
+            return [(u, row[labels[u]]) for u in neighbors]
+        if reverse:
+            return [(u, _edge_weight(weights, labels[u], label, g.directed)) for u in neighbors]
+        return [(u, _edge_weight(weights, label, labels[u], g.directed)) for u in neighbors]
+
+def _identity(v):
+    return v
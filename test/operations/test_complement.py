@@ -1,5 +1,13 @@
 import unittest
-from pygraphnet import Graph, complement
+from itertools import permutations
+from pygraphnet import Graph, CompactGraph, ComplementGraph, complement
+
+def complement_by_pairs(g):
+    expected = set()
+    for v, u in permutations(g.vertices, 2):
+        if u not in g.adj_list[v]:
+            expected.add((v, u))
+    return expected
 
 class TestGraphComplement(unittest.TestCase):
     def test_empty_graph(self):
@@ -49,5 +57,45 @@ class TestGraphComplement(unittest.TestCase):
         self.assertFalse((0, 1) in comp_g.edges, "Complement should not contain the original edge")
         self.assertTrue((1, 0) in comp_g.edges, "Complement should contain the reverse of the original edge")
 
+    def test_matches_pairwise_definition(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 2), (3, 4), ('a', 0), ((5, 6), 1)]
+        for directed in (False, True):
+            g = Graph(edges, directed=directed)
+            g.add_vertex('isolated')
+            expected = complement_by_pairs(g)
+            for comp_g in (complement(g), complement(CompactGraph(g))):
+                self.assertEqual(comp_g.vertices, g.vertices)
+                self.assertEqual({(v, u) for v in comp_g.adj_list for u in comp_g.adj_list[v]}, expected)
+                if not directed:
+                    self.assertEqual(len(comp_g.edges), len(expected) // 2)
+
+    def test_lazy_view(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 2), (3, 4)]
+        for directed in (False, True):
+            g = Graph(edges, directed=directed)
+            view = complement(g, lazy=True)
+            self.assertIsInstance(view, ComplementGraph)
+            self.assertEqual(view.directed, directed)
+            expected = complement_by_pairs(g)
+            self.assertEqual({(v, u) for v in view.adj_list for u in view.adj_list[v]}, expected)
+            self.assertEqual(len(view.edges), len(complement(g).edges))
+            self.assertEqual(len(set(view.edges)), len(view.edges))
+            for v, u in expected:
+                self.assertIn((v, u), view.edges)
+                self.assertIn(v, view.in_neighbors(u))
+            self.assertNotIn((2, 2), view.edges)
+            self.assertNotIn((0, 1), view.edges)
+            self.assertEqual(view.degree(2), len(view.adj_list[2]))
+            for v in g.vertices:
+                self.assertEqual(view.in_degree(v), sum(v in view.adj_list[w] for w in g.vertices))
+
+        # the view follows mutations of the underlying graph
+        g = Graph(edges)
+        view = complement(g, lazy=True)
+        g.add_edge(0, 3)
+        self.assertNotIn(3, view.adj_list[0])
+        self.assertFalse(CompactGraph(view).has_edge(0, 3))
+        self.assertTrue(CompactGraph(view).has_edge(0, 4))
+
 if __name__ == '__main__':
     unittest.main()
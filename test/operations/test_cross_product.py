@@ -1,5 +1,13 @@
 import unittest
-from pygraphnet import Graph, cross_product
+from pygraphnet import Graph, CompactGraph, ProductGraph, cross_product
+
+def product_by_definition(g1, g2):
+    adj_list = {}
+    for v1 in g1.vertices:
+        for v2 in g2.vertices:
+            adj_list[v1, v2] = ({(u1, v2) for u1 in g1.adj_list[v1]} |
+                                {(v1, u2) for u2 in g2.adj_list[v2]})
+    return adj_list
 
 class TestCrossProduct(unittest.TestCase):
     def setUp(self):
@@ -30,4 +38,28 @@ class TestCrossProduct(unittest.TestCase):
         self.assertTrue(result.directed)
         self.assertEqual(len(result.vertices), 12)
         self.assertIn(((0, 0), (1, 0)), result.edges)
-        self.assertIn(((1, 0), (0, 0)), result.edges)
\ No newline at end of file
+        self.assertIn(((1, 0), (0, 0)), result.edges)
+
+    def test_matches_definition(self):
+        g1 = Graph([(0, 1), (1, 1), ('a', 0)], directed=True)
+        g1.add_vertex('isolated')
+        g2 = Graph([(0, 1), (1, 2), (2, 2)])
+        for first, second in ((g1, g2), (g2, g1), (g2, g2), (CompactGraph(g1), g2)):
+            expected = product_by_definition(first, second)
+            for result in (cross_product(first, second), cross_product(first, second, lazy=True)):
+                self.assertEqual(result.directed, first.directed or second.directed)
+                self.assertEqual(set(result.vertices), set(expected))
+                self.assertEqual({v: set(result.adj_list[v]) for v in result.adj_list}, expected)
+                self.assertEqual(len(result.edges), sum(len(n) for n in expected.values()))
+
+    def test_lazy_view(self):
+        view = cross_product(self.directed_square, self.undirected_triangle, lazy=True)
+        self.assertIsInstance(view, ProductGraph)
+        self.assertTrue(view.directed)
+        self.assertEqual(len(view.vertices), 12)
+        self.assertIn(((0, 0), (1, 0)), view.edges)
+        self.assertNotIn(((1, 0), (0, 0)), view.edges)
+        self.assertIn(((0, 1), (0, 0)), view.edges)
+        self.assertEqual(view.degree((0, 0)), 3)
+        self.assertEqual(set(view.in_neighbors((0, 0))), {(3, 0), (0, 1), (0, 2)})
+        self.assertEqual(view.in_degree((0, 0)), 3)
\ No newline at end of file
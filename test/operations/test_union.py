@@ -0,0 +1,84 @@
+import random
+import unittest
+from pygraphnet import Graph, CompactGraph, union, union_all, disjoint_union, disjoint_union_all, shortest_distance
+
+def adjacency(g):
+    return {v: set(g.adj_list[v]) for v in g.vertices}
+
+def union_by_edges(graphs):
+    # the baseline: one add_edge per edge
+    result = Graph(directed=any(g.directed for g in graphs))
+    for g in graphs:
+        for v in g.vertices:
+            result.add_vertex(v)
+        for v, u in g.edges:
+            result.add_edge(v, u)
+            if result.directed and not g.directed:
+                result.add_edge(u, v)
+    return result
+
+class TestGraphUnion(unittest.TestCase):
+    def test_matches_add_edge(self):
+        rng = random.Random(8)
+        for directions in ((False, False), (True, True), (False, True), (True, False, False)):
+            graphs = [Graph([(rng.randrange(30), rng.randrange(30)) for _ in range(40)], directed=directed)
+                      for directed in directions]
+            graphs[0].add_vertex(99)
+            expected = union_by_edges(graphs)
+            for result in (union(*graphs), union_all(map(CompactGraph, graphs)), union_all(graphs, chunk_size=1)):
+                self.assertEqual(result.directed, expected.directed)
+                self.assertEqual(result.vertices, expected.vertices)
+                self.assertEqual(adjacency(result), adjacency(expected))
+                self.assertEqual(result.in_neighbors(0), expected.in_neighbors(0))
+
+    def test_edges_reported_once(self):
+        result = union(Graph([(0, 1), (1, 2)]), Graph([(1, 2), (2, 3)]))
+        self.assertEqual(len(result.edges), 3)
+        self.assertFalse(result.directed)
+
+    def test_mixed_scalar_and_tuple_labels(self):
+        graphs = [Graph([(0, (1, 2))]), Graph([(3, 4), ((1, 2), 3)])]
+        result = union(*graphs)
+        self.assertEqual(adjacency(result), adjacency(union_by_edges(graphs)))
+        self.assertEqual(len(disjoint_union(*graphs).vertices), 5)
+
+    def test_streaming(self):
+        produced = []
+        def shards():
+            for k in range(5):
+                produced.append(k)
+                yield CompactGraph([(k, k + 1)])
+        result = union_all(shards())
+        self.assertEqual(produced, list(range(5)))
+        self.assertEqual(shortest_distance(result, 0, 5), 5)
+        self.assertEqual(union_all([]).vertices, set())
+        with self.assertRaises(ValueError):
+            union_all([], chunk_size=0)
+
+    def test_weights(self):
+        g1 = Graph([('a', 'b'), ('b', 'c')])
+        g2 = Graph([('b', 'c'), ('c', 'd')], directed=True)
+        g2.set_weights({('b', 'c'): 2.5, ('c', 'd'): 4})
+        result = union(g1, g2)
+        self.assertEqual(result.adj_weights['a']['b'], 1)
+        self.assertEqual(result.adj_weights['c']['b'], 1)
+        self.assertEqual(result.adj_weights['b']['c'], 2.5)
+        self.assertEqual(shortest_distance(result, 'a')['d'], 7.5)
+        # a later unweighted copy of an edge resets it to 1
+        self.assertEqual(union(g2, Graph([('b', 'c')], directed=True)).adj_weights['b']['c'], 1)
+
+    def test_disjoint_union(self):
+        g1 = Graph([('x', 'y')])
+        g2 = Graph([(0, 1), (1, 2)], directed=True)
+        g2.add_vertex(7)
+        result = disjoint_union(g1, g2, CompactGraph(g1))
+        self.assertTrue(result.directed)
+        self.assertEqual(result.vertices, set(range(8)))
+        self.assertEqual(len(result.edges), 6)
+        labels = list(g1.vertices) + list(g2.vertices)
+        for v, u in g2.edges:
+            self.assertIn((labels.index(v), labels.index(u)), result.edges)
+        self.assertEqual(disjoint_union_all(iter([g1] * 3)).vertices, set(range(6)))
+
+if __name__ == '__main__':
+    unittest.main()
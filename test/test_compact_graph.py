@@ -0,0 +1,106 @@
+import unittest
+from pygraphnet import Graph, CompactGraph, shortest_distance, diameter, complement, cross_product
+
+class TestCompactGraph(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0)]
+        self.weights = {(0, 1): 2, (1, 2): 2, (2, 3): 2, (3, 4): 10, (4, 0): 2}
+
+    def test_init_empty_graph(self):
+        g = CompactGraph(5)
+        self.assertEqual(len(g.vertices), 5)
+        self.assertEqual(len(g.edges), 0)
+        self.assertFalse(g.directed)
+
+    def test_init_from_edge_list_undirected(self):
+        g = CompactGraph(self.edges)
+        self.assertEqual(len(g.vertices), 5)
+        self.assertEqual(len(g.edges), 5)
+        self.assertEqual({v: set(n) for v, n in g.adj_list.items()}, {
+            0: set([1, 4]),
+            1: set([0, 2]),
+            2: set([1, 3]),
+            3: set([2, 4]),
+            4: set([0, 3]),
+        })
+
+    def test_init_from_edge_list_directed(self):
+        g = CompactGraph(self.edges, directed=True)
+        self.assertEqual(len(g.edges), 5)
+        self.assertIn((0, 1), g.edges)
+        self.assertNotIn((1, 0), g.edges)
+        self.assertEqual(g.degree(0), 1)
+
+    def test_duplicate_edges(self):
+        g = CompactGraph([(0, 1), (1, 0), (0, 1)])
+        self.assertEqual(len(g.edges), 1)
+        self.assertEqual(g.degree(0), 1)
+
+    def test_init_from_graph(self):
+        graph = Graph(self.edges, directed=True)
+        g = CompactGraph(graph)
+        self.assertTrue(g.directed)
+        self.assertEqual(set(g.vertices), graph.vertices)
+        self.assertEqual(set(g.edges), graph.edges)
+        for v in graph.vertices:
+            self.assertEqual(list(g.adj_list[v]), list(graph.adj_list[v]))
+
+    def test_string_labels(self):
+        g = CompactGraph([('a', 'b'), ('b', 'c')])
+        self.assertEqual(g.neighbors('b'), ('a', 'c'))
+        self.assertTrue(g.has_edge('c', 'b'))
+        self.assertFalse(g.has_edge('a', 'c'))
+
+    def test_arrays_are_read_only(self):
+        g = CompactGraph(self.edges)
+        with self.assertRaises(ValueError):
+            g.indices[0] = 3
+
+    def test_to_graph(self):
+        graph = CompactGraph(self.edges, directed=True).to_graph()
+        self.assertIsInstance(graph, Graph)
+        self.assertEqual(graph.edges, set(self.edges))
+
+    def test_in_neighbors(self):
+        for directed in (False, True):
+            graph = Graph(self.edges, directed=directed)
+            g = CompactGraph(graph)
+            for v in graph.vertices:
+                self.assertEqual(set(g.in_neighbors(v)), graph.in_neighbors(v))
+                self.assertEqual(g.in_degree(v), graph.in_degree(v))
+
+    def test_source_ids(self):
+        for directed in (False, True):
+            g = CompactGraph(self.edges, directed=directed)
+            pairs = {(g.labels[v], g.labels[u])
+                     for v, u in zip(g.source_ids().tolist(), g.indices.tolist())}
+            self.assertEqual(pairs, set(g.edges) if directed else
+                             set(g.edges) | {(u, v) for v, u in g.edges})
+
+    def test_subgraph(self):
+        for directed in (False, True):
+            g = CompactGraph(self.edges, directed=directed).with_weights(self.weights)
+            sub = g.subgraph([3, 0, 4])
+            self.assertEqual(list(sub.vertices), [0, 3, 4])
+            expected = {(v, u) for v, u in g.edges if v in (0, 3, 4) and u in (0, 3, 4)}
+            self.assertEqual(set(sub.edges), expected)
+            self.assertEqual(shortest_distance(sub, 3)[0], 12)
+
+    def test_topology_matches_graph(self):
+        for directed in (False, True):
+            graph = Graph(self.edges, directed=directed)
+            g = CompactGraph(graph)
+            self.assertEqual(shortest_distance(g), shortest_distance(graph))
+            self.assertEqual(shortest_distance(g, 0, weights=self.weights),
+                             shortest_distance(graph, 0, weights=self.weights))
+            self.assertEqual(diameter(g), diameter(graph))
+            self.assertEqual(diameter(g, self.weights), diameter(graph, self.weights))
+
+    def test_operations_accept_compact(self):
+        graph = Graph(self.edges)
+        g = CompactGraph(graph)
+        self.assertEqual(complement(g).edges, complement(graph).edges)
+        self.assertEqual(cross_product(g, g).adj_list, cross_product(graph, graph).adj_list)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from pygraphnet import Graph, CompactGraph, read_edge_list, write_edge_list, shortest_distance
+
+class TestEdgeList(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'edges.txt')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text, compressed=False):
+        path = self.path + '.gz' if compressed else self.path
+        with (gzip.open(path, 'wt') if compressed else open(path, 'w')) as f:
+            f.write(text)
+        return path
+
+    def assertSameGraph(self, loaded, g):
+        self.assertEqual(loaded.directed, g.directed)
+        self.assertEqual(set(loaded.vertices), set(g.vertices))
+        self.assertEqual({v: set(loaded.adj_list[v]) for v in loaded.vertices},
+                         {v: set(g.adj_list[v]) for v in g.vertices})
+
+    def test_read_integer_edges_in_chunks(self):
+        text = "# a comment\n0 1\n1 2\n\n2 3\n# another\n3 0\n1 2\n"
+        expected = Graph([(0, 1), (1, 2), (2, 3), (3, 0)])
+        for chunk_size in (1, 2, 3, 100):
+            seen = []
+            g = read_edge_list(self.write(text), chunk_size=chunk_size, progress=seen.append)
+            self.assertSameGraph(g, expected)
+            self.assertEqual(seen[-1], 5)
+            self.assertEqual(seen, sorted(seen))
+
+    def test_read_gzip_and_delimiter(self):
+        path = self.write("0,1\n1,2\n2,0\n", compressed=True)
+        g = read_edge_list(path, delimiter=',', directed=True)
+        self.assertSameGraph(g, Graph([(0, 1), (1, 2), (2, 0)], directed=True))
+
+    def test_read_string_labels(self):
+        g = read_edge_list(self.write("a\tb\nb\tc\n# x\n"), delimiter='\t', nodetype=str, chunk_size=1)
+        self.assertSameGraph(g, Graph([('a', 'b'), ('b', 'c')]))
+
+    def test_read_weights(self):
+        text = "0 1 x 2.5\n1 2 y 1\n0 2 z 10\n"
+        for nodetype in (int, str):
+            g = read_edge_list(self.write(text), weight_column=3, nodetype=nodetype, chunk_size=2)
+            source = nodetype(0)
+            self.assertEqual(shortest_distance(g, source)[nodetype(2)], 3.5)
+            self.assertEqual(g.adj_weights[nodetype(1)][source], 2.5)
+
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("0 1 -1\n"), weight_column=2)
+
+    def test_read_malformed_line(self):
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("0 1\n2\n"))
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("a b\n"))
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("a\n"), nodetype=str)
+
+    def test_write_round_trip(self):
+        g = Graph([(0, 1), (1, 2), (2, 3), (3, 0), (5, 6)], directed=True)
+        g.set_weights({(0, 1): 4, (1, 2): 0.5})
+        for path in (self.path, self.path + '.gz'):
+            write_edge_list(g, path, chunk_size=2)
+            loaded = read_edge_list(path, directed=True, weight_column=2)
+            self.assertSameGraph(loaded, g)
+            self.assertEqual(loaded.adj_weights, g.adj_weights)
+
+    def test_integer_weights_round_trip(self):
+        g = Graph([(0, 1), (1, 2), (2, 3)])
+        g.set_weights({(0, 1): 1, (1, 2): 2, (2, 3): 3})
+        for nodetype in (int, str):
+            buffer = io.StringIO()
+            write_edge_list(g, buffer)
+            loaded = read_edge_list(io.StringIO(buffer.getvalue()), weight_column=2, nodetype=nodetype)
+            source, target = nodetype(0), nodetype(3)
+            self.assertIs(type(loaded.adj_weights[source][nodetype(1)]), int)
+            self.assertIs(type(shortest_distance(loaded, source)[target]), int)
+            self.assertEqual(shortest_distance(loaded, source, queue='dial')[target], 6)
+
+    def test_write_compact_graph(self):
+        g = CompactGraph([('a', 'b'), ('b', 'c')]).with_weights({('a', 'b'): 3})
+        buffer = io.StringIO()
+        write_edge_list(g, buffer, delimiter='\t')
+        self.assertEqual(sorted(buffer.getvalue().splitlines()), ['a\tb\t3', 'b\tc\t1'])
+
+        buffer = io.StringIO()
+        write_edge_list(g, buffer, weights=False)
+        loaded = read_edge_list(io.StringIO(buffer.getvalue()), nodetype=str)
+        self.assertSameGraph(loaded, g)
+
+if __name__ == '__main__':
+    unittest.main()
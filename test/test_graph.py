@@ -1,6 +1,13 @@
 import unittest
+import numpy as np
 from pygraphnet import Graph
 
+def graph_by_add_edge(edges, directed):
+    g = Graph(directed=directed)
+    for v, u in edges:
+        g.add_edge(v, u)
+    return g
+
 class TestGraph(unittest.TestCase):
     def test_init_empty_graph(self):
         g = Graph(5)
@@ -77,6 +84,39 @@ class TestGraph(unittest.TestCase):
         self.assertNotIn((0, 1), g.edges)
         self.assertNotIn(0, g.adj_list)
 
+    def test_del_vertex_incident_edges(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 2), (3, 1), (1, 3)]
+        for directed in (False, True):
+            g = Graph(edges, directed=directed)
+            g.set_weights({})
+            g.del_vertex(1)
+            expected = Graph([(2, 0), (2, 2)], directed=directed)
+            expected.add_vertex(3)
+            self.assertEqual(g.vertices, expected.vertices)
+            self.assertEqual(g.edges, expected.edges)
+            self.assertEqual(g.adj_list, expected.adj_list)
+            self.assertEqual({v: set(w) for v, w in g.adj_weights.items()}, expected.adj_list)
+
+    def test_in_neighbors(self):
+        g = Graph([(0, 1), (2, 1), (1, 1)], directed=True)
+        self.assertEqual(g.in_neighbors(1), {0, 1, 2})
+        self.assertEqual(g.in_degree(0), 0)
+
+        # the index follows later mutations
+        g.add_edge(3, 0)
+        g.add_edges_from([(4, 0), (0, 2)])
+        g.del_edge(2, 1)
+        g.del_vertex(1)
+        self.assertEqual(g.in_neighbors(0), {3, 4})
+        self.assertEqual(g.in_neighbors(2), {0})
+        self.assertEqual(g.in_degree(3), 0)
+        g.del_vertex(0)
+        self.assertEqual(g.in_degree(2), 0)
+
+        undirected = Graph([(0, 1), (2, 1)])
+        self.assertEqual(undirected.in_neighbors(1), {0, 2})
+        self.assertEqual(undirected.in_degree(0), 1)
+
     def test_add_edge_directed(self):
         g = Graph(directed=True)
         g.add_vertex(0)
@@ -108,5 +148,53 @@ class TestGraph(unittest.TestCase):
         self.assertNotIn((0, 1), g.edges)
         self.assertNotIn(1, g.adj_list[0])
 
+    def test_del_edge_added_both_ways(self):
+        g = Graph([(0, 1), (1, 0)])
+        g.del_edge(0, 1)
+        self.assertEqual(g.edges, set())
+        g.del_vertex(0)
+        self.assertEqual(g.adj_list, {1: set()})
+
+    def test_from_edges_numpy(self):
+        edges = np.array([[0, 1], [1, 2], [2, 0], [0, 1], [3, 3]])
+        for directed in (False, True):
+            g = Graph.from_edges(edges, directed=directed)
+            expected = graph_by_add_edge(edges.tolist(), directed)
+            self.assertEqual(g.directed, directed)
+            self.assertEqual(g.vertices, expected.vertices)
+            self.assertEqual(g.edges, expected.edges)
+            self.assertEqual(g.adj_list, expected.adj_list)
+
+    def test_add_edges_from_iterable(self):
+        edges = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('b', 'a'), ((0, 1), 'a')]
+        for directed in (False, True):
+            g = Graph(directed=directed)
+            g.add_vertex('z')
+            g.add_edges_from(iter(edges))
+            expected = graph_by_add_edge(edges, directed)
+            expected.add_vertex('z')
+            self.assertEqual(g.vertices, expected.vertices)
+            self.assertEqual(g.edges, expected.edges)
+            self.assertEqual(g.adj_list, expected.adj_list)
+
+    def test_add_edges_from_mixed_labels(self):
+        edges = [(0, 1), (1, 'a'), ('a', 2.5), (True, 0)]
+        g = Graph.from_edges(edges)
+        expected = graph_by_add_edge(edges, False)
+        self.assertEqual(g.edges, expected.edges)
+        self.assertEqual(g.adj_list, expected.adj_list)
+
+    def test_add_edges_from_existing_graph(self):
+        g = Graph([(0, 1)])
+        g.add_edges_from(np.array([[1, 2], [2, 3]]))
+        self.assertEqual(g.adj_list, {0: {1}, 1: {0, 2}, 2: {1, 3}, 3: {2}})
+
+    def test_add_edges_from_weighted_graph(self):
+        g = Graph([(0, 1)])
+        g.set_weights({(0, 1): 4})
+        g.add_edges_from([(1, 2)])
+        g.add_edges_from(np.array([[2, 3]]))
+        self.assertEqual(g.adj_weights, {0: {1: 4}, 1: {0: 4, 2: 1}, 2: {1: 1, 3: 1}, 3: {2: 1}})
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
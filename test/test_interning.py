@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from pygraphnet import Graph, VertexIndex, shortest_distance, cross_product
+
+class TestVertexIndex(unittest.TestCase):
+    def test_round_trip(self):
+        index = VertexIndex(['a', ('b', 1), 'a', 7])
+        self.assertEqual(index.labels, ['a', ('b', 1), 7])
+        self.assertEqual(index[('b', 1)], 1)
+        self.assertEqual(index.add('c'), 3)
+        self.assertEqual(index.add('a'), 0)
+        self.assertEqual(index.encode([7, 'a']).tolist(), [2, 0])
+        self.assertEqual(index.decode(np.array([3, 1])), ['c', ('b', 1)])
+        self.assertEqual(index.decode_dict({0: 5, 2: 6}), {'a': 5, 7: 6})
+        self.assertEqual(index.decode_dict({0: None, 2: 0}, values=True), {'a': None, 7: 'a'})
+        self.assertEqual(list(index), index.labels)
+
+    def test_discard_keeps_ids_contiguous(self):
+        index = VertexIndex('abcd')
+        index.discard('b')
+        self.assertEqual(index.labels, ['a', 'd', 'c'])
+        self.assertEqual(dict(index), {'a': 0, 'd': 1, 'c': 2})
+        index.discard('c')
+        index.discard('zz')
+        self.assertEqual(dict(index), {'a': 0, 'd': 1})
+
+class TestGraphInterning(unittest.TestCase):
+    def assertConsistent(self, g):
+        index = g.vertex_index()
+        self.assertEqual(set(index), g.vertices)
+        self.assertEqual(sorted(index.ids.values()), list(range(len(g.vertices))))
+        for v, i in index.items():
+            self.assertEqual(index.labels[i], v)
+
+    def test_vertex_index_follows_mutations(self):
+        g = Graph([('a', 'b'), ('b', 'c')], directed=True)
+        self.assertConsistent(g)
+        g.add_edge('c', 'd')
+        g.add_vertex('e')
+        g.add_edges_from([('x', 'y'), ('y', 'a')])
+        self.assertConsistent(g)
+        before = g.vertex_index()['a']
+        g.del_vertex('b')
+        self.assertConsistent(g)
+        self.assertEqual(g.vertex_index()['a'], before)
+        self.assertEqual(Graph(g)._vertex_index, None)
+
+    def test_relabel_to_integers(self):
+        g = Graph([('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')], directed=True)
+        g.set_weights({('a', 'b'): 2, ('c', 'd'): 5})
+        for ordering in ('default', 'sorted', 'degree'):
+            h, index = g.relabel_to_integers(ordering)
+            self.assertTrue(h.directed)
+            self.assertEqual(h.vertices, set(range(4)))
+            self.assertEqual({(index.labels[v], index.labels[u]) for v, u in h.edges}, g.edges)
+            self.assertEqual(h.adj_weights[index['a']][index['b']], 2)
+            distances, predecessors = shortest_distance(h, index['a'], pred_map=True)
+            self.assertEqual(index.decode_dict(distances), shortest_distance(g, 'a'))
+            self.assertEqual(index.decode_dict(predecessors, values=True)['d'], 'c')
+        self.assertEqual(g.relabel_to_integers('sorted')[1].labels, ['a', 'b', 'c', 'd'])
+        self.assertEqual(g.relabel_to_integers('degree')[1].labels[0], 'c')
+        with self.assertRaises(ValueError):
+            g.relabel_to_integers('random')
+
+    def test_snapshot_is_independent(self):
+        g = Graph([(0, 1)])
+        h, index = g.relabel_to_integers()
+        g.add_edge(1, 2)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(len(g.vertex_index()), 3)
+
+    def test_product_labels(self):
+        path = Graph([(0, 1), (1, 2)])
+        g = cross_product(cross_product(path, path), path)
+        h, index = g.relabel_to_integers()
+        source = ((0, 0), 0)
+        self.assertEqual(index.decode_dict(shortest_distance(h, index[source])), shortest_distance(g, source))
+
+if __name__ == '__main__':
+    unittest.main()
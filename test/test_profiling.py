@@ -0,0 +1,110 @@
+import json
+import unittest
+
+from pygraphnet import (Graph, CompactGraph, QueryCache, DynamicDistances, profile, shortest_distance,
+                        diameter, connected_components)
+from pygraphnet.operations import complement
+from pygraphnet.profiling import _active
+
+def path_graph(n, directed=False):
+    return Graph([(i, i + 1) for i in range(n - 1)], directed=directed)
+
+class TestProfiling(unittest.TestCase):
+    def test_nothing_recorded_when_inactive(self):
+        g = path_graph(10)
+        stats = profile()
+        diameter(g, method='ifub')
+        self.assertEqual(stats.as_dict(), {'counters': {}, 'peaks': {}, 'timings': {}})
+        self.assertEqual(_active, [])
+
+    def test_search_counters(self):
+        g = CompactGraph(path_graph(10))
+        with profile() as stats:
+            result = diameter(g, method='ifub')
+        self.assertEqual(result[0], 9)
+        counters = stats.counters
+        self.assertGreater(counters['bfs.searches'], 0)
+        # every search on a path reaches all vertices and scans every CSR entry
+        self.assertEqual(counters['bfs.vertices_reached'], 10 * counters['bfs.searches'])
+        self.assertEqual(counters['bfs.edges_scanned'], 18 * counters['bfs.searches'])
+        self.assertEqual(stats.peaks['bfs.frontier'], 2)
+
+    def test_dijkstra_counters(self):
+        g = path_graph(5, directed=True)
+        g.set_weights({(i, i + 1): 2 for i in range(4)})
+        with profile() as stats:
+            self.assertEqual(shortest_distance(g, 0, queue='heap')[4], 8)
+            shortest_distance(g, 0, queue='dial')
+        self.assertEqual(stats.counters['dijkstra.searches'], 1)
+        self.assertEqual(stats.counters['dijkstra.vertices_settled'], 5)
+        self.assertEqual(stats.counters['buckets.searches'], 1)
+        self.assertEqual(stats.counters['buckets.edges_relaxed'], 4)
+        # a path keeps one entry on the heap at a time
+        self.assertEqual(stats.peaks['dijkstra.heap'], 1)
+        self.assertIn('buckets.pending', stats.peaks)
+
+    def test_phase_paths(self):
+        g = path_graph(20)
+        with profile() as stats:
+            diameter(g, method='ifub')
+            connected_components(g)
+        timings = stats.timings
+        for path in ('diameter', 'diameter/diameter_bounds', 'diameter/diameter_bounds/sweeps',
+                     'connected_components'):
+            self.assertIn(path, timings)
+            self.assertEqual(timings[path]['calls'], 1)
+        self.assertGreaterEqual(timings['diameter']['seconds'], timings['diameter/diameter_bounds']['seconds'])
+
+    def test_operations_and_mutations(self):
+        g = path_graph(4)
+        with profile() as stats:
+            g.add_edge(3, 4)
+            g.add_edges_from([(4, 5), (5, 6)])
+            complement(g)
+        self.assertEqual(stats.counters['graph.add_edge'], 1)
+        self.assertEqual(stats.counters['graph.add_edges'], 2)
+        self.assertIn('complement/load', stats.timings)
+
+    def test_cache_counters(self):
+        g = QueryCache().attach(path_graph(6))
+        with profile() as stats:
+            shortest_distance(g, 0)
+            shortest_distance(g, 0)
+        self.assertEqual(stats.counters['cache.misses'], 1)
+        self.assertEqual(stats.counters['cache.hits'], 1)
+        self.assertEqual(stats.timings['shortest_distance']['calls'], 2)
+
+    def test_dynamic_counters(self):
+        g = path_graph(5)
+        distances = DynamicDistances(g, 0)
+        with profile() as stats:
+            g.add_edge(0, 4)
+            g.del_edge(0, 4)
+        distances.close()
+        self.assertEqual(stats.counters['dynamic.decreases'], 1)
+        self.assertEqual(stats.counters['dynamic.repairs'], 1)
+
+    def test_callback_and_nesting(self):
+        calls = []
+        g = path_graph(8)
+        with profile(lambda path, seconds: calls.append(path)) as outer:
+            connected_components(g)
+            with profile() as inner:
+                diameter(g, method='ifub')
+        # phases end before the calls they run under
+        self.assertEqual(calls[:2], ['connected_components/csr_conversion', 'connected_components'])
+        self.assertIn('diameter', calls)
+        self.assertNotIn('connected_components', inner.timings)
+        self.assertEqual(inner.counters['bfs.searches'], outer.counters['bfs.searches'])
+
+    def test_export(self):
+        with profile() as stats:
+            diameter(path_graph(8), method='ifub')
+        exported = json.loads(json.dumps(stats.as_dict()))
+        self.assertEqual(exported['counters'], stats.counters)
+        self.assertIn('bfs.edges_scanned', stats.report())
+        stats.clear()
+        self.assertEqual(stats.report(), '')
+
+if __name__ == '__main__':
+    unittest.main()
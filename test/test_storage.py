@@ -0,0 +1,107 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from pygraphnet import Graph, CompactGraph, save_graph, load_graph, shortest_distance
+
+class TestGraphStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'graph.pgn')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def round_trip(self, g, **kwargs):
+        save_graph(g, self.path)
+        return load_graph(self.path, **kwargs)
+
+    def assertSameGraph(self, loaded, g):
+        self.assertEqual(loaded.directed, g.directed)
+        self.assertEqual(set(loaded.vertices), set(g.vertices))
+        self.assertEqual({v: set(loaded.adj_list[v]) for v in loaded.vertices},
+                         {v: set(g.adj_list[v]) for v in g.vertices})
+
+    def test_integer_labels(self):
+        for directed in (False, True):
+            g = Graph([(0, 1), (1, 2), (2, 3), (3, 0), (1, 3)], directed=directed)
+            loaded = self.round_trip(g)
+            self.assertIsInstance(loaded, CompactGraph)
+            self.assertIsInstance(loaded.indices, np.memmap)
+            self.assertSameGraph(loaded, g)
+            self.assertEqual(shortest_distance(loaded, 0), shortest_distance(g, 0))
+
+        g = Graph([(10, -5), (-5, 7), (2 ** 40, 10)])
+        self.assertSameGraph(self.round_trip(g), g)
+
+    def test_string_labels(self):
+        g = Graph([('a', 'b'), ('b', 'ç'), ('ç', ''), ('', 'a')])
+        self.assertSameGraph(self.round_trip(g), g)
+
+    def test_pickled_labels(self):
+        g = Graph([(0, 'a'), ('a', (1, 2)), ((1, 2), 2 ** 70)])
+        save_graph(g, self.path)
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+        self.assertSameGraph(load_graph(self.path, allow_pickle=True), g)
+
+    def test_weights(self):
+        for weights in ({(0, 1): 3, (1, 2): 4, (0, 2): 10}, {(0, 1): 0.5, (1, 2): 0.25, (0, 2): 1.5}):
+            g = Graph([(0, 1), (1, 2), (0, 2)], directed=True)
+            g.set_weights(weights)
+            loaded = self.round_trip(g)
+            self.assertEqual(loaded.weights.dtype, np.asarray(list(weights.values())).dtype)
+            self.assertEqual(shortest_distance(loaded, 0), shortest_distance(g, 0))
+            self.assertEqual(loaded.to_graph().adj_weights, g.adj_weights)
+
+    def test_empty_graphs(self):
+        for g in (Graph(), Graph(3), CompactGraph(directed=True)):
+            loaded = self.round_trip(g)
+            self.assertSameGraph(loaded, g)
+            self.assertEqual(len(loaded.edges), 0)
+
+    def test_in_memory_load(self):
+        g = Graph([(0, 1), (1, 2)])
+        loaded = self.round_trip(g, mmap=False)
+        self.assertNotIsInstance(loaded.indices, np.memmap)
+        self.assertSameGraph(loaded, g)
+
+    def test_read_only(self):
+        loaded = self.round_trip(Graph([(0, 1), (1, 2)]))
+        with self.assertRaises(ValueError):
+            loaded.indices[0] = 2
+
+    def test_range_labels(self):
+        g = CompactGraph([(0, 1), (1, 2), (2, 3)])
+        loaded = self.round_trip(g)
+        self.assertIn(3, loaded.vertices)
+        self.assertNotIn(4, loaded.vertices)
+        self.assertNotIn('0', loaded.vertices)
+        self.assertEqual(loaded.vertices, {0, 1, 2, 3})
+        self.assertEqual(loaded.neighbors(1), g.neighbors(1))
+
+    def test_pickling_reopens_the_file(self):
+        loaded = self.round_trip(Graph([(0, 1), (1, 2)]))
+        copy = pickle.loads(pickle.dumps(loaded))
+        self.assertIsInstance(copy.indices, np.memmap)
+        self.assertSameGraph(copy, loaded)
+        self.assertLess(len(pickle.dumps(loaded)), 200)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'0 1\n1 2\n')
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+        save_graph(Graph([(0, 1)]), self.path)
+        with open(self.path, 'r+b') as f:
+            f.seek(8)
+            f.write((99).to_bytes(4, 'little'))
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from pygraphnet import Graph, CompactGraph, EdgeWeights, normalize_weights
+from pygraphnet import shortest_distance, shortest_path, diameter
+
+class TestEdgeWeights(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0)]
+        self.weights = {(0, 1): 2, (1, 2): 2, (2, 3): 2, (3, 4): 10, (4, 0): 2}
+
+    def test_normalize_undirected(self):
+        g = Graph(self.edges)
+        weights = normalize_weights(g, {(0, 1): 5})
+        self.assertIsInstance(weights, EdgeWeights)
+        self.assertEqual(weights[0], {1: 5, 4: 1})
+        self.assertEqual(weights[1][0], 5)
+
+    def test_normalize_directed(self):
+        g = Graph(self.edges, directed=True)
+        weights = normalize_weights(g, self.weights)
+        self.assertEqual(weights[3], {4: 10})
+        self.assertEqual(weights[4], {0: 2})
+
+    def test_normalize_rejects_bad_weights(self):
+        g = Graph(self.edges, directed=True)
+        with self.assertRaises(ValueError):
+            normalize_weights(g, {(0, 1): -1})
+        with self.assertRaises(ValueError):
+            normalize_weights(g, {(0, 1): float('nan')})
+        with self.assertRaises(TypeError):
+            normalize_weights(g, {(0, 1): '2'})
+        with self.assertRaises(ValueError):
+            normalize_weights(g, {(1, 0): 2})
+        self.assertEqual(normalize_weights(g, {(1, 0): 2}, strict=False)[1], {2: 1})
+
+    def test_set_weights(self):
+        g = Graph(self.edges)
+        g.set_weights(self.weights)
+        self.assertEqual(g.adj_weights[3], {2: 2, 4: 10})
+        g.set_weights(None)
+        self.assertIsNone(g.adj_weights)
+
+    def test_mutations_keep_weights(self):
+        g = Graph(self.edges)
+        g.add_edge(0, 2, weight=7)
+        self.assertEqual(g.adj_weights[0], {1: 1, 2: 7, 4: 1})
+        self.assertEqual(g.adj_weights[2][0], 7)
+        g.add_edge(0, 5)
+        self.assertEqual(g.adj_weights[5], {0: 1})
+        g.del_edge(0, 2)
+        self.assertNotIn(2, g.adj_weights[0])
+        self.assertNotIn(0, g.adj_weights[2])
+        g.del_vertex(4)
+        self.assertNotIn(4, g.adj_weights)
+        self.assertNotIn(4, g.adj_weights[0])
+
+    def test_copy_keeps_weights(self):
+        g = Graph(self.edges)
+        g.set_weights(self.weights)
+        copy = Graph(g)
+        copy.add_edge(0, 1, weight=9)
+        self.assertEqual(g.adj_weights[0][1], 2)
+
+    def test_compact_weights(self):
+        g = Graph(self.edges, directed=True)
+        g.set_weights(self.weights)
+        compact = CompactGraph(g)
+        self.assertEqual(compact.neighbor_weights(compact.index[3]).tolist(), [10])
+        self.assertEqual(compact.reverse().neighbor_weights(compact.index[4]).tolist(), [10])
+        self.assertEqual(CompactGraph(self.edges, directed=True).with_weights(self.weights).weights.tolist(),
+                         compact.weights.tolist())
+        self.assertEqual(compact.to_graph().adj_weights, g.adj_weights)
+
+    def test_attached_weights_match_dict(self):
+        for directed in (False, True):
+            g = Graph(self.edges, directed=directed)
+            attached = Graph(g)
+            attached.set_weights(self.weights)
+            compact = CompactGraph(attached)
+            for graph in (attached, compact):
+                self.assertEqual(shortest_distance(graph), shortest_distance(g, weights=self.weights))
+                self.assertEqual(diameter(graph), diameter(g, self.weights))
+                for t in g.vertices:
+                    expected = shortest_distance(g, 3, t, weights=self.weights)
+                    self.assertEqual(shortest_distance(graph, 3, t), expected)
+                    vertices, _ = shortest_path(graph, 3, t, bidirectional=True)
+                    if t != 3:
+                        self.assertEqual(vertices[0], 3)
+                        self.assertEqual(vertices[-1], t)
+
+    def test_normalized_weights_argument(self):
+        g = Graph(self.edges)
+        weights = normalize_weights(g, self.weights)
+        self.assertEqual(shortest_distance(g, 0, weights=weights), shortest_distance(g, 0, weights=self.weights))
+        self.assertEqual(shortest_path(g, 3, 4, weights), shortest_path(g, 3, 4, self.weights))
+
+if __name__ == '__main__':
+    unittest.main()
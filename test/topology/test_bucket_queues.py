@@ -0,0 +1,106 @@
+import random
+import unittest
+from pygraphnet import Graph, CompactGraph, shortest_distance, multi_source_distance, iter_distances, profile
+
+def random_weighted_graph(rng, num_vertices, num_edges, directed, weight):
+    edges = [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges)]
+    g = Graph(edges, directed=directed)
+    return g, {edge: weight() for edge in g.edges}
+
+class TestBucketQueues(unittest.TestCase):
+    def assertValidPredecessors(self, g, weights, distances, predecessors):
+        for v, p in predecessors.items():
+            if p is None:
+                continue
+            weight = weights.get((p, v), weights.get((v, p)) if not g.directed else None)
+            self.assertEqual(distances[p] + weight, distances[v])
+
+    def test_queues_agree_with_heap(self):
+        rng = random.Random(7)
+        for directed in (False, True):
+            for weight in (lambda: rng.randint(0, 5), lambda: rng.randint(1, 100), lambda: rng.random() * 10):
+                for _ in range(10):
+                    g, weights = random_weighted_graph(rng, 40, 90, directed, weight)
+                    g.set_weights(weights)
+                    compact = CompactGraph(g)
+                    source = next(iter(g.vertices))
+                    expected = shortest_distance(g, source, queue='heap')
+                    integral = all(isinstance(w, int) for w in weights.values())
+                    for queue in ('delta', 'dial') if integral else ('delta',):
+                        for graph in (g, compact):
+                            distances, predecessors = shortest_distance(graph, source, pred_map=True, queue=queue)
+                            self.assertEqual(distances, expected)
+                            self.assertValidPredecessors(g, weights, distances, predecessors)
+                        # explicit weights are normalized into the CSR arrays
+                        unweighted = Graph(list(g.edges), directed=directed)
+                        self.assertEqual(shortest_distance(unweighted, source, weights=weights, queue=queue),
+                                         expected)
+
+    def test_integer_results(self):
+        g = Graph([(0, 1), (1, 2)])
+        g.set_weights({(0, 1): 2, (1, 2): 3})
+        result = shortest_distance(g, 0, queue='dial')
+        self.assertEqual(result, {0: 0, 1: 2, 2: 5})
+        self.assertTrue(all(isinstance(d, int) for d in result.values()))
+
+    def test_unreachable(self):
+        g = Graph([(0, 1), (2, 3)], directed=True)
+        g.set_weights({(0, 1): 4})
+        expected = {0: 0, 1: 4, 2: float('inf'), 3: float('inf')}
+        self.assertEqual(shortest_distance(g, 0, queue='delta'), expected)
+
+    def test_multi_source(self):
+        rng = random.Random(3)
+        g, weights = random_weighted_graph(rng, 60, 150, False, lambda: rng.randint(1, 20))
+        sources = rng.sample(sorted(g.vertices), 4)
+        expected = multi_source_distance(g, sources, weights=weights, queue='heap')
+        for queue in ('dial', 'delta'):
+            self.assertEqual(multi_source_distance(g, sources, weights=weights, queue=queue), expected)
+
+    def test_auto_on_large_graph(self):
+        rng = random.Random(5)
+        g, weights = random_weighted_graph(rng, 3000, 9000, True, lambda: rng.randint(1, 100))
+        g.set_weights(weights)
+        compact = CompactGraph(g)
+        for source in list(g.vertices)[:3]:
+            expected = shortest_distance(g, source, queue='heap')
+            self.assertEqual(shortest_distance(g, source), expected)
+            row = next(iter_distances(compact, [source]))[1]
+            self.assertEqual(row.tolist(), list(expected.values()))
+
+    def test_float_weights_keep_source_at_int_zero(self):
+        rng = random.Random(9)
+        g, weights = random_weighted_graph(rng, 1500, 4000, False, lambda: rng.random() * 10)
+        g.set_weights(weights)
+        source = next(iter(g.vertices))
+        for queue in ('auto', 'delta', 'heap'):
+            self.assertIs(type(shortest_distance(g, source, queue=queue)[source]), int)
+        self.assertIs(type(next(iter_distances(g, [source], sparse=True))[1][source]), int)
+
+    def test_float_bucket_boundary_on_large_graph(self):
+        # (d // delta + 1) * delta rounds down to d = 30828.0 on this path
+        g = Graph([(i, i + 1) for i in range(1100)])
+        g.set_weights({(i, i + 1): float(i % 100 + 1) for i in range(1100)})
+        expected = shortest_distance(g, 0, queue='heap')
+        for queue in ('delta', 'auto'):
+            self.assertEqual(shortest_distance(g, 0, queue=queue), expected)
+
+    def test_auto_shares_explicit_weights_across_sources(self):
+        rng = random.Random(11)
+        g, weights = random_weighted_graph(rng, 1200, 3000, True, lambda: rng.randint(1, 100))
+        expected = shortest_distance(g, weights=weights, queue='heap')
+        with profile() as stats:
+            self.assertEqual(shortest_distance(g, weights=weights), expected)
+        self.assertEqual(stats.counters['buckets.searches'], len(g.vertices))
+        self.assertNotIn('dijkstra.searches', stats.counters)
+
+    def test_invalid_queue(self):
+        g = Graph([(0, 1)])
+        g.set_weights({(0, 1): 0.5})
+        with self.assertRaises(ValueError):
+            shortest_distance(g, 0, queue='dial')
+        with self.assertRaises(ValueError):
+            shortest_distance(g, 0, queue='fibonacci')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+from pygraphnet import (Graph, CompactGraph, complement, shortest_distance, shortest_path,
+                        iter_distances, distance_matrix, multi_source_distance, diameter)
+
+class TestComplementTraversal(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.graphs = []
+        for directed in (False, True):
+            g = Graph(directed=directed)
+            for v in range(12):
+                g.add_vertex(v)
+            for _ in range(50):
+                g.add_edge(rng.randrange(12), rng.randrange(12))
+            self.graphs.append(g)
+        # a complement with unreachable vertices: a star's leaves are all adjacent, the hub is isolated
+        self.graphs.append(Graph([(0, v) for v in range(1, 6)]))
+
+    def test_distances_match_materialized(self):
+        for g in self.graphs:
+            for base in (g, CompactGraph(g)):
+                view = complement(base, lazy=True)
+                full = complement(g)
+                self.assertEqual(shortest_distance(view), shortest_distance(full))
+                self.assertEqual(multi_source_distance(view, [0, 1]), multi_source_distance(full, [0, 1]))
+                for v in g.vertices:
+                    self.assertEqual(shortest_distance(view, 0, v), shortest_distance(full, 0, v))
+                self.assertEqual(diameter(view)[0], diameter(full)[0])
+
+    def test_rows_and_matrix(self):
+        for g in self.graphs:
+            view = complement(g, lazy=True)
+            full = complement(g)
+            rows = dict(iter_distances(view, sparse=True))
+            self.assertEqual(rows, dict(iter_distances(full, sparse=True)))
+            matrix = distance_matrix(view, [0, 2])
+            for row, source in zip(matrix, [0, 2]):
+                expected = shortest_distance(full, source)
+                self.assertEqual(row.tolist(), [expected[v] for v in view.vertices])
+
+    def test_shortest_path(self):
+        for g in self.graphs:
+            view = complement(g, lazy=True)
+            full = complement(g)
+            for v in g.vertices:
+                for bidirectional in (False, True):
+                    path, edges = shortest_path(view, 0, v, bidirectional=bidirectional)
+                    self.assertEqual(len(edges), len(shortest_path(full, 0, v)[1]))
+                    for edge in edges:
+                        self.assertIn(edge, view.edges)
+
+if __name__ == '__main__':
+    unittest.main()
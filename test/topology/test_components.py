@@ -0,0 +1,95 @@
+import random
+import sys
+import unittest
+from pygraphnet import (Graph, CompactGraph, connected_components, strongly_connected_components,
+                        component_graph, shortest_distance, diameter, cross_product)
+
+def reachable(g, v):
+    return {u for u, d in shortest_distance(g, v).items() if d != float('inf')}
+
+def partition(g, labels):
+    groups = {}
+    for v, label in zip(g.vertices, labels.tolist()):
+        groups.setdefault(label, set()).add(v)
+    return {frozenset(group) for group in groups.values()}
+
+class TestComponents(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (5, 6), ('a', 'b')]
+
+    def test_connected_components(self):
+        g = Graph(self.edges)
+        g.add_vertex('isolated')
+        count, labels = connected_components(g)
+        self.assertEqual(count, 4)
+        self.assertEqual(len(labels), len(g.vertices))
+        self.assertEqual(partition(g, labels), {frozenset({0, 1, 2, 3, 4}), frozenset({5, 6}),
+                                                frozenset({'a', 'b'}), frozenset({'isolated'})})
+        # ids follow the first vertex of each component
+        first_seen = list(dict.fromkeys(labels.tolist()))
+        self.assertEqual(first_seen, list(range(count)))
+
+    def test_weak_and_strong_components(self):
+        g = Graph(self.edges, directed=True)
+        count, labels = connected_components(g)
+        self.assertEqual(count, 3)
+        count, labels = strongly_connected_components(g)
+        self.assertEqual(partition(g, labels), {frozenset({0, 1, 2}), frozenset({3, 4}), frozenset({5}),
+                                                frozenset({6}), frozenset({'a'}), frozenset({'b'})})
+        self.assertEqual(count, 6)
+
+    def test_match_reachability(self):
+        rng = random.Random(1)
+        for directed in (False, True):
+            for _ in range(20):
+                edges = [(rng.randrange(30), rng.randrange(30)) for _ in range(rng.randrange(1, 45))]
+                g = Graph(edges, directed=directed)
+                reach = {v: reachable(g, v) for v in g.vertices}
+                strong = {frozenset(u for u in reach[v] if v in reach[u]) for v in g.vertices}
+                self.assertEqual(partition(g, strongly_connected_components(g)[1]), strong)
+
+                undirected = Graph(edges)
+                weak = {frozenset(reachable(undirected, v)) for v in g.vertices}
+                self.assertEqual(partition(g, connected_components(g)[1]), weak)
+                self.assertEqual(partition(g, connected_components(CompactGraph(g))[1]), weak)
+
+    def test_deep_graph(self):
+        n = 3 * sys.getrecursionlimit()
+        g = CompactGraph([(i, i + 1) for i in range(n)] + [(n, 0)], directed=True)
+        self.assertEqual(strongly_connected_components(g)[0], 1)
+        g = CompactGraph([(i, i + 1) for i in range(n)], directed=True)
+        self.assertEqual(strongly_connected_components(g)[0], n + 1)
+
+    def test_empty_graph(self):
+        self.assertEqual(connected_components(Graph())[0], 0)
+        self.assertEqual(strongly_connected_components(Graph(directed=True))[0], 0)
+
+    def test_product_components(self):
+        g1 = Graph([(0, 1), (2, 3)], directed=True)
+        g2 = Graph([('x', 'y'), ('y', 'x'), ('z', 'z')])
+        view = cross_product(g1, g2, lazy=True)
+        product = cross_product(g1, g2)
+        for components in (connected_components, strongly_connected_components):
+            count, labels = components(view)
+            expected_count, expected = components(product)
+            self.assertEqual(count, expected_count)
+            self.assertEqual(partition(view, labels), partition(product, expected))
+
+    def test_component_graph(self):
+        g = Graph(self.edges, directed=True)
+        g.set_weights({(2, 3): 5, (3, 4): 2})
+        weak = component_graph(g, 4)
+        self.assertEqual(set(weak.vertices), {0, 1, 2, 3, 4})
+        distances = shortest_distance(g, 0)
+        self.assertEqual(shortest_distance(weak, 0), {v: distances[v] for v in weak.vertices})
+        strong = component_graph(g, 4, strong=True)
+        self.assertEqual(set(strong.vertices), {3, 4})
+        self.assertEqual(set(strong.edges), {(3, 4), (4, 3)})
+        self.assertEqual(diameter(strong), (2, (3, 4)))
+
+        undirected = Graph(self.edges)
+        self.assertEqual(diameter(undirected)[0], float('inf'))
+        self.assertEqual(diameter(component_graph(undirected, 0)), (3, (0, 4)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from pygraphnet import Graph, diameter, diameter_bounds, shortest_distance
+
+class TestDiameterBounds(unittest.TestCase):
+    def random_graphs(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            n = rng.randint(2, 40)
+            edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(n, 3 * n))]
+            # a ring keeps most graphs (strongly) connected
+            ring = [(i, (i + 1) % n) for i in range(n)] if rng.random() < 0.8 else []
+            for directed in (False, True):
+                yield Graph(edges + ring, directed=directed)
+
+    def test_exact_matches_all_pairs(self):
+        for g in self.random_graphs():
+            expected, _ = diameter(g)
+            max_distance, end_points = diameter(g, method='ifub')
+            self.assertEqual(max_distance, expected)
+            if expected != float('inf'):
+                self.assertEqual(shortest_distance(g, end_points[0], end_points[1]), expected)
+
+    def test_tolerance_bounds(self):
+        for g in self.random_graphs():
+            expected, _ = diameter(g)
+            lower, upper, _ = diameter_bounds(g, tolerance=2)
+            if expected == float('inf'):
+                self.assertEqual(lower, expected)
+                continue
+            self.assertLessEqual(lower, expected)
+            self.assertGreaterEqual(upper, expected)
+            self.assertLessEqual(upper - lower, 2)
+
+    def test_existing_graphs(self):
+        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0)]
+        self.assertEqual(diameter(Graph(edges), method='ifub')[0], 2)
+        self.assertEqual(diameter(Graph(edges, directed=True), method='ifub'), (4, (0, 4)))
+
+    def test_search_budget(self):
+        for g in self.random_graphs():
+            expected, _ = diameter(g)
+            if expected == float('inf'):
+                continue
+            lower, upper, end_points = diameter_bounds(g, max_searches=8)
+            self.assertLessEqual(lower, expected)
+            self.assertGreaterEqual(upper, expected)
+            if lower:
+                self.assertEqual(shortest_distance(g, end_points[0], end_points[1]), lower)
+
+    def test_trivial_graphs(self):
+        self.assertEqual(diameter(Graph(), method='ifub'), (0, ()))
+        self.assertEqual(diameter(Graph(1), method='ifub'), (0, ()))
+
+    def test_weighted_rejected(self):
+        with self.assertRaises(ValueError):
+            diameter(Graph([(0, 1)]), {(0, 1): 2}, method='ifub')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import unittest
+from pygraphnet import Graph, DynamicDistances, shortest_distance
+
+class TestDynamicDistances(unittest.TestCase):
+    def random_graph(self, rng, directed, weighted):
+        g = Graph(directed=directed)
+        for v in range(15):
+            g.add_vertex(v)
+        for _ in range(35):
+            g.add_edge(rng.randrange(15), rng.randrange(15))
+        if weighted:
+            g.set_weights({edge: rng.choice([0, 1, 2, 5]) for edge in g.edges})
+        return g
+
+    def mutate(self, rng, g, weighted):
+        action = rng.random()
+        vertices = sorted(g.vertices)
+        if action < 0.4:
+            weight = rng.choice([0, 1, 2, 5]) if weighted else None
+            g.add_edge(rng.choice(vertices), rng.choice(vertices), weight=weight)
+        elif action < 0.8:
+            if g.edges:
+                g.del_edge(*rng.choice(sorted(g.edges)))
+        elif action < 0.9:
+            g.add_edges_from([(rng.choice(vertices), rng.randrange(20)) for _ in range(3)])
+        elif len(vertices) > 3:
+            g.del_vertex(rng.choice(vertices[1:]))
+
+    def test_random_mutations(self):
+        for seed in range(6):
+            rng = random.Random(seed)
+            for directed in (False, True):
+                for weighted in (False, True):
+                    g = self.random_graph(rng, directed, weighted)
+                    dynamic = DynamicDistances(g, 0, check=True)
+                    for _ in range(80):
+                        # check=True raises on the first repair that differs from a recomputation
+                        self.mutate(rng, g, weighted)
+                    self.assertEqual(dynamic.distances, shortest_distance(g, 0))
+
+    def test_reweighted_edge(self):
+        g = Graph([(0, 1), (1, 2), (0, 2)], directed=True)
+        g.set_weights({(0, 1): 1, (1, 2): 1, (0, 2): 5})
+        dynamic = DynamicDistances(g, 0, check=True)
+        self.assertEqual(dynamic.distances[2], 2)
+        g.add_edge(1, 2, weight=10)
+        self.assertEqual(dynamic.distances[2], 5)
+        self.assertEqual(dynamic.predecessors[2], 0)
+        g.add_edge(0, 2, weight=0)
+        self.assertEqual(dynamic.distances[2], 0)
+
+    def test_source_deleted_and_close(self):
+        g = Graph([(0, 1), (1, 2)])
+        dynamic = DynamicDistances(g, 0)
+        g.del_vertex(0)
+        self.assertEqual(dynamic.distances, {1: float('inf'), 2: float('inf')})
+
+        g = Graph([(0, 1), (1, 2)])
+        dynamic = DynamicDistances(g, 0)
+        dynamic.close()
+        g.del_edge(0, 1)
+        self.assertEqual(dynamic.distances[2], 2)
+        dynamic.recompute()
+        self.assertEqual(dynamic.distances[2], float('inf'))
+
+    def test_missing_source(self):
+        with self.assertRaises(KeyError):
+            DynamicDistances(Graph([(0, 1)]), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+from collections import deque
+from pygraphnet import Graph, CompactGraph, shortest_distance
+
+def reference_bfs(g, source):
+    distances = {v: float('inf') for v in g.vertices}
+    predecessors = {v: None for v in g.vertices}
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        current_vertex = queue.popleft()
+        for neighbor in g.adj_list[current_vertex]:
+            if distances[neighbor] == float('inf'):
+                distances[neighbor] = distances[current_vertex] + 1
+                predecessors[neighbor] = current_vertex
+                queue.append(neighbor)
+    return distances, predecessors
+
+class TestFrontierBFS(unittest.TestCase):
+    def random_graph(self, seed, directed):
+        rng = random.Random(seed)
+        edges = [(rng.randrange(60), rng.randrange(60)) for _ in range(150)]
+        return Graph(edges, directed=directed)
+
+    def test_matches_fifo_bfs(self):
+        for seed in range(5):
+            for directed in (False, True):
+                g = self.random_graph(seed, directed)
+                for source in list(g.vertices)[:10]:
+                    result = shortest_distance(g, source, pred_map=True)
+                    self.assertEqual(result, reference_bfs(g, source))
+
+    def test_compact_graph_input(self):
+        g = self.random_graph(7, True)
+        source = next(iter(g.vertices))
+        result = shortest_distance(CompactGraph(g), source, pred_map=True)
+        self.assertEqual(result, reference_bfs(g, source))
+
+    def test_unreachable_vertices(self):
+        g = Graph([(0, 1), (2, 3)])
+        distances, predecessors = shortest_distance(g, 0, pred_map=True)
+        self.assertEqual(distances, {0: 0, 1: 1, 2: float('inf'), 3: float('inf')})
+        self.assertEqual(predecessors, {0: None, 1: 0, 2: None, 3: None})
+
+    def test_isolated_source(self):
+        g = Graph(3)
+        self.assertEqual(shortest_distance(g, 1), {0: float('inf'), 1: 0, 2: float('inf')})
+
+    def test_integer_distances(self):
+        g = Graph([(0, 1), (1, 2)])
+        distances = shortest_distance(g, 0)
+        self.assertTrue(all(type(d) is int for d in distances.values()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+from pygraphnet import Graph, CompactGraph, isomorphism, is_isomorphic, graph_hash
+from pygraphnet.operations import complement
+
+def relabeled(g, rng):
+    vertices = list(g.vertices)
+    shuffled = vertices[:]
+    rng.shuffle(shuffled)
+    names = dict(zip(vertices, (f"v{v}" for v in shuffled)))
+    edges = list(g.edges)
+    rng.shuffle(edges)
+    result = Graph([(names[v], names[u]) for v, u in edges], directed=g.directed)
+    for v in vertices:
+        result.add_vertex(names[v])
+    return result
+
+def strongly_regular_pair():
+    # the 4x4 rook's graph and the Shrikhande graph share every invariant used for pruning
+    vertices = [(i, j) for i in range(4) for j in range(4)]
+    shifts = {(1, 0), (3, 0), (0, 1), (0, 3), (1, 1), (3, 3)}
+    rook = Graph([(a, b) for a in vertices for b in vertices if a < b and (a[0] == b[0] or a[1] == b[1])])
+    shrikhande = Graph([(a, b) for a in vertices for b in vertices
+                        if a < b and ((b[0] - a[0]) % 4, (b[1] - a[1]) % 4) in shifts])
+    return rook, shrikhande
+
+class TestIsomorphism(unittest.TestCase):
+    def assertIsomorphism(self, g1, g2, mapping):
+        self.assertEqual(set(mapping), set(g1.vertices))
+        self.assertEqual(set(mapping.values()), set(g2.vertices))
+        image = {(mapping[v], mapping[u]) for v, u in g1.edges}
+        if g1.directed:
+            self.assertEqual(image, set(g2.edges))
+        else:
+            self.assertEqual({frozenset(edge) for edge in image}, {frozenset(edge) for edge in g2.edges})
+
+    def test_relabeled_random_graphs(self):
+        rng = random.Random(11)
+        for directed in (False, True):
+            for _ in range(15):
+                num_vertices = rng.randint(1, 40)
+                edges = [(rng.randrange(num_vertices), rng.randrange(num_vertices))
+                         for _ in range(rng.randint(0, 80))]
+                g1 = Graph(edges, directed=directed)
+                g2 = relabeled(g1, rng)
+                mapping = isomorphism(g1, g2)
+                self.assertIsNotNone(mapping)
+                self.assertIsomorphism(g1, g2, mapping)
+                self.assertEqual(graph_hash(g1), graph_hash(g2))
+
+    def test_non_isomorphic(self):
+        cycle = Graph([(i, (i + 1) % 6) for i in range(6)])
+        triangles = Graph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)])
+        # refinement alone cannot separate 2-regular graphs; distance fingerprints can
+        self.assertEqual(graph_hash(cycle), graph_hash(triangles))
+        self.assertFalse(is_isomorphic(cycle, triangles))
+
+        path = Graph([(0, 1), (1, 2)], directed=True)
+        self.assertFalse(is_isomorphic(path, Graph([(0, 1), (2, 1)], directed=True)))
+        self.assertFalse(is_isomorphic(path, Graph([(0, 1), (1, 2)])))
+        self.assertFalse(is_isomorphic(path, Graph([(0, 1), (1, 2), (2, 0)], directed=True)))
+
+    def test_strongly_regular(self):
+        rook, shrikhande = strongly_regular_pair()
+        self.assertFalse(is_isomorphic(rook, shrikhande))
+        rng = random.Random(2)
+        for g in (rook, shrikhande):
+            other = relabeled(g, rng)
+            self.assertIsomorphism(g, other, isomorphism(g, other))
+
+    def test_self_loops_and_isolated_vertices(self):
+        g1 = Graph([(0, 0), (0, 1), (1, 2)])
+        g1.add_vertex(3)
+        g2 = Graph([(2, 2), (2, 1), (1, 0)])
+        g2.add_vertex(9)
+        self.assertIsomorphism(g1, g2, isomorphism(g1, g2))
+        self.assertFalse(is_isomorphic(g1, Graph([(0, 1), (1, 2), (2, 2), (3, 3)])))
+        self.assertEqual(isomorphism(Graph(), Graph()), {})
+
+    def test_compact_and_views(self):
+        rng = random.Random(4)
+        g = Graph([(rng.randrange(12), rng.randrange(12)) for _ in range(20)])
+        other = relabeled(g, rng)
+        self.assertTrue(is_isomorphic(CompactGraph(g), other))
+        self.assertTrue(is_isomorphic(complement(g, lazy=True), complement(other)))
+        self.assertEqual(graph_hash(CompactGraph(g)), graph_hash(other))
+
+    def test_hash_iterations(self):
+        star = Graph([(0, i) for i in range(1, 5)])
+        path = Graph([(i, i + 1) for i in range(4)])
+        self.assertNotEqual(graph_hash(star), graph_hash(path))
+        self.assertEqual(graph_hash(star, iterations=0), graph_hash(path, iterations=0))
+        self.assertNotEqual(graph_hash(star, iterations=1), graph_hash(path, iterations=1))
+
+if __name__ == '__main__':
+    unittest.main()
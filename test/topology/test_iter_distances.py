@@ -0,0 +1,54 @@
+import random
+import unittest
+import numpy as np
+from pygraphnet import Graph, CompactGraph, shortest_distance, iter_distances, diameter
+
+class TestIterDistances(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        edges = [(rng.randrange(30), rng.randrange(30)) for _ in range(50)]
+        self.graphs = [Graph(edges), Graph(edges, directed=True)]
+        self.weights = {edge: rng.randint(1, 9) for edge in edges}
+
+    def test_dense_rows_match_shortest_distance(self):
+        for g in self.graphs:
+            for weights in (None, self.weights):
+                expected = shortest_distance(g, weights=weights)
+                for source, row in iter_distances(g, weights=weights):
+                    self.assertIsInstance(row, np.ndarray)
+                    self.assertEqual(row.tolist(), list(expected[source].values()))
+
+    def test_sparse_rows_skip_unreachable(self):
+        for g in self.graphs:
+            for weights in (None, self.weights):
+                expected = shortest_distance(g, weights=weights)
+                for source, row in iter_distances(g, weights=weights, sparse=True):
+                    reachable = {v: d for v, d in expected[source].items() if d != float('inf')}
+                    self.assertEqual(row, reachable)
+
+    def test_selected_sources(self):
+        g = self.graphs[0]
+        sources = list(g.vertices)[:3]
+        self.assertEqual([s for s, _ in iter_distances(g, sources=sources)], sources)
+
+    def test_compact_graph_order(self):
+        g = CompactGraph([('a', 'b'), ('b', 'c')])
+        rows = dict(iter_distances(g))
+        self.assertEqual(rows['a'].tolist(), [0, 1, 2])
+
+    def test_parallel_rows(self):
+        g = self.graphs[1]
+        serial = [(s, row.tolist()) for s, row in iter_distances(g)]
+        parallel = [(s, row.tolist()) for s, row in iter_distances(g, workers=2)]
+        self.assertEqual(parallel, serial)
+
+    def test_diameter_disconnected(self):
+        g = Graph([(0, 1), (2, 3)])
+        self.assertEqual(diameter(g), (float('inf'), (0, 2)))
+
+    def test_diameter_float_weights(self):
+        g = Graph([(0, 1), (1, 2)])
+        self.assertEqual(diameter(g, {(0, 1): 0.5, (1, 2): 1.25}), (1.75, (0, 2)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import random
+import tempfile
+import unittest
+
+from pygraphnet import (Graph, CompactGraph, LandmarkOracle, shortest_distance, shortest_path, load_graph,
+                        save_graph, profile)
+
+def random_graph(rng, directed, weights):
+    n = rng.randint(2, 30)
+    g = Graph([(rng.randrange(n), rng.randrange(n)) for _ in range(2 * n)], directed=directed)
+    for v in range(n):
+        g.add_vertex(v)
+    if weights == 'int':
+        g.set_weights({edge: rng.randint(1, 9) for edge in g.edges})
+    elif weights == 'float':
+        values = {edge: rng.random() * 5 for edge in g.edges}
+        if not directed:
+            # undirected edges weighing differently from each end
+            values.update({(u, v): rng.random() * 5 for v, u in g.edges})
+        g.set_weights(values)
+    return g
+
+class TestLandmarkOracle(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'oracle.pgn')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertAgrees(self, oracle, g, pairs):
+        for s, t in pairs:
+            expected = shortest_distance(g, s, t)
+            distance = oracle.distance(s, t)
+            self.assertEqual(distance, expected)
+            self.assertIs(type(distance), type(expected))
+            lower, upper = oracle.bounds(s, t)
+            self.assertLessEqual(lower, expected + 1e-9)
+            self.assertGreaterEqual(upper, expected - 1e-9)
+
+            path, edges = oracle.path(s, t)
+            if expected in (0, float('inf')):
+                self.assertEqual((path, edges), shortest_path(g, s, t))
+                continue
+            self.assertEqual((path[0], path[-1]), (s, t))
+            self.assertEqual(edges, list(zip(path, path[1:])))
+            length = sum(g.adj_weights[v][u] if g.adj_weights else 1 for v, u in edges)
+            self.assertAlmostEqual(length, expected)
+
+    def test_agrees_with_searches(self):
+        rng = random.Random(3)
+        for trial in range(24):
+            g = random_graph(rng, trial % 2 == 0, ('int', 'float', None)[trial % 3])
+            oracle = LandmarkOracle(g, rng.randint(1, 4), selection=('farthest', 'random', 'degree')[trial % 3],
+                                    seed=trial)
+            pairs = [(rng.randrange(len(g.vertices)), rng.randrange(len(g.vertices))) for _ in range(20)]
+            self.assertAgrees(oracle, g, pairs)
+
+    def test_bounds(self):
+        g = Graph([('a', 'b'), ('b', 'c'), ('c', 'd')], directed=True)
+        g.set_weights({('a', 'b'): 2, ('b', 'c'): 3, ('c', 'd'): 4})
+        oracle = LandmarkOracle(g, ['d'])
+        # a landmark as target makes both bounds exact
+        self.assertEqual(oracle.bounds('a', 'd'), (9, 9))
+        # no walk through d leads to c
+        self.assertEqual(oracle.bounds('b', 'c'), (3, float('inf')))
+        self.assertEqual(oracle.bounds('d', 'a'), (float('inf'), float('inf')))
+        self.assertEqual(oracle.distance('d', 'a'), float('inf'))
+        self.assertEqual(oracle.path('d', 'a'), ([], []))
+        with profile() as p:
+            self.assertEqual(oracle.distance('a', 'd'), 9)
+            self.assertEqual(oracle.distance('b', 'c'), 3)
+        self.assertEqual(p.counters['landmarks.bound_hits'], 1)
+        self.assertEqual(p.counters['landmarks.searches'], 1)
+
+    def test_weights_argument(self):
+        g = CompactGraph(Graph([(0, 1), (1, 2), (0, 2)]))
+        oracle = LandmarkOracle(g, 2, weights={(0, 2): 5, (2, 0): 5})
+        self.assertEqual(oracle.distance(0, 2), 2)
+        self.assertEqual(oracle.path(0, 2)[0], [0, 1, 2])
+        self.assertEqual(LandmarkOracle(g, 2).distance(0, 2), 1)
+
+    def test_save_and_load(self):
+        rng = random.Random(5)
+        for directed in (False, True):
+            g = random_graph(rng, directed, 'int')
+            oracle = LandmarkOracle(g, 3, seed=1)
+            oracle.save(self.path)
+            for mmap in (True, False):
+                loaded = LandmarkOracle.load(self.path, mmap=mmap)
+                self.assertEqual(loaded.landmarks, oracle.landmarks)
+                self.assertEqual(loaded.nbytes, oracle.nbytes)
+                self.assertAgrees(loaded, g, [(v, u) for v in g.vertices for u in g.vertices])
+            # the file is still a graph file
+            self.assertEqual(set(load_graph(self.path).edges), set(CompactGraph(g).edges))
+
+        save_graph(g, self.path)
+        with self.assertRaises(ValueError):
+            LandmarkOracle.load(self.path)
+
+    def test_string_labels_and_errors(self):
+        g = Graph([('x', 'y'), ('y', 'z')])
+        oracle = LandmarkOracle(g, 5)
+        self.assertEqual(len(oracle.landmarks), 3)
+        self.assertEqual(oracle.distance('x', 'z'), 2)
+        with self.assertRaises(KeyError):
+            oracle.distance('x', 'w')
+        with self.assertRaises(ValueError):
+            LandmarkOracle(g, selection='central')
+
+if __name__ == '__main__':
+    unittest.main()
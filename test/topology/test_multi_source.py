@@ -0,0 +1,50 @@
+import random
+import unittest
+import numpy as np
+from pygraphnet import Graph, CompactGraph, shortest_distance, distance_matrix, multi_source_distance
+
+class TestMultiSource(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(23)
+        edges = [(rng.randrange(50), rng.randrange(50)) for _ in range(80)]
+        self.graphs = [Graph(edges), Graph(edges, directed=True)]
+        self.weights = {edge: rng.randint(1, 9) for edge in edges}
+
+    def test_distance_matrix(self):
+        for g in self.graphs:
+            sources = list(g.vertices)[::3]
+            for weights in (None, self.weights):
+                matrix = distance_matrix(g, sources, weights)
+                self.assertEqual(matrix.shape, (len(sources), len(g.vertices)))
+                for row, source in zip(matrix, sources):
+                    self.assertEqual(row.tolist(), list(shortest_distance(g, source, weights=weights).values()))
+
+    def test_distance_matrix_batches_and_workers(self):
+        g = self.graphs[1]
+        sources = list(g.vertices)
+        expected = distance_matrix(g, sources)
+        np.testing.assert_array_equal(distance_matrix(g, sources, chunksize=7), expected)
+        np.testing.assert_array_equal(distance_matrix(CompactGraph(g), sources), expected)
+        np.testing.assert_array_equal(distance_matrix(g, sources, workers=2), expected)
+
+    def test_multi_source_is_nearest_source(self):
+        for g in self.graphs:
+            sources = list(g.vertices)[:4]
+            for weights in (None, self.weights):
+                rows = [shortest_distance(g, s, weights=weights) for s in sources]
+                distances, predecessors = multi_source_distance(g, sources, weights=weights, pred_map=True)
+                for v in g.vertices:
+                    self.assertEqual(distances[v], min(row[v] for row in rows))
+                    if distances[v] != float('inf'):
+                        # the predecessor chain ends at a source
+                        while predecessors[v] is not None:
+                            v = predecessors[v]
+                        self.assertIn(v, sources)
+
+    def test_multi_source_target(self):
+        g = Graph([(0, 1), (1, 2), (2, 3), (3, 4)])
+        self.assertEqual(multi_source_distance(g, [0, 4], target=2), 2)
+        self.assertEqual(multi_source_distance(g, [0, 4], target=[1, 3]), [1, 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+from unittest import mock
+from pygraphnet import Graph, shortest_distance, diameter, iter_distances
+from pygraphnet.topology import _parallel
+
+class TestParallelShortestDistance(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(90)]
+        self.undirected_graph = Graph(edges, directed=False)
+        self.directed_graph = Graph(edges, directed=True)
+        self.weights = {edge: rng.randint(1, 9) for edge in edges}
+
+    def test_unweighted_matches_serial(self):
+        for g in (self.undirected_graph, self.directed_graph):
+            expected = shortest_distance(g)
+            result = shortest_distance(g, workers=2, chunksize=3)
+            self.assertEqual(result, expected)
+            self.assertEqual(list(result), list(expected))
+
+    def test_weighted_matches_serial(self):
+        for g in (self.undirected_graph, self.directed_graph):
+            expected = shortest_distance(g, weights=self.weights)
+            self.assertEqual(shortest_distance(g, weights=self.weights, workers=2), expected)
+
+    def test_target(self):
+        g = self.directed_graph
+        target = next(iter(g.vertices))
+        self.assertEqual(shortest_distance(g, target=target, workers=2),
+                         shortest_distance(g, target=target))
+
+    def test_diameter(self):
+        g = self.undirected_graph
+        self.assertEqual(diameter(g, self.weights, workers=2), diameter(g, self.weights))
+
+    def test_chunks_in_flight_are_bounded(self):
+        submitted = []
+        submit = _parallel.ProcessPoolExecutor.submit
+        def counting_submit(pool, fn, *args):
+            submitted.append(args)
+            return submit(pool, fn, *args)
+        with mock.patch.object(_parallel.ProcessPoolExecutor, 'submit', counting_submit):
+            rows = iter_distances(self.undirected_graph, workers=2, chunksize=1)
+            next(rows)
+            # two chunks per worker, plus the one refilled before the first row is handed out
+            self.assertEqual(len(submitted), 5)
+            self.assertEqual(len(list(rows)), len(self.undirected_graph.vertices) - 1)
+        self.assertEqual(len(submitted), len(self.undirected_graph.vertices))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from pygraphnet import Graph, CompactGraph, shortest_distance, shortest_path
+
+def path_length(path_edges, weights, directed):
+    total = 0
+    for v, u in path_edges:
+        if (v, u) in weights:
+            total += weights[(v, u)]
+        elif not directed and (u, v) in weights:
+            total += weights[(u, v)]
+        else:
+            total += 1
+    return total
+
+class TestPointToPoint(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(17)
+        self.cases = []
+        for _ in range(6):
+            n = rng.randint(5, 40)
+            edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(2 * n)]
+            weights = {edge: rng.randint(1, 20) for edge in edges}
+            for directed in (False, True):
+                self.cases.append((Graph(edges, directed=directed), weights))
+
+    def test_target_distance_matches_full_search(self):
+        for g, weights in self.cases:
+            for w in (None, weights):
+                full = shortest_distance(g, 0, weights=w)
+                for t in g.vertices:
+                    self.assertEqual(shortest_distance(g, 0, t, weights=w), full[t])
+
+    def test_bidirectional_paths_are_shortest(self):
+        for g, weights in self.cases:
+            for w in (None, weights):
+                full = shortest_distance(g, 0, weights=w)
+                for t in g.vertices:
+                    for graph in (g, CompactGraph(g)):
+                        vertices, edges = shortest_path(graph, 0, t, weights=w, bidirectional=True)
+                        if t == 0 or full[t] == float('inf'):
+                            self.assertEqual((vertices, edges), ([], []))
+                            continue
+                        self.assertEqual(vertices[0], 0)
+                        self.assertEqual(vertices[-1], t)
+                        self.assertTrue(all(e in g.edges or e[::-1] in g.edges and not g.directed for e in edges))
+                        self.assertEqual(path_length(edges, w or {}, g.directed), full[t])
+
+    def test_compact_graph_matches_graph(self):
+        for g, weights in self.cases:
+            compact = CompactGraph(g)
+            for t in g.vertices:
+                self.assertEqual(shortest_path(compact, 0, t), shortest_path(g, 0, t))
+                self.assertEqual(shortest_path(compact, 0, t, weights), shortest_path(g, 0, t, weights))
+
+    def test_long_path(self):
+        g = Graph([(i, i + 1) for i in range(5000)], directed=True)
+        vertices, edges = shortest_path(g, 0, 5000)
+        self.assertEqual(vertices, list(range(5001)))
+        self.assertEqual(len(edges), 5000)
+        self.assertEqual(shortest_path(g, 0, 5000, bidirectional=True), (vertices, edges))
+        self.assertEqual(shortest_path(g, 5000, 0, bidirectional=True), ([], []))
+
+    def test_missing_target(self):
+        with self.assertRaises(KeyError):
+            shortest_distance(Graph([(0, 1)]), 0, 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from pygraphnet import (Graph, CompactGraph, cross_product, shortest_distance,
+                        shortest_path, iter_distances, distance_matrix, multi_source_distance,
+                        diameter, diameter_bounds)
+
+def path_graph(n, directed=False):
+    return Graph([(i, i + 1) for i in range(n - 1)], directed=directed)
+
+def cycle_graph(n, directed=False):
+    return Graph([(i, (i + 1) % n) for i in range(n)], directed=directed)
+
+class TestProductTraversal(unittest.TestCase):
+    def setUp(self):
+        disconnected = Graph([(0, 1)])
+        disconnected.add_vertex(2)
+        self.pairs = [
+            (path_graph(4), path_graph(3)),                # grid
+            (cycle_graph(5), cycle_graph(4)),              # torus
+            (cycle_graph(4, directed=True), path_graph(3)),
+            (path_graph(3), disconnected),
+            (Graph(1), cycle_graph(3)),
+        ]
+
+    def test_distances_match_materialized(self):
+        for g1, g2 in self.pairs:
+            view = cross_product(g1, g2, lazy=True)
+            full = cross_product(g1, g2)
+            self.assertEqual(shortest_distance(view), shortest_distance(full))
+            sources = [(0, 0), (1, 1)] if (1, 1) in view.vertices else [(0, 0)]
+            self.assertEqual(multi_source_distance(view, sources), multi_source_distance(full, sources))
+            for v in view.vertices:
+                self.assertEqual(shortest_distance(view, (0, 0), v), shortest_distance(full, (0, 0), v))
+
+    def test_predecessors_form_shortest_paths(self):
+        for g1, g2 in self.pairs:
+            view = cross_product(g1, g2, lazy=True)
+            distances, predecessors = multi_source_distance(view, [(0, 0)], pred_map=True)
+            for v, p in predecessors.items():
+                if p is None:
+                    self.assertIn(distances[v], (0, float('inf')))
+                else:
+                    self.assertIn(v, view.adj_list[p])
+                    self.assertEqual(distances[p] + 1, distances[v])
+
+    def test_rows_and_matrix(self):
+        for g1, g2 in self.pairs:
+            view = cross_product(g1, g2, lazy=True)
+            full = cross_product(g1, g2)
+            self.assertEqual(dict(iter_distances(view, sparse=True)), dict(iter_distances(full, sparse=True)))
+            matrix = distance_matrix(view, [(0, 0)])
+            expected = shortest_distance(full, (0, 0))
+            self.assertEqual(matrix[0].tolist(), [expected[v] for v in view.vertices])
+
+    def test_diameter(self):
+        for g1, g2 in self.pairs:
+            view = cross_product(g1, g2, lazy=True)
+            full = cross_product(g1, g2)
+            expected = diameter(full)[0]
+            max_distance, end_points = diameter(view)
+            self.assertEqual(max_distance, expected)
+            if expected not in (0, float('inf')):
+                self.assertEqual(shortest_distance(full, *end_points), expected)
+            lower, upper, _ = diameter_bounds(view)
+            if expected != float('inf'):
+                self.assertEqual((lower, upper), (expected, expected))
+
+    def test_weighted_factor_counts_hops(self):
+        g1 = path_graph(3)
+        g1.set_weights({(0, 1): 5})
+        view = cross_product(g1, path_graph(2), lazy=True)
+        self.assertEqual(shortest_distance(view, (0, 0), (2, 1)), 3)
+        self.assertEqual(diameter(view)[0], 3)
+
+    def test_shortest_path(self):
+        view = cross_product(cycle_graph(5), CompactGraph(path_graph(3)), lazy=True)
+        path, edges = shortest_path(view, (0, 0), (2, 2), bidirectional=True)
+        self.assertEqual(len(edges), 4)
+        for edge in edges:
+            self.assertIn(edge, view.edges)
+
+if __name__ == '__main__':
+    unittest.main()
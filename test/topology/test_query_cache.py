@@ -0,0 +1,105 @@
+import pickle
+import unittest
+from pygraphnet import (Graph, CompactGraph, QueryCache, complement, shortest_distance, shortest_path,
+                        diameter, diameter_bounds, distance_matrix, multi_source_distance)
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.g = Graph([(0, 1), (1, 2), (2, 3), (3, 4)])
+        self.cache = QueryCache(maxsize=4)
+        self.cache.attach(self.g)
+
+    def test_version_counter(self):
+        g = Graph()
+        versions = [g.version]
+        for mutate in (lambda: g.add_vertex(0), lambda: g.add_edge(0, 1), lambda: g.del_edge(0, 1),
+                       lambda: g.add_edges_from([(1, 2)]), lambda: g.set_weights({}),
+                       lambda: g.del_vertex(1)):
+            mutate()
+            versions.append(g.version)
+        self.assertEqual(versions, sorted(set(versions)))
+
+        # no-ops leave the version alone
+        version = g.version
+        g.add_vertex(0)
+        g.del_edge(5, 6)
+        g.del_vertex(7)
+        g.add_edges_from([])
+        self.assertEqual(g.version, version)
+
+        g = Graph([(0, 1), (1, 2)])
+        events = []
+        g.subscribe(lambda *args: events.append(args))
+        version = g.version
+        g.add_edges_from([])
+        g.add_edges_from([(1, 2), (0, 1)])
+        self.assertEqual((g.version, events), (version, []))
+
+    def test_repeated_queries_hit(self):
+        first = shortest_distance(self.g, 0)
+        self.assertIs(shortest_distance(self.g, source=0), first)
+        self.assertEqual(diameter(self.g), diameter(self.g))
+        self.assertEqual(shortest_path(self.g, 0, 4), shortest_path(self.g, 0, 4))
+        self.assertEqual(self.cache.stats(), {'hits': 3, 'misses': 3, 'evictions': 0, 'size': 3, 'maxsize': 4})
+
+    def test_mutation_invalidates(self):
+        self.assertEqual(shortest_distance(self.g, 0, 4), 4)
+        self.g.add_edge(0, 4)
+        self.assertEqual(shortest_distance(self.g, 0, 4), 1)
+        self.g.set_weights({(0, 4): 10})
+        self.assertEqual(shortest_distance(self.g, 0, 4), 4)
+        self.assertEqual(self.cache.stats()['hits'], 0)
+
+    def test_weights_by_identity(self):
+        weights = {(0, 1): 5}
+        self.assertEqual(shortest_distance(self.g, 0, 1, weights=weights), 5)
+        self.assertEqual(shortest_distance(self.g, 0, 1, weights=weights), 5)
+        self.assertEqual(shortest_distance(self.g, 0, 1, weights={(0, 1): 7}), 7)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_eviction(self):
+        for source in range(5):
+            shortest_distance(self.g, source)
+        stats = self.cache.stats()
+        self.assertEqual((stats['size'], stats['evictions']), (4, 1))
+        shortest_distance(self.g, 0)
+        self.assertEqual(self.cache.stats()['misses'], 6)
+        shortest_distance(self.g, 4)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['size'], 0)
+
+    def test_uncacheable_arguments(self):
+        sources = iter([0, 4])
+        self.assertEqual(multi_source_distance(self.g, sources, target=2), 2)
+        self.assertEqual(distance_matrix(self.g, {0}).tolist(), [[0, 1, 2, 3, 4]])
+        self.assertEqual(self.cache.stats()['misses'], 0)
+        self.assertEqual(multi_source_distance(self.g, [0, 4], target=[2, 3]), [2, 1])
+        self.assertEqual(multi_source_distance(self.g, [0, 4], target=[2, 3]), [2, 1])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_nested_calls_not_cached(self):
+        diameter(self.g)
+        diameter_bounds(self.g)
+        self.assertEqual(self.cache.stats()['size'], 2)
+
+    def test_views_and_compact(self):
+        compact = self.cache.attach(CompactGraph(self.g))
+        self.assertIs(shortest_distance(compact, 0), shortest_distance(compact, 0))
+        view = self.cache.attach(complement(self.g, lazy=True))
+        before = shortest_distance(view, 0)
+        self.g.del_edge(0, 1)
+        self.assertIsNot(shortest_distance(view, 0), before)
+
+    def test_pickles_empty(self):
+        shortest_distance(self.g, 0)
+        copy = pickle.loads(pickle.dumps(self.g))
+        self.assertEqual(copy.query_cache.stats()['size'], 0)
+        self.assertEqual(copy.query_cache.maxsize, 4)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            QueryCache(0)
+
+if __name__ == '__main__':
+    unittest.main()
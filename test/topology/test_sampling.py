@@ -0,0 +1,106 @@
+import math
+import time
+import unittest
+
+from pygraphnet import (Graph, CompactGraph, shortest_distance, average_path_length, eccentricity_distribution,
+                        closeness)
+
+def all_pairs(g, weights=None):
+    # unreachable vertices are left out rather than reported at inf
+    return {v: {u: d for u, d in shortest_distance(g, v, weights=weights).items() if d != math.inf}
+            for v in g.vertices}
+
+def exact_statistics(g, weights=None):
+    distances = all_pairs(g, weights)
+    n = len(g.vertices)
+    pairs = [d for v, row in distances.items() for u, d in row.items() if u != v]
+    eccentricities = [max(row.values()) if len(row) == n else math.inf for row in distances.values()]
+    incoming = {v: [row[v] for u, row in distances.items() if u != v and v in row] for v in g.vertices}
+    centrality = {v: (len(d) / (n - 1)) * (len(d) / sum(d)) if d and sum(d) else 0.0 for v, d in incoming.items()}
+    return sum(pairs) / len(pairs), eccentricities, centrality
+
+def lollipop():
+    # a clique with a long tail: skewed degrees and eccentricities
+    edges = [(i, j) for i in range(12) for j in range(i + 1, 12)]
+    edges += [(i, i + 1) for i in range(11, 60)]
+    return Graph(edges)
+
+class TestSampledStatistics(unittest.TestCase):
+    def test_census_is_exact(self):
+        for g in (lollipop(), Graph([(0, 1), (1, 2), (2, 0), (2, 3), (4, 3)], directed=True)):
+            average, eccentricities, centrality = exact_statistics(g)
+            estimate = average_path_length(g, samples=None)
+            self.assertAlmostEqual(estimate.value, average)
+            self.assertEqual(estimate.low, estimate.high)
+            self.assertEqual(estimate.samples, len(g.vertices))
+
+            mean, shares = eccentricity_distribution(CompactGraph(g), samples=None, strata=3)
+            expected = sum(eccentricities) / len(eccentricities)
+            self.assertEqual(mean.value, expected)
+            for value, share in shares.items():
+                self.assertAlmostEqual(share.value, eccentricities.count(value) / len(eccentricities))
+                self.assertAlmostEqual(share.low, share.high)
+
+            for v, estimate in closeness(g, samples=None).items():
+                self.assertAlmostEqual(estimate.value, centrality[v])
+                self.assertAlmostEqual(estimate.low, estimate.high)
+
+    def test_intervals_cover_the_truth(self):
+        g = lollipop()
+        average, eccentricities, centrality = exact_statistics(g)
+        for strata in (1, 3):
+            estimate = average_path_length(g, samples=30, strata=strata, seed=5)
+            self.assertEqual(estimate.samples, 30)
+            self.assertLessEqual(estimate.low, average)
+            self.assertLessEqual(average, estimate.high)
+            self.assertLess(estimate.low, estimate.high)
+
+            mean, _ = eccentricity_distribution(g, samples=30, strata=strata, seed=5)
+            expected = sum(eccentricities) / len(eccentricities)
+            self.assertLessEqual(mean.low, expected)
+            self.assertLessEqual(expected, mean.high)
+
+        estimates = closeness(g, samples=40, seed=1)
+        covered = sum(e.low <= centrality[v] <= e.high for v, e in estimates.items())
+        self.assertGreaterEqual(covered, 0.8 * len(g.vertices))
+
+    def test_seed_reproducible(self):
+        g = lollipop()
+        self.assertEqual(average_path_length(g, samples=10, seed=3), average_path_length(g, samples=10, seed=3))
+
+    def test_weighted(self):
+        g = Graph([('a', 'b'), ('b', 'c'), ('a', 'c'), ('c', 'd')])
+        weights = {('a', 'b'): 1, ('b', 'c'): 1, ('a', 'c'): 5, ('c', 'd'): 3}
+        weights.update({(u, v): w for (v, u), w in list(weights.items())})
+        average, _, _ = exact_statistics(g, weights)
+        self.assertAlmostEqual(average_path_length(g, samples=None, weights=weights).value, average)
+
+    def test_time_budget_and_minimum_samples(self):
+        g = lollipop()
+        start = time.perf_counter()
+        estimate = average_path_length(g, samples=None, time_budget=0, strata=4, seed=0)
+        self.assertLess(time.perf_counter() - start, 5)
+        # two sources per stratum are always drawn
+        self.assertEqual(estimate.samples, 8)
+        self.assertEqual(average_path_length(g, samples=1, strata=2, seed=0).samples, 4)
+
+    def test_edge_cases(self):
+        self.assertTrue(math.isnan(average_path_length(Graph()).value))
+        self.assertEqual(closeness(Graph()), {})
+        isolated = Graph()
+        isolated.add_vertex('a')
+        isolated.add_vertex('b')
+        self.assertTrue(math.isnan(average_path_length(isolated, samples=None).value))
+        mean, shares = eccentricity_distribution(isolated, samples=None)
+        self.assertEqual(mean.value, math.inf)
+        self.assertEqual(list(shares), [math.inf])
+        self.assertEqual(closeness(isolated, samples=None)['a'].value, 0)
+        with self.assertRaises(ValueError):
+            average_path_length(lollipop(), confidence=1)
+        with self.assertRaises(ValueError):
+            closeness(lollipop(), samples=0)
+        with self.assertRaises(ValueError):
+            closeness(lollipop(), strata=0)
+
+if __name__ == '__main__':
+    unittest.main()